@@ -51,8 +51,40 @@ api.interceptors.request.use(
     }
 );
 
-export const getStatistiques = async () => {
-    const response = await api.get('/statistiques/');
+// Parcourt toutes les pages d'une liste paginée par curseur ({ next, results })
+// Les listes non paginées (tableau simple) sont renvoyées telles quelles
+export const getAllPages = async <T = any>(url: string): Promise<T[]> => {
+    const items: T[] = [];
+    let nextUrl: string | null = url;
+    while (nextUrl) {
+        const response: { data: any } = await api.get(nextUrl);
+        if (Array.isArray(response.data)) {
+            return response.data;
+        }
+        items.push(...response.data.results);
+        nextUrl = response.data.next;
+    }
+    return items;
+};
+
+// Une page de /statistiques/ : filtre, tri et pagination sont faits par le serveur
+export interface PageStatistiques<T = any> {
+    count: number;
+    next: string | null;
+    previous: string | null;
+    results: T[];
+}
+
+export const getStatistiques = async <T = any>(
+    params: { role?: string; role__in?: string; ordering?: string } = {}
+): Promise<PageStatistiques<T>> => {
+    const response = await api.get('/statistiques/', { params });
+    return response.data;
+};
+
+// Page voisine d'une liste paginée, à partir du lien next / previous renvoyé par le serveur
+export const getPage = async <T = any>(url: string): Promise<T> => {
+    const response = await api.get(url);
     return response.data;
 };
 
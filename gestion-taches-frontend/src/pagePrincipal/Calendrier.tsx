@@ -14,16 +14,15 @@ const localizer = momentLocalizer(moment);
 interface Tache {
     id: number;
     titre: string;
-    description: string;
+    description?: string;
     statut: string;
     date_limite: string;
     projet: number;
+    projet_nom: string;
     projet_detail?: {
         id: number;
         nom: string;
-        description: string;
     };
-    assigne_a?: number[];
     assigne_a_detail?: { id: number; username: string }[];
 }
 
@@ -35,75 +34,45 @@ interface CalendarEvent {
     resource: Tache;
 }
 
+// Fenêtre à charger : la grille du mois affiché (semaines débordantes comprises),
+// prolongée pour la vue agenda qui montre les 30 jours suivant la date courante
+const getFenetre = (date: Date) => {
+    const start = moment(date).startOf('month').startOf('week');
+    const end = moment.max(moment(date).endOf('month').endOf('week'), moment(date).add(30, 'days'));
+    return { start: start.format('YYYY-MM-DD'), end: end.format('YYYY-MM-DD') };
+};
+
 const Calendrier: React.FC = () => {
     const [events, setEvents] = useState<CalendarEvent[]>([]);
     const [loading, setLoading] = useState<boolean>(true);
     const [selectedEvent, setSelectedEvent] = useState<Tache | null>(null);
     const [userId, setUserId] = useState<number | null>(null);
-    const [projets, setProjets] = useState<{[key: number]: {id: number, nom: string, description: string}}>({}); 
     const [view, setView] = useState('month');
     const [date, setDate] = useState(new Date());
     const [filter, setFilter] = useState('TOUS');
+    const fenetre = getFenetre(date);
 
     // Fonction pour charger les données
     const loadData = () => {
         setLoading(true);
-        
-        // 1. Récupérer tous les projets
-        api.get('/projets/')
-            .then((projetResponse: { data: { id: string | number; nom: any; description: any; }[]; }) => {
-                const projetsMap: { [key: number]: { id: number; nom: string; description: string } } = {};
-                projetResponse.data.forEach((projet: { id: string | number; nom: any; description: any; }) => {
-                    projetsMap[Number(projet.id)] = {
-                        id: Number(projet.id),
-                        nom: projet.nom,
-                        description: projet.description
-                    };
-                });
-                setProjets(projetsMap);
-                
-                // 2. Récupérer les tâches
-                return api.get('/taches/');
-            })
-            .then((tacheResponse: { data: any; }) => {
-                console.log("✅ Tâches récupérées:", tacheResponse.data);
-                const taches = tacheResponse.data;
-                
-                // Filtrer les tâches pertinentes pour l'utilisateur
-                const userTaches = taches.filter((tache: Tache) => {
-                    // Vérifier si l'utilisateur est assigné à cette tâche
-                    const isAssigned = tache.assigne_a_detail 
-                        ? tache.assigne_a_detail.some((user: any) => user.id === userId)
-                        : Array.isArray(tache.assigne_a)
-                            ? userId !== null && tache.assigne_a.includes(userId)
-                            : false;
-                    
-                    // Appliquer le filtre de statut
-                    if (filter !== 'TOUS' && tache.statut !== filter) {
-                        return false;
-                    }
-                    
-                    return isAssigned;
-                });
-                
-                // Ajouter les informations du projet à chaque tâche
-                userTaches.forEach((tache: { projet: string | number; projet_detail: { id: number; nom: string; description: string; }; }) => {
-                    if (projets[Number(tache.projet)]) {
-                        tache.projet_detail = projets[Number(tache.projet)];
-                    }
-                });
-                
-                console.log("✅ Tâches filtrées pour l'utilisateur:", userTaches);
-                
+
+        // Seules les tâches de l'utilisateur dans la fenêtre affichée, filtrées côté serveur
+        const params: { start: string; end: string; statut?: string } = { ...fenetre };
+        if (filter !== 'TOUS') {
+            params.statut = filter;
+        }
+
+        api.get<Tache[]>('/calendrier/', { params })
+            .then(({ data: taches }) => {
                 // Transformer les tâches en événements de calendrier
-                const calendarEvents = userTaches.map((tache: Tache) => {
+                const calendarEvents = taches.map((tache: Tache) => {
                     const date = new Date(tache.date_limite);
                     return {
                         id: tache.id,
                         title: tache.titre,
                         start: date,
                         end: new Date(date.getTime() + 60 * 60 * 1000), // Ajoute 1 heure pour la durée
-                        resource: tache
+                        resource: { ...tache, projet_detail: { id: tache.projet, nom: tache.projet_nom } }
                     };
                 });
 
@@ -127,12 +96,12 @@ const Calendrier: React.FC = () => {
         setUserId(id);
     }, []);
 
-    // Charger les données lorsque l'ID utilisateur ou le filtre change
+    // Charger les données lorsque l'utilisateur, le filtre ou la fenêtre affichée change
     useEffect(() => {
         if (userId) {
             loadData();
         }
-    }, [userId, filter]);
+    }, [userId, filter, fenetre.start, fenetre.end]);
 
     const getEventStyle = (event: any) => {
         const tache = event.resource;
@@ -191,6 +160,14 @@ const Calendrier: React.FC = () => {
 
     const handleSelectEvent = (event: CalendarEvent) => {
         setSelectedEvent(event.resource);
+        // Description et personnes assignées ne sont chargées qu'à l'ouverture du détail
+        api.get(`/taches/${event.resource.id}/`, { params: { fields: 'description,assigne_a_detail' } })
+            .then(({ data }) => {
+                setSelectedEvent(current => current && current.id === event.resource.id
+                    ? { ...current, ...data }
+                    : current);
+            })
+            .catch((error) => console.error('Erreur lors du chargement de la tâche:', error));
     };
 
     const getTacheStatutLabel = (statut: string) => {
@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import { getStatistiques } from '../axiosConfig';
+import { getPage, getStatistiques, PageStatistiques } from '../axiosConfig';
 import { User } from '../types';
 import { useAuth } from '../hooks/useAuth';
 import {
@@ -17,12 +17,17 @@ import {
   LineChart,
   Line,
 } from 'recharts';
-import { ArrowDown, ArrowUp, Filter, Users, CheckCircle, Award, Clock } from 'lucide-react';
+import { ArrowDown, ArrowUp, Filter, Users, CheckCircle, Award, Clock, ChevronLeft, ChevronRight } from 'lucide-react';
 
 const COLORS = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#8b5cf6', '#ec4899'];
+// Rôles affichés (les administrateurs sont exclus des statistiques)
+const ROLES = ['enseignant', 'etudiant'];
+// Champ de tri de l'API pour chaque option du sélecteur
+const TRI_API: Record<string, string> = { utilisateur: 'username' };
 
 const Statistiques: React.FC = () => {
-  const [users, setUsers] = useState<User[]>([]);
+  const [page, setPage] = useState<PageStatistiques<User> | null>(null);
+  const [numeroPage, setNumeroPage] = useState<number>(1);
   const [loading, setLoading] = useState<boolean>(true);
   const [error, setError] = useState<string | null>(null);
   const [filterRole, setFilterRole] = useState<string>('');
@@ -31,51 +36,57 @@ const Statistiques: React.FC = () => {
   const [activeTab, setActiveTab] = useState<string>('overview');
   const { isAuthenticated, user } = useAuth();
 
-  useEffect(() => {
-    const fetchData = async () => {
-      try {
-        setLoading(true);
-        const data = await getStatistiques();
-        // Filtrer les admins dans les données récupérées
-        const filteredData = data.filter(user => user.role !== 'admin');
-        setUsers(filteredData);
-        setError(null);
-      } catch (err) {
-        setError('Erreur lors du chargement des statistiques');
-        console.error(err);
-      } finally {
-        setLoading(false);
-      }
-    };
+  // Une page à la fois : filtre et tri par le serveur, pages suivantes à la demande
+  const chargerPage = async (charger: () => Promise<PageStatistiques<User>>, numero: number) => {
+    try {
+      setLoading(true);
+      setPage(await charger());
+      setNumeroPage(numero);
+      setError(null);
+    } catch (err) {
+      setError('Erreur lors du chargement des statistiques');
+      console.error(err);
+    } finally {
+      setLoading(false);
+    }
+  };
 
+  useEffect(() => {
     if (isAuthenticated) {
-      fetchData();
+      const champ = TRI_API[sortBy] ?? sortBy;
+      // id en second critère : ordre stable d'une page à l'autre
+      const ordering = `${sortOrder === 'desc' ? '-' : ''}${champ},id`;
+      const filtre = filterRole ? { role: filterRole } : { role__in: ROLES.join(',') };
+      chargerPage(() => getStatistiques<User>({ ...filtre, ordering }), 1);
     }
-  }, [isAuthenticated]);
+  }, [isAuthenticated, filterRole, sortBy, sortOrder]);
 
-  const filteredUsers = users
-    .filter(user => filterRole ? user.role === filterRole : true)
-    .sort((a, b) => {
-      const aValue = a[sortBy as keyof User];
-      const bValue = b[sortBy as keyof User];
-      
-      if (typeof aValue === 'number' && typeof bValue === 'number') {
-        return sortOrder === 'desc' ? bValue - aValue : aValue - bValue;
-      }
-      
-      if (typeof aValue === 'string' && typeof bValue === 'string') {
-        return sortOrder === 'desc' 
-          ? bValue.localeCompare(aValue) 
-          : aValue.localeCompare(bValue);
-      }
-      
-      return 0;
-    });
+  const users = page?.results ?? [];
+  const filteredUsers = users;
+  const roles = ROLES;
 
-  const roles = [...new Set(users.map(user => user.role))];
+  const pagination = page && (page.previous || page.next) && (
+    <div className="flex items-center justify-end gap-3 mb-6 text-gray-600 text-sm">
+      <span>Page {numeroPage} ({page.count} utilisateurs)</span>
+      <button
+        className="flex items-center bg-white hover:bg-gray-50 disabled:opacity-50 px-3 py-1 border rounded-lg"
+        disabled={!page.previous || loading}
+        onClick={() => page.previous && chargerPage(() => getPage(page.previous!), numeroPage - 1)}
+      >
+        <ChevronLeft size={16} className="mr-1" /> Précédente
+      </button>
+      <button
+        className="flex items-center bg-white hover:bg-gray-50 disabled:opacity-50 px-3 py-1 border rounded-lg"
+        disabled={!page.next || loading}
+        onClick={() => page.next && chargerPage(() => getPage(page.next!), numeroPage + 1)}
+      >
+        Suivante <ChevronRight size={16} className="ml-1" />
+      </button>
+    </div>
+  );
   
   // Données pour le graphique de performance par rôle
-  const performanceByRole = roles.map(role => {
+  const performanceByRole = [...new Set(users.map(user => user.role))].map(role => {
     const usersWithRole = users.filter(u => u.role === role);
     const averageCompletion = usersWithRole.reduce((acc, user) => acc + user.taux_completion, 0) / usersWithRole.length;
     
@@ -119,9 +130,9 @@ const Statistiques: React.FC = () => {
     rôle: user.role
   }));
 
-  // Statistiques globales (sans les admins)
+  // Utilisateurs : total du serveur ; autres chiffres et graphiques : page affichée
   const globalStats = {
-    totalUsers: users.length,
+    totalUsers: page?.count ?? 0,
     totalTasks: users.reduce((acc, user) => acc + user.taches_totales, 0),
     completedTasks: users.reduce((acc, user) => acc + user.taches_terminees, 0),
     averageCompletion: Math.round(users.reduce((acc, user) => acc + user.taux_completion, 0) / (users.length || 1)) || 0
@@ -180,6 +191,8 @@ const Statistiques: React.FC = () => {
           </div>
         ) : (
           <>
+            {pagination}
+
             {/* Contenu de l'onglet Vue d'ensemble */}
             {activeTab === 'overview' && (
               <>
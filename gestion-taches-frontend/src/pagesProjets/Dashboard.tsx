@@ -4,30 +4,16 @@ import { PieChart, Calendar, Users, CheckSquare, Award, BarChart2 } from "lucide
 import api from "../axiosConfig";
 import { Link, useNavigate } from "react-router-dom";
 
-// Interface pour les projets
-interface Projet {
+// Résumé d'un projet renvoyé par /api/dashboard/
+interface ProjetResume {
     id: number;
     nom: string;
-    description: string;
-    date_creation: string;
-    date_fin: string;
     etat: string;
-    proprietaire: {
-        id: number;
-        username: string;
-    };
-    membres: number[];
-}
-
-// Interface pour les tâches
-interface Tache {
-    id: number;
-    titre: string;
-    description: string;
-    date_limite: string;
-    statut: string;
-    projet: number;
-    assigne_a: number[];
+    date_fin: string;
+    taches_total: number;
+    taches_terminees: number;
+    progression: number;
+    membres: number;
 }
 
 // Interface pour les statistiques
@@ -41,6 +27,15 @@ interface UserStat {
     badge: string;
 }
 
+// Réponse de /api/dashboard/
+interface DashboardData {
+    nombre_projets: number;
+    projets: ProjetResume[];
+    taches: { a_faire: number; en_cours: number; termine: number; total: number };
+    echeances: { id: number; titre: string; statut: string; date_limite: string; projet: number; projet_nom: string }[];
+    statistique: UserStat | null;
+}
+
 const Dashboard = () => {
     const { logout, user } = useAuth();
     const navigate = useNavigate();
@@ -76,119 +71,35 @@ useEffect(() => {
     const fetchData = async () => {
         setLoading(true);
         try {
-            // Récupérer les projets
-            const projectsResponse = await api.get('/projets/');
-            const projects: Projet[] = projectsResponse.data;
+            // Un seul appel agrégé au lieu de télécharger projets, tâches et statistiques
+            const { data } = await api.get<DashboardData>('/dashboard/');
 
-            const tasksResponse = await api.get('/taches/');
-            const allTasks: Tache[] = tasksResponse.data;
+            setStats({
+                totalProjects: data.nombre_projets,
+                totalTasks: data.statistique?.taches_totales ?? data.taches.total,
+                completedTasks: data.statistique?.taches_terminees ?? data.taches.termine,
+                pendingTasks: data.taches.a_faire + data.taches.en_cours,
+                teamMembers: data.nombre_projets
+            });
 
-            // Récupérer les statistiques utilisateur en premier
-            try {
-                const statsResponse = await api.get('/statistiques/');
-                const userStat = statsResponse.data.find(
-                    (stat: UserStat) => stat.utilisateur === user?.username
-                );
-                
-                if (userStat) {
-                    setUserPerformance({
-                        taux_completion: userStat.taux_completion,
-                        prime: userStat.prime,
-                        badge: userStat.badge
-                    });
-                    
-                    setStats(prevStats => ({
-                        ...prevStats,
-                        totalTasks: userStat.taches_totales,
-                        completedTasks: userStat.taches_terminees,
-                        pendingTasks: userStat.taches_totales - userStat.taches_terminees
-                    }));
-                } else {
-                    throw new Error("Statistiques utilisateur non trouvées");
-                }
-            } catch (error) {
-                console.error("Erreur lors de la récupération des statistiques :", error);
-                
-                // a c'est le  un calcul de secours si l'api ne marche pas 
-                // Mais seulement pour les tâches de l'utilisateur
-                
-                // Filtrer pour n'obtenir que les tâches assignées à l'utilisateur actuel
-                const userTasks = allTasks.filter(task => 
-                    Array.isArray(task.assigne_a) && 
-                    user?.id !== undefined && task.assigne_a.includes(user.id)
-                );
-                
-                const completedUserTasks = userTasks.filter(task => task.statut === 'TERMINE').length;
-                const taux_completion = userTasks.length > 0 
-                    ? Math.round((completedUserTasks / userTasks.length) * 100)
-                    : 0;
-                
-                // Déterminer le badge en fonction du taux de complétion
-                let badge = "En progrès";
-                if (taux_completion >= 100) badge = "Top Performer";
-                else if (taux_completion >= 90) badge = "Très bon";
-                else if (taux_completion >= 70) badge = "Bon";
-                
-                // Déterminer la prime (seulement pour les enseignants)
-                let prime = "0$";
-                if (user?.role === "enseignant") {
-                    if (taux_completion === 100) prime = "100000$";
-                    else if (taux_completion >= 90) prime = "30000$";
-                } else {
-                    prime = "Non concerné";
-                }
-                
-                // Mettre à jour les deux états avec les mêmes données
+            if (data.statistique) {
                 setUserPerformance({
-                    taux_completion: taux_completion,
-                    prime: prime,
-                    badge: badge
+                    taux_completion: data.statistique.taux_completion,
+                    prime: data.statistique.prime,
+                    badge: data.statistique.badge
                 });
-                
-                setStats(prevStats => ({
-                    ...prevStats,
-                    totalTasks: userTasks.length,
-                    completedTasks: completedUserTasks,
-                    pendingTasks: userTasks.length - completedUserTasks
-                }));
             }
-            
-            // Mettre à jour le nombre de projets
-            setStats(prevStats => ({
-                ...prevStats,
-                totalProjects: projects.length,
-                teamMembers: projects.length
-            }));
-
-            // Filtrer les projets auxquels l'utilisateur participe ou dont il est propriétaire
-            const userProjects = projects.filter(project =>
-                project.proprietaire.username === user?.username ||
-                user?.id !== undefined && project.membres.includes(user.id)
-            );
-
-            // Préparer les projets récents
-            const formattedProjects = userProjects
-                .slice(0, 5) // Limiter aux 5 projets les plus récents
-                .map(project => {
-                    // Calculer la progression du projet
-                    const projectTasks = allTasks.filter(task => task.projet === project.id);
-                    const projectCompletedTasks = projectTasks.filter(task => task.statut === 'TERMINE').length;
-                    const progress = projectTasks.length > 0
-                        ? Math.round((projectCompletedTasks / projectTasks.length) * 100)
-                        : 0;
-
-                    return {
-                        id: project.id,
-                        nom: project.nom,
-                        progression: progress,
-                        dateEcheance: project.date_fin
-                            ? new Date(project.date_fin).toLocaleDateString('fr-FR')
-                            : 'Non définie',
-                        membres: Array.isArray(project.membres) ? project.membres.length : 0
-                    };
-                });
 
-            setRecentProjects(formattedProjects);
+            // Projets les plus récents de l'utilisateur, progression calculée par le serveur
+            setRecentProjects(data.projets.map(project => ({
+                id: project.id,
+                nom: project.nom,
+                progression: project.progression,
+                dateEcheance: project.date_fin
+                    ? new Date(project.date_fin).toLocaleDateString('fr-FR')
+                    : 'Non définie',
+                membres: project.membres
+            })));
             setLoading(false);
 
         } catch (error) {
@@ -8,6 +8,9 @@ interface Projet {
     etat: string;
     date_fin?: string;
     membres?: { id: number; username: string }[];
+    taches_total?: number;
+    taches_terminees?: number;
+    progression?: number;
 }
 
 interface ProjetCardProps {
@@ -108,6 +111,24 @@ const ProjetCard = ({ projet, onDelete }: ProjetCardProps) => {
                         </div>
                     )}
                     
+                    {/* Progression des tâches (compteurs fournis par l'API) */}
+                    {projet.progression !== undefined && (
+                        <div>
+                            <div className="flex justify-between mb-1 text-gray-500 text-sm">
+                                <span>Progression:</span>
+                                <span className="text-gray-700">
+                                    {projet.taches_terminees ?? 0}/{projet.taches_total ?? 0} ({projet.progression}%)
+                                </span>
+                            </div>
+                            <div className="bg-gray-200 rounded-full w-full h-2">
+                                <div
+                                    className="bg-emerald-500 rounded-full h-2"
+                                    style={{ width: `${projet.progression}%` }}
+                                />
+                            </div>
+                        </div>
+                    )}
+
                     {/* Statut du projet */}
                     <div className="flex items-center">
                         <Clock size={16} className="mr-2 text-gray-400" />
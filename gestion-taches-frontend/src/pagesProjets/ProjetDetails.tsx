@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import { useParams, Link, useNavigate } from "react-router-dom";
-import api, { getUserId } from "../axiosConfig";
+import api, { getAllPages, getUserId } from "../axiosConfig";
 import {
     Loader, Edit, Trash2, Plus, AlertTriangle, CheckCircle,
     Clock, Calendar, List, User, Users, Info
@@ -99,59 +99,25 @@ const ProjetDetails = () => {
         setUserId(Number(getUserId()));
         setLoading(true);
 
-        api.get(`/projets/${id}/`)
-            .then(response => {
-                console.log("✅ Détails du projet :", response.data);
-                setProjet(response.data);
-
-                return api.get(`/taches/?projet=${id}`);
-            })
-            .then(response => {
-                console.log("✅ Tâches du projet :", response.data);
-                setTaches(response.data);
-
-                // Appel à l'API de statistiques
-                return api.get(`/tache-stats/?projet=${id}`);
-            })
-            .then(response => {
-                console.log("✅ Statistiques des tâches :", response.data);
-                setTacheStats(response.data);
-
-                return api.get(`/users/`);
-            })
-            .then(response => {
-                console.log("✅ Liste des utilisateurs :", response.data);
-
-                const userRole = userId
-                    ? response.data.find((u: { id: number; username: string; role: string }) => u.id === userId)?.role
-                    : undefined;
-
-                console.log("✅ Rôle utilisateur :", userRole);
-
-                let filteredUsers = [];
-                if (userRole) {
-                    if (userRole === "etudiant") {
-                        filteredUsers = response.data.filter(
-                            (u: { id: number; username: string; role: string }) => u.role === "etudiant"
-                        );
-                    } else if (userRole === "enseignant") {
-                        filteredUsers = response.data.filter(
-                            (u: { id: number; username: string; role: string }) => u.role === "etudiant" || u.role === "enseignant"
-                        );
-                    }
-                } else {
-                    filteredUsers = response.data;
-                }
-
-                console.log("✅ Utilisateurs filtrés :", filteredUsers);
-                setUtilisateurs(filteredUsers);
+        // Projet, première page des tâches, statistiques et utilisateurs assignables en un seul appel
+        api.get(`/projets/${id}/overview/`)
+            .then(async response => {
+                const { projet, taches, stats, utilisateurs } = response.data;
+                console.log("✅ Vue d'ensemble du projet :", response.data);
+                setProjet(projet);
+                setTacheStats(stats);
+                setUtilisateurs(utilisateurs);
+
+                // Les pages suivantes éventuelles viennent de /projets/<id>/taches/
+                const suite = taches.next ? await getAllPages<Tache>(taches.next) : [];
+                setTaches([...taches.results, ...suite]);
                 setLoading(false);
             })
             .catch(error => {
                 console.error("Erreur de chargement :", error);
                 setLoading(false);
             });
-    }, [id, userId]);
+    }, [id]);
 
     const getEtatLabel = (etat: string) => {
         switch (etat) {
@@ -2,6 +2,7 @@
 ASGI config for Gestion_des_taches_collaboratives project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The Server-Sent Events stream /api/evenements/ is only served through this entry point.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
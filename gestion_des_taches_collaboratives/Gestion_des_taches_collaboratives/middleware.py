@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+
+def est_api(request):
+    """Chemin servi par l'API (authentification JWT, ni sessions ni messages)"""
+    return request.path_info.startswith(tuple(settings.API_PREFIXES))
+
+
+class HorsApiMixin:
+    """
+    Middleware de Django ignoré pour les chemins de API_PREFIXES : l'admin, allauth et
+    les pages rendues par le serveur gardent la pile complète.
+    """
+
+    def __call__(self, request):
+        if est_api(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class SessionHorsApiMiddleware(HorsApiMixin, SessionMiddleware):
+    pass
+
+
+class CsrfHorsApiMiddleware(HorsApiMixin, CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if est_api(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationHorsApiMiddleware(HorsApiMixin, AuthenticationMiddleware):
+    pass
+
+
+class MessageHorsApiMiddleware(HorsApiMixin, MessageMiddleware):
+    pass
+
+
+class XFrameOptionsHorsApiMiddleware(HorsApiMixin, XFrameOptionsMiddleware):
+    pass
+
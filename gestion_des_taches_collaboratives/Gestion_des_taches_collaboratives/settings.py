@@ -56,16 +56,23 @@ INSTALLED_APPS = [
 'drf_yasg',
 ]
 
+# Sessions, CSRF, authentification par session, messages et X-Frame-Options ne servent
+# qu'aux pages rendues par le serveur, à l'admin et à allauth : leurs variantes HorsApi
+# (voir Gestion_des_taches_collaboratives/middleware.py) ne s'exécutent pas pour API_PREFIXES.
+# AccountMiddleware doit figurer tel quel pour allauth ; il ne fait qu'ouvrir un contexte.
+API_PREFIXES = ('/api/',)
 MIDDLEWARE = [
 'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'Gestion_des_taches_collaboratives.middleware.SessionHorsApiMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'Gestion_des_taches_collaboratives.middleware.CsrfHorsApiMiddleware',
+    'Gestion_des_taches_collaboratives.middleware.AuthenticationHorsApiMiddleware',
+    'Gestion_des_taches_collaboratives.middleware.MessageHorsApiMiddleware',
+    'Gestion_des_taches_collaboratives.middleware.XFrameOptionsHorsApiMiddleware',
     'allauth.account.middleware.AccountMiddleware',
+    'tasks.repliques.EcrituresRecentesMiddleware',
+    'tasks.identite.CarteIdentiteMiddleware',
 ]
 
 ROOT_URLCONF = 'Gestion_des_taches_collaboratives.urls'
@@ -103,6 +110,7 @@ WSGI_APPLICATION = 'Gestion_des_taches_collaboratives.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.mysql',
+        # Écritures seulement pour les vues de l'API : lectures en autocommit (tasks/transactions.py)
         'ATOMIC_REQUESTS' : True,
         'NAME': 'gestion_taches_collaboratives',
         'USER': 'root',
@@ -116,6 +124,16 @@ DATABASES = {
 
     }
 }
+
+# Répliques en lecture (voir tasks/repliques.py) : alias de DATABASES ajoutés à côté de
+# 'default', sans ATOMIC_REQUESTS, avec 'TEST': {'MIRROR': 'default'} pour les tests.
+# Exige CACHE_PARTAGE : un utilisateur qui vient d'écrire doit relire sur la base principale
+# quel que soit le worker qui le sert. Sans lui, toutes les lectures vont à 'default'.
+DATABASES_REPLIQUES = []
+DATABASE_ROUTERS = ['tasks.repliques.RouteurRepliques']
+# Retard de réplication maximal supposé, en secondes : après une écriture, l'utilisateur
+# relit sur la base principale et les réponses lues sur une réplique ne sont pas mises en cache
+REPLIQUES_RETARD_MAX = 5
 SITE_ID = 1
 
 
@@ -199,13 +217,95 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.JWTAuthentificationLegere",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
 }
 
+# Authentification JWT (voir users/authentication.py) : utilisateurs complets gardés
+# en mémoire par processus pour les écritures, nombre maximal et durée de validité en secondes
+AUTH_CACHE_UTILISATEURS_MAX = 1000
+AUTH_CACHE_UTILISATEURS_DUREE = 60
+# Jetons d'accès déjà vérifiés gardés jusqu'à leur expiration (False pour revérifier à chaque requête)
+AUTH_CACHE_JETONS = True
+AUTH_CACHE_JETONS_MAX = 10000
+
+# Cache des réponses de /api/statistiques/ et /api/tache-stats/ (voir tasks/cache.py)
+# LocMemCache évince les entrées les moins récemment utilisées au-delà de MAX_ENTRIES.
+# Il est propre à chaque processus : avec plusieurs workers, préférer un cache partagé
+# (FileBasedCache sur un même hôte) pour que les invalidations soient vues de tous.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'statistiques': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'statistiques',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+            'CULL_FREQUENCY': 10,
+        },
+    },
+    # Vu de tous les processus : Redis si REDIS_URL est défini, sinon une table de la base
+    # principale, à créer une fois avec `python manage.py createcachetable`.
+    # Aucune éviction avant expiration : une révocation de jeton perdue laisserait passer
+    # des claims périmés (rôle, is_active). Redis : maxmemory-policy noeviction ; table :
+    # MAX_ENTRIES assez grand pour que seules les entrées expirées soient supprimées.
+    'partage': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+    } if os.environ.get('REDIS_URL') else {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'cache_partage',
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000000,
+        },
+    },
+}
+
+# Alias de CACHES vu de tous les processus pour les versions des ETag, les révocations de
+# jetons et les écritures récentes (voir tasks/cache.py cache_partage). None, ou un cache
+# LocMem : pas d'ETag, utilisateur lu en base à chaque requête et DATABASES_REPLIQUES ignorées.
+CACHE_PARTAGE = 'partage'
+
+# Pagination par curseur de /api/taches/ (surchargeable avec ?page_size=)
+TACHE_PAGE_SIZE = 50
+TACHE_MAX_PAGE_SIZE = 500
+
+# Largeur maximale de la fenêtre de /api/calendrier/ (vue mois ou agenda, avec les semaines débordantes)
+CALENDRIER_MAX_JOURS = 92
+
+# Taille des listes de /api/dashboard/ (projets récents, prochaines échéances)
+DASHBOARD_PROJETS = 5
+DASHBOARD_ECHEANCES = 5
+
+# Flux /api/sync/ : lignes par flux et par réponse, et délai avant qu'une modification
+# y apparaisse (doit dépasser la durée d'une transaction d'écriture)
+SYNC_LIMITE = 500
+SYNC_MARGE_SECONDES = 5
+# Jours de conservation des suppressions (purgées par `manage.py purger_suppressions`, à
+# planifier) ; un curseur plus ancien reçoit 410 et le client resynchronise depuis le début
+SYNC_RETENTION_JOURS = 30
+
+# Flux /api/evenements/ (voir tasks/evenements.py) : bus de diffusion (BusMemoire ne relaie
+# qu'au sein d'un processus), événements en attente par client, secondes entre deux keepalive
+# (et entre deux vérifications des accès de l'abonné)
+EVENEMENTS_BUS = 'tasks.evenements.BusMemoire'
+EVENEMENTS_FILE_MAX = 1000
+EVENEMENTS_KEEPALIVE = 15
+# Durée de validité, en secondes, d'un ticket d'ouverture du flux (POST /api/evenements/ticket/)
+EVENEMENTS_TICKET_DUREE = 30
+
+# Nombre maximal de tâches par opération en masse (création, changement de statut)
+TACHE_MASSE_MAX = 1000
+
+# Pagination de /api/statistiques/ (surchargeable avec ?page_size=)
+STATISTIQUE_PAGE_SIZE = 50
+STATISTIQUE_MAX_PAGE_SIZE = 500
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # pour que je puisse utiliser mon  frontend React
 ]
@@ -0,0 +1,20 @@
+import pytest
+from django.core.cache import caches
+
+
+@pytest.fixture(autouse=True)
+def cache_partage(settings, tmp_path):
+    # Cache partagé entre processus comme en production (voir tasks/cache.py cache_partage)
+    settings.CACHES = {
+        **settings.CACHES,
+        'partage': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': str(tmp_path / 'cache')},
+    }
+    settings.CACHE_PARTAGE = 'partage'
+
+
+@pytest.fixture(autouse=True)
+def vider_caches(cache_partage):
+    # Les caches en mémoire survivent au rollback de la base entre deux tests
+    for cache in caches.all():
+        cache.clear()
+    yield
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-18 11:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projet',
+            name='taches_a_faire',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projet',
+            name='taches_en_cours',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projet',
+            name='taches_terminees',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-18 14:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_compteurs_taches'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projet',
+            name='date_modification',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='projet',
+            index=models.Index(fields=['date_modification', 'id'], name='projet_modification_id_idx'),
+        ),
+    ]
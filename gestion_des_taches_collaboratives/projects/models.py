@@ -11,6 +11,8 @@ class Projet(models.Model):
     nom = models.CharField(max_length=200)
     description = models.TextField()
     date_creation = models.DateField(auto_now_add=True)
+    # Dernière modification du projet, de ses membres ou de ses compteurs (flux /api/sync/)
+    date_modification = models.DateTimeField(auto_now=True)
     date_fin = models.DateField()
     etat = models.CharField(
         max_length=10,
@@ -20,12 +22,46 @@ class Projet(models.Model):
     proprietaire = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     membres = models.ManyToManyField(CustomUser, related_name='projets')
 
+    # Compteurs de tâches par statut, tenus à jour par tasks/signals.py
+    COMPTEURS_TACHES = {
+        'A_FAIRE': 'taches_a_faire',
+        'EN_COURS': 'taches_en_cours',
+        'TERMINE': 'taches_terminees',
+    }
+    taches_a_faire = models.IntegerField(default=0, editable=False)
+    taches_en_cours = models.IntegerField(default=0, editable=False)
+    taches_terminees = models.IntegerField(default=0, editable=False)
+
     class Meta:
         db_table = 'projets'
+        indexes = [
+            # Lecture incrémentale de /api/sync/ : (date_modification, id) > curseur
+            models.Index(fields=['date_modification', 'id'], name='projet_modification_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.nom} - {self.proprietaire} ({self.get_etat_display()})"
 
+    def save(self, *args, **kwargs):
+        # Les compteurs ne sont modifiés que par des UPDATE atomiques (F()) : une sauvegarde
+        # du projet ne doit pas réécrire les valeurs, potentiellement périmées, lues en mémoire
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COMPTEURS_TACHES.values()
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def taches_total(self):
+        return self.taches_a_faire + self.taches_en_cours + self.taches_terminees
+
+    @property
+    def progression(self):
+        if self.taches_total > 0:
+            return round((self.taches_terminees / self.taches_total) * 100)
+        return 0
+
     def get_absolute_url(self):
         return reverse('projet_detail', kwargs={'pk': self.pk})
 
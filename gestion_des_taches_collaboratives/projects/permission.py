@@ -12,4 +12,4 @@ class EstProprietaireOuLectureSeule(permissions.BasePermission):
             return True
 
         # Seul le propriétaire peut modifier ou supprimer le projet
-        return obj.proprietaire == request.user
+        return obj.proprietaire_id == request.user.pk
@@ -1,9 +1,17 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
 
+from tasks.champs import ChampsDynamiquesMixin, colonnes
 from users.serializers import UserSerializer
 from .models import Projet
 from users.models import CustomUser
 
+
+def prefetch_membres():
+    """Charge les membres en une seule requête, limitée aux colonnes de UserSerializer"""
+    return Prefetch('membres', queryset=CustomUser.objects.only(*UserSerializer.Meta.fields))
+
+
 # Serializer pour le propriétaire
 class ProprietaireSerializer(serializers.ModelSerializer):
     class Meta:
@@ -11,13 +19,35 @@ class ProprietaireSerializer(serializers.ModelSerializer):
         fields = ['id', 'username']
 
 
-class ProjetSerializer(serializers.ModelSerializer):
+def optimiser_projets(queryset, champs):
+    """Colonnes, jointure et préchargements nécessaires aux champs demandés (None : tous)"""
+    if champs is None:
+        return queryset.select_related('proprietaire').prefetch_related(prefetch_membres())
+    requises = []
+    if champs & {'taches_total', 'progression'}:
+        requises += Projet.COMPTEURS_TACHES.values()
+    if 'proprietaire' in champs:
+        queryset = queryset.select_related('proprietaire')
+        requises += [f'proprietaire__{champ}' for champ in ProprietaireSerializer.Meta.fields]
+    queryset = queryset.only(*colonnes(Projet, champs, *requises))
+    if 'membres_details' in champs:
+        return queryset.prefetch_related(prefetch_membres())
+    if 'membres' in champs:
+        return queryset.prefetch_related(Prefetch('membres', queryset=CustomUser.objects.only('id')))
+    return queryset
+
+
+class ProjetSerializer(ChampsDynamiquesMixin, serializers.ModelSerializer):
     proprietaire = ProprietaireSerializer(read_only=True)
     membres = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all(), many=True)
 
     # Nouveau champ pour les détails des membres
     membres_details = UserSerializer(source='membres', many=True, read_only=True)
 
+    # Dérivés des compteurs de tâches du projet, sans lire la table des tâches
+    taches_total = serializers.IntegerField(read_only=True)
+    progression = serializers.IntegerField(read_only=True)
+
     class Meta:
         model = Projet
         fields = '__all__'
@@ -0,0 +1,71 @@
+# projects/tests/test_queries.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+
+
+@pytest.mark.django_db
+class TestProjetNombreRequetes:
+    """La liste des projets doit tenir en un nombre fixe de requêtes SQL"""
+
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='lecteur',
+            password='password123',
+            email='lecteur@test.com',
+            role='enseignant'
+        )
+
+    def _creer_projets(self, nombre, nb_membres):
+        User = get_user_model()
+        for _ in range(nombre):
+            i = User.objects.count()
+            proprietaire = User.objects.create_user(
+                username=f'prof{i}', password='password123', email=f'prof{i}@test.com', role='enseignant'
+            )
+            projet = Projet.objects.create(
+                nom=f'Projet {i}',
+                description='Description',
+                date_fin=date.today() + timedelta(days=30),
+                proprietaire=proprietaire
+            )
+            for j in range(nb_membres):
+                projet.membres.add(User.objects.create_user(
+                    username=f'etu{i}-{j}', password='password123', email=f'etu{i}-{j}@test.com', role='etudiant'
+                ))
+
+    def _compter(self, api_client, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        # Les SAVEPOINT/RELEASE viennent d'ATOMIC_REQUESTS, pas de la vue
+        requetes = [q for q in ctx.captured_queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+        return len(requetes), response
+
+    def test_liste_nombre_requetes_constant(self, api_client, user):
+        api_client.force_authenticate(user=user)
+        url = reverse('projet-list')
+
+        self._creer_projets(2, 1)
+        peu, _ = self._compter(api_client, url)
+
+        self._creer_projets(15, 3)
+        beaucoup, response = self._compter(api_client, url)
+
+        assert len(response.data) == 17
+        assert response.data[-1]['proprietaire']['username']
+        assert len(response.data[-1]['membres_details']) == 3
+        assert beaucoup == peu
+        assert beaucoup <= 3
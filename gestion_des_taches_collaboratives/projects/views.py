@@ -1,8 +1,12 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from tasks.cache import VERSION_GLOBALE, VERSION_UTILISATEURS, VersionETagMixin, cle_version_projet
+from tasks.champs import ChampsDynamiquesViewMixin
+from tasks.repliques import LectureRepliqueMixin
+from tasks.transactions import LectureAutocommitMixin
 from .models import Projet
 from .permission import EstProprietaireOuLectureSeule
-from .serializer import ProjetSerializer
+from .serializer import ProjetSerializer, optimiser_projets
 from .swagger import (
     projet_list_swagger,
     projet_create_swagger,
@@ -11,12 +15,18 @@ from .swagger import (
     projet_delete_swagger
 )
 
-class ProjetListCreateView(generics.ListCreateAPIView):
-    """Liste les projets et permet d'en créer un nouveau"""
-    queryset = Projet.objects.all()
+class ProjetListCreateView(LectureAutocommitMixin, LectureRepliqueMixin, ChampsDynamiquesViewMixin, VersionETagMixin, generics.ListCreateAPIView):
+    """Liste les projets et permet d'en créer un nouveau (?fields= / ?exclude= en lecture)"""
     serializer_class = ProjetSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        # Propriétaire joint et membres préchargés : nombre de requêtes constant
+        return optimiser_projets(Projet.objects.all(), self.champs_serialises())
+
+    def get_etag_versions(self):
+        return [VERSION_GLOBALE, VERSION_UTILISATEURS]
+
     @projet_list_swagger
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
@@ -29,12 +39,17 @@ class ProjetListCreateView(generics.ListCreateAPIView):
         """Associe le projet au créateur"""
         serializer.save(proprietaire=self.request.user)
 
-class ProjetDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ProjetDetailView(LectureAutocommitMixin, ChampsDynamiquesViewMixin, VersionETagMixin, generics.RetrieveUpdateDestroyAPIView):
     """Permet de récupérer, modifier ou supprimer un projet"""
-    queryset = Projet.objects.all()
     serializer_class = ProjetSerializer
     permission_classes = [IsAuthenticated, EstProprietaireOuLectureSeule]  # Protection par permission
 
+    def get_queryset(self):
+        return optimiser_projets(Projet.objects.all(), self.champs_serialises())
+
+    def get_etag_versions(self):
+        return [cle_version_projet(self.kwargs['pk']), VERSION_UTILISATEURS]
+
     @projet_detail_swagger
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tasks'
+
+    def ready(self):
+        # Mise à jour des compteurs StatistiqueUtilisateur / CompletionJournaliere
+        from . import signals  # noqa: F401
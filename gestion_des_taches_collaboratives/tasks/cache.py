@@ -0,0 +1,211 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+CACHE_ALIAS = 'statistiques'
+# Changée à chaque écriture sur une tâche, un projet ou les statistiques d'un utilisateur
+VERSION_GLOBALE = 'version:global'
+# Changée à chaque modification d'un champ exposé d'un utilisateur
+VERSION_UTILISATEURS = 'version:utilisateurs'
+
+# Backends propres à chaque processus : ils ne peuvent pas servir de cache partagé
+CACHES_LOCAUX = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# Compteurs de succès / défauts du cache, propres à chaque processus
+_compteurs = {'hits': 0, 'misses': 0}
+_verrou = threading.Lock()
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def cache_partage():
+    """
+    Cache vu de tous les processus (alias settings.CACHE_PARTAGE), ou None s'il n'y en a
+    pas ou s'il est propre au processus. Ce qui doit être vu de tous les workers (versions
+    des ETag, révocations de jetons, écritures récentes) n'est fiable que là.
+    """
+    alias = settings.CACHE_PARTAGE
+    if not alias or settings.CACHES[alias]['BACKEND'] in CACHES_LOCAUX:
+        return None
+    return caches[alias]
+
+
+def _cache_versions():
+    # Sans cache partagé, les versions ne valent que pour le processus : elles ne servent
+    # alors qu'aux réponses en cache, qui expirent (TIMEOUT), jamais aux ETag
+    return cache_partage() or _cache()
+
+
+def cle_version_projet(projet_id):
+    return f'version:projet:{projet_id}'
+
+
+def _versions(cles):
+    cache = _cache_versions()
+    versions = cache.get_many(cles)
+    for cle in cles:
+        if cle not in versions:
+            # Valeur initiale horodatée : si le compteur est évincé, il ne peut pas revenir
+            # à une ancienne valeur et resservir des entrées périmées
+            cache.add(cle, time.time_ns(), timeout=None)
+            versions[cle] = cache.get(cle)
+    return [versions[cle] for cle in cles]
+
+
+def _version(cle):
+    return _versions([cle])[0]
+
+
+def _incrementer(cle):
+    # Nouvelle valeur plutôt que incr, qui n'est pas atomique sur tous les backends
+    # (base de données, fichiers) : deux écritures concurrentes changent toujours la version
+    _cache_versions().set_many({cle: time.time_ns(), f'{cle}:date': time.time()}, timeout=None)
+
+
+def reponse_fiable(cles):
+    """
+    Faux pour une lecture sur réplique alors qu'une des versions a changé il y a moins de
+    REPLIQUES_RETARD_MAX secondes : la réplique peut être antérieure à l'écriture, la
+    réponse ne doit être ni mise en cache ni associée à un ETag de la nouvelle version.
+    """
+    # Import local : tasks.repliques importe ce module
+    from .repliques import lecture_sur_replique
+
+    if not lecture_sur_replique():
+        return True
+    limite = time.time() - settings.REPLIQUES_RETARD_MAX
+    return all(date < limite for date in _cache_versions().get_many([f'{cle}:date' for cle in cles]).values())
+
+
+def invalider(projet_ids=()):
+    """
+    Invalide les statistiques globales et celles des projets donnés.
+    Appliqué après le commit : une lecture concurrente ne peut pas remettre en cache
+    des données antérieures à l'écriture sous la nouvelle version.
+    """
+    projet_ids = {projet_id for projet_id in projet_ids if projet_id is not None}
+
+    def incrementer():
+        _incrementer(VERSION_GLOBALE)
+        for projet_id in projet_ids:
+            _incrementer(cle_version_projet(projet_id))
+
+    transaction.on_commit(incrementer)
+
+
+def invalider_utilisateurs(statistiques=False):
+    """
+    Invalide les réponses qui exposent des utilisateurs (listes, membres, assignés),
+    et les statistiques globales si statistiques=True. Appliqué après le commit.
+    """
+    def incrementer():
+        _incrementer(VERSION_UTILISATEURS)
+        if statistiques:
+            _incrementer(VERSION_GLOBALE)
+
+    transaction.on_commit(incrementer)
+
+
+def reponse_en_cache(nom, request, calculer, projet_id=None):
+    """
+    Sert la réponse depuis le cache si elle existe pour la version courante
+    (celle du projet si projet_id est donné, la version globale sinon),
+    sinon appelle calculer() et met le résultat en cache (réponses 200 uniquement).
+    """
+    # Une réponse limitée à un projet ne dépend que de la version de ce projet
+    cle_version = cle_version_projet(projet_id) if projet_id is not None else VERSION_GLOBALE
+    version = _version(cle_version)
+    empreinte = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+    cle = f"{nom}:{version}:{empreinte}"
+
+    cache = _cache()
+    data = cache.get(cle)
+    if data is not None:
+        with _verrou:
+            _compteurs['hits'] += 1
+        response = Response(data)
+        response['X-Cache'] = 'HIT'
+        return response
+
+    with _verrou:
+        _compteurs['misses'] += 1
+    response = calculer()
+    if response.status_code == 200 and reponse_fiable([cle_version]):
+        cache.set(cle, response.data)
+    response['X-Cache'] = 'MISS'
+    return response
+
+
+def calculer_etag(request, cles, contexte=()):
+    """
+    ETag fort dérivé des versions données, du contexte (valeurs dont dépend aussi la
+    réponse, comme la date du jour) et de la requête (utilisateur, URL et en-tête Accept),
+    sans lire la base ni sérialiser la réponse.
+    """
+    versions = _versions(cles)
+    source = '|'.join([
+        *map(str, versions), *map(str, contexte), str(request.user.pk), request.build_absolute_uri(), request.META.get('HTTP_ACCEPT', '')
+    ])
+    return '"%s"' % hashlib.md5(source.encode('utf-8')).hexdigest()
+
+
+class VersionETagMixin:
+    """
+    Ajoute un ETag aux réponses GET d'une vue DRF et répond 304 Not Modified,
+    sans requête ni sérialisation, quand If-None-Match correspond encore.
+    Les vues définissent get_etag_versions() : clés de version dont dépend la réponse.
+    Sans cache partagé (cache_partage()), aucun ETag n'est émis : un worker qui n'a pas vu
+    une écriture répondrait 304 sur des données périmées.
+    """
+
+    def get_etag_versions(self):
+        """Clés de version dont dépend la réponse, ou None pour ne pas émettre d'ETag"""
+        raise NotImplementedError
+
+    def get_etag_contexte(self):
+        """Autres valeurs dont dépend la réponse sans écriture en base (date du jour...)"""
+        return []
+
+    def get(self, request, *args, **kwargs):
+        # Versions lues avant le calcul : une écriture concurrente donnera au pire un ETag déjà périmé
+        cles = self.get_etag_versions()
+        if cles is None or cache_partage() is None:
+            return super().get(request, *args, **kwargs)
+
+        etag = calculer_etag(request, cles, self.get_etag_contexte())
+        # Comparaison faible pour If-None-Match (RFC 9110) : on ignore le préfixe W/
+        candidats = [candidat.removeprefix('W/') for candidat in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))]
+        if etag in candidats or '*' in candidats:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK or not reponse_fiable(cles):
+                return response
+        response['ETag'] = etag
+        # Le navigateur garde la réponse mais la revalide à chaque fois
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+def statistiques_cache():
+    with _verrou:
+        hits, misses = _compteurs['hits'], _compteurs['misses']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0,
+        'max_entries': settings.CACHES[CACHE_ALIAS].get('OPTIONS', {}).get('MAX_ENTRIES'),
+    }
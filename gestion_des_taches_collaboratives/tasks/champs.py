@@ -0,0 +1,49 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+def champs_demandes(request, disponibles):
+    """
+    Champs à produire d'après ?fields= et ?exclude= (listes séparées par des virgules),
+    ou None sans restriction. Ne s'applique qu'aux lectures ; les noms inconnus sont ignorés.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    fields = request.query_params.get('fields')
+    exclude = request.query_params.get('exclude')
+    if not fields and not exclude:
+        return None
+
+    champs = set(disponibles)
+    if fields:
+        champs &= {nom.strip() for nom in fields.split(',')}
+    if exclude:
+        champs -= {nom.strip() for nom in exclude.split(',')}
+    return champs
+
+
+def colonnes(model, champs, *requises):
+    """Colonnes du modèle à charger avec only() pour produire les champs donnés"""
+    concrets = {field.name for field in model._meta.concrete_fields}
+    return sorted({'pk', *requises} | (set(champs) & concrets))
+
+
+class ChampsDynamiquesMixin:
+    """Serializer dont les champs produits suivent ?fields= / ?exclude= de la requête"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        champs = champs_demandes(self.context.get('request'), self.fields)
+        if champs is not None:
+            for nom in list(self.fields):
+                if nom not in champs:
+                    self.fields.pop(nom)
+
+
+class ChampsDynamiquesViewMixin:
+    """
+    Vue dont le serializer utilise ChampsDynamiquesMixin : champs_serialises() donne les
+    champs qui seront produits (None : tous), pour limiter colonnes et préchargements.
+    """
+
+    def champs_serialises(self):
+        return champs_demandes(self.request, self.get_serializer_class()().fields)
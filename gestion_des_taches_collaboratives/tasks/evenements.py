@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework_simplejwt.tokens import Token
+
+
+class TicketFlux(Token):
+    """
+    Ticket d'ouverture de /api/evenements/ passé en ?ticket= (EventSource ne peut pas
+    envoyer d'en-tête) : valable EVENEMENTS_TICKET_DUREE secondes et pour ce seul flux,
+    il ne vaut rien ailleurs s'il fuit dans des journaux. Le claim 'fin' reprend
+    l'expiration du jeton d'accès qui l'a obtenu : le flux se ferme à cette date.
+    """
+    token_type = 'flux'
+    lifetime = timedelta(seconds=settings.EVENEMENTS_TICKET_DUREE)
+
+
+class Abonnement:
+    """
+    File d'événements d'un client de /api/evenements/, consommée dans sa boucle asyncio.
+    Si le client ne suit pas (file pleine), les événements suivants sont perdus et
+    `debordement` lui indique de se resynchroniser (via /api/sync/).
+    """
+
+    def __init__(self, projet_ids):
+        self.projet_ids = set(projet_ids)
+        self.debordement = False
+        self._boucle = asyncio.get_running_loop()
+        self._file = asyncio.Queue(maxsize=settings.EVENEMENTS_FILE_MAX)
+
+    def recevoir(self, evenement):
+        # Appelé depuis le thread de la requête d'écriture : la file n'est touchée que par sa boucle
+        try:
+            self._boucle.call_soon_threadsafe(self._deposer, evenement)
+        except RuntimeError:
+            # Boucle fermée : le client est parti
+            pass
+
+    def _deposer(self, evenement):
+        try:
+            self._file.put_nowait(evenement)
+        except asyncio.QueueFull:
+            self.debordement = True
+
+    async def suivant(self, delai):
+        """Prochain événement, ou None après `delai` secondes sans événement"""
+        try:
+            return await asyncio.wait_for(self._file.get(), timeout=delai)
+        except asyncio.TimeoutError:
+            return None
+
+
+class BusMemoire:
+    """
+    Bus d'événements du processus courant : un événement publié pour un projet est remis
+    aux abonnements de ce projet ouverts dans ce même processus. Avec plusieurs workers,
+    un autre backend (même interface : publier() et abonner()) doit relayer entre eux.
+    """
+
+    def __init__(self):
+        self._abonnements = defaultdict(set)
+        self._verrou = threading.Lock()
+
+    def publier(self, projet_id, evenement):
+        with self._verrou:
+            abonnements = list(self._abonnements.get(projet_id, ()))
+        for abonnement in abonnements:
+            abonnement.recevoir(evenement)
+
+    @asynccontextmanager
+    async def abonner(self, projet_ids):
+        abonnement = Abonnement(projet_ids)
+        with self._verrou:
+            for projet_id in abonnement.projet_ids:
+                self._abonnements[projet_id].add(abonnement)
+        try:
+            yield abonnement
+        finally:
+            with self._verrou:
+                for projet_id in abonnement.projet_ids:
+                    self._abonnements[projet_id].discard(abonnement)
+                    if not self._abonnements[projet_id]:
+                        del self._abonnements[projet_id]
+
+
+@lru_cache(maxsize=None)
+def bus():
+    """Bus configuré par settings.EVENEMENTS_BUS (chemin de la classe)"""
+    return import_string(settings.EVENEMENTS_BUS)()
+
+
+def publier(type_evenement, projet_id, objet_id):
+    """
+    Annonce aux membres du projet la modification d'une tâche ou du projet, une fois la
+    transaction validée. L'événement ne porte que des identifiants : le client relit
+    les lignes concernées (par exemple avec /api/sync/).
+    """
+    evenement = {'type': type_evenement, 'projet': projet_id, 'id': objet_id}
+    transaction.on_commit(lambda: bus().publier(projet_id, evenement))
@@ -0,0 +1,77 @@
+import logging
+
+from django.conf import settings
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+
+class CarteIdentite:
+    """
+    Objets chargés pendant une requête, par (modèle, pk) : permissions, vues et serializers
+    qui demandent le même projet ou la même tâche partagent une seule lecture.
+    `chargees` compte les lectures en base, `evitees` celles servies par la carte.
+    """
+
+    def __init__(self):
+        self._objets = {}
+        self.chargees = 0
+        self.evitees = 0
+
+    def obtenir(self, model, pk):
+        """Instance de `model` d'identifiant `pk`, ou None si elle n'existe pas"""
+        try:
+            cle = (model, int(pk))
+        except (TypeError, ValueError):
+            return None
+        if cle in self._objets:
+            self.evitees += 1
+        else:
+            self.chargees += 1
+            self._objets[cle] = model._default_manager.filter(pk=cle[1]).first()
+        return self._objets[cle]
+
+    def enregistrer(self, instance):
+        """Ajoute une instance déjà chargée par ailleurs (get_object d'une vue)"""
+        self._objets.setdefault((type(instance), instance.pk), instance)
+        return self._objets[(type(instance), instance.pk)]
+
+
+def carte_identite(request):
+    """Carte de la requête, créée au premier appel (requête Django ou Request de DRF)"""
+    request = getattr(request, '_request', request)
+    if not hasattr(request, 'carte_identite'):
+        request.carte_identite = CarteIdentite()
+    return request.carte_identite
+
+
+class RelationCarteField(serializers.PrimaryKeyRelatedField):
+    """Clé étrangère résolue par la carte d'identité de la requête (context['request'])"""
+
+    def to_internal_value(self, data):
+        request = self.context.get('request')
+        if request is None or isinstance(data, bool):
+            return super().to_internal_value(data)
+        instance = carte_identite(request).obtenir(self.get_queryset().model, data)
+        if instance is None:
+            return super().to_internal_value(data)
+        return instance
+
+
+class CarteIdentiteMiddleware:
+    """En DEBUG, expose dans l'en-tête X-Carte-Identite les lectures faites et évitées"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        carte = getattr(request, 'carte_identite', None)
+        if carte is not None:
+            logger.debug(
+                "%s %s : %d objet(s) chargé(s), %d lecture(s) évitée(s)",
+                request.method, request.path, carte.chargees, carte.evitees
+            )
+            if settings.DEBUG:
+                response['X-Carte-Identite'] = f"chargees={carte.chargees}; evitees={carte.evitees}"
+        return response
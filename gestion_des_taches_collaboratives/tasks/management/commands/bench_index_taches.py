@@ -0,0 +1,160 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, Q
+
+from projects.models import Projet
+from tasks.models import Tache, TacheAssignation
+from users.models import CustomUser
+
+# Index comparés : tous ceux de Meta.indexes (migrations 0004 et suivantes). Sans eux, il
+# reste le schéma d'origine : index des clés étrangères et unicité (tache, customuser).
+INDEX_COMPARES = [(model, index) for model in (Tache, TacheAssignation) for index in model._meta.indexes]
+LOT = 10000
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare les plans et les temps des requêtes fréquentes sur les tâches avec le schéma "
+        "d'origine (index des clés étrangères seulement) et avec tous les index ajoutés, sur une "
+        "base de test générée (la base configurée n'est pas modifiée)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--taches', type=int, default=1000000, help="Nombre de tâches générées")
+        parser.add_argument('--utilisateurs', type=int, default=2000, help="Nombre d'utilisateurs générés")
+        parser.add_argument('--projets', type=int, default=1000, help="Nombre de projets générés")
+        parser.add_argument('--repetitions', type=int, default=5, help="Exécutions par requête (meilleur temps retenu)")
+
+    def handle(self, *args, **options):
+        ancienne_base = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            self._generer(options['taches'], options['utilisateurs'], options['projets'])
+            requetes = self._requetes()
+
+            with connection.schema_editor() as editor:
+                for model, index in INDEX_COMPARES:
+                    editor.remove_index(model, index)
+            self._mesurer(
+                "Avant : index des clés étrangères seulement (" + ", ".join(self._index_presents()) + ")",
+                requetes, options['repetitions']
+            )
+
+            with connection.schema_editor() as editor:
+                for model, index in INDEX_COMPARES:
+                    editor.add_index(model, index)
+            self._mesurer(
+                "Après : avec " + ", ".join(index.name for _, index in INDEX_COMPARES),
+                requetes, options['repetitions']
+            )
+        finally:
+            connection.creation.destroy_test_db(ancienne_base, verbosity=0)
+
+    def _index_presents(self):
+        # Index réellement présents en base, pour vérifier le schéma mesuré
+        with connection.cursor() as cursor:
+            return sorted(
+                nom
+                for model in (Tache, TacheAssignation)
+                for nom, contrainte in connection.introspection.get_constraints(cursor, model._meta.db_table).items()
+                if (contrainte['index'] or contrainte['unique']) and not contrainte['primary_key']
+            )
+
+    def _generer(self, nb_taches, nb_utilisateurs, nb_projets):
+        self.stdout.write(f"Génération de {nb_taches} tâches, {nb_utilisateurs} utilisateurs, {nb_projets} projets...")
+        rng = random.Random(42)
+        aujourdhui = date.today()
+
+        # bulk_create ne déclenche pas les signaux : les compteurs ne sont pas maintenus ici
+        CustomUser.objects.bulk_create(
+            [
+                CustomUser(username=f"bench{i}", email=f"bench{i}@exemple.com", nom="Bench", prenom=str(i))
+                for i in range(nb_utilisateurs)
+            ],
+            batch_size=LOT
+        )
+        user_ids = list(CustomUser.objects.values_list('id', flat=True))
+        Projet.objects.bulk_create(
+            [
+                Projet(nom=f"Projet {i}", description="", date_fin=aujourdhui, proprietaire_id=rng.choice(user_ids))
+                for i in range(nb_projets)
+            ],
+            batch_size=LOT
+        )
+        projet_ids = list(Projet.objects.values_list('id', flat=True))
+        statuts = [statut for statut, _ in Tache.STATUT_CHOICES]
+
+        for debut in range(0, nb_taches, LOT):
+            taches = Tache.objects.bulk_create([
+                Tache(
+                    titre=f"Tâche {i}",
+                    description="",
+                    date_limite=aujourdhui + timedelta(days=rng.randint(-365, 365)),
+                    statut=rng.choice(statuts),
+                    projet_id=rng.choice(projet_ids),
+                )
+                for i in range(debut, min(debut + LOT, nb_taches))
+            ])
+            if taches[0].pk is None:
+                # Backends sans RETURNING : on relit les ids du lot
+                taches = list(Tache.objects.order_by('-id')[:len(taches)])
+            TacheAssignation.objects.bulk_create(
+                [
+                    TacheAssignation(tache_id=tache.pk, customuser_id=user_id)
+                    for tache in taches
+                    for user_id in rng.sample(user_ids, rng.randint(1, 3))
+                ],
+                batch_size=LOT
+            )
+
+        with connection.cursor() as cursor:
+            # Statistiques de l'optimiseur à jour pour des plans représentatifs
+            cursor.execute('ANALYZE' if connection.vendor != 'mysql' else 'ANALYZE TABLE tasks_tache, tasks_tache_assigne_a')
+
+        self._projet_id = rng.choice(projet_ids)
+        self._user_id = rng.choice(user_ids)
+
+    def _requetes(self):
+        aujourdhui = date.today()
+        semaine = (aujourdhui, aujourdhui + timedelta(days=7))
+        lien = Tache.assigne_a.through
+        return [
+            (
+                "Compteurs par statut d'un projet",
+                Tache.objects.filter(projet_id=self._projet_id).values('statut').annotate(nombre=Count('id')).order_by(),
+            ),
+            (
+                "Tâches de la semaine",
+                Tache.objects.filter(date_limite__range=semaine).order_by('date_limite').values_list('id', flat=True),
+            ),
+            (
+                "Tâches d'un utilisateur (taches_assignees)",
+                Tache.objects.filter(assigne_a=self._user_id).order_by('date_limite').values_list('id', flat=True),
+            ),
+            (
+                "Tâches d'un utilisateur sur la semaine",
+                Tache.objects.filter(assigne_a=self._user_id, date_limite__range=semaine).values_list('id', flat=True),
+            ),
+            (
+                "Totaux par utilisateur (recalcul des statistiques)",
+                lien.objects.values('customuser_id').annotate(
+                    total=Count('id'), terminees=Count('id', filter=Q(tache__statut='TERMINE'))
+                ).order_by(),
+            ),
+        ]
+
+    def _mesurer(self, titre, requetes, repetitions):
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n{titre}"))
+        for nom, queryset in requetes:
+            meilleur = None
+            for _ in range(max(repetitions, 1)):
+                debut = time.perf_counter()
+                list(queryset.all())
+                duree = time.perf_counter() - debut
+                meilleur = duree if meilleur is None else min(meilleur, duree)
+            self.stdout.write(f"\n{nom} : {meilleur * 1000:.1f} ms")
+            self.stdout.write(queryset.explain())
@@ -0,0 +1,63 @@
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import path
+
+# Pile d'avant API_PREFIXES : tous les middlewares sur toutes les requêtes
+MIDDLEWARE_COMPLET = [
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'allauth.account.middleware.AccountMiddleware',
+    'tasks.identite.CarteIdentiteMiddleware',
+]
+
+
+def vue_vide(request):
+    return HttpResponse()
+
+
+# Vue sans travail : seul le coût des middlewares et du gestionnaire est mesuré
+urlpatterns = [path('api/bench/', vue_vide)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure le temps par requête /api/ de la pile de middlewares complète et de la pile "
+        "allégée de settings.MIDDLEWARE (vue vide, sans base de données)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requetes', type=int, default=20000, help="Requêtes par mesure")
+        parser.add_argument('--repetitions', type=int, default=3, help="Mesures par pile (meilleur temps retenu)")
+
+    def handle(self, *args, **options):
+        complete = self._mesurer(MIDDLEWARE_COMPLET, options['requetes'], options['repetitions'])
+        allegee = self._mesurer(settings.MIDDLEWARE, options['requetes'], options['repetitions'])
+
+        self.stdout.write(f"Pile complète : {complete * 1e6:.1f} µs par requête")
+        self.stdout.write(f"Pile allégée : {allegee * 1e6:.1f} µs par requête")
+        self.stdout.write(self.style.SUCCESS(f"Surcoût retiré : {(complete - allegee) * 1e6:.1f} µs par requête /api/"))
+
+    def _mesurer(self, middleware, nombre, repetitions):
+        environ = RequestFactory()._base_environ(PATH_INFO='/api/bench/', REQUEST_METHOD='GET')
+        with override_settings(MIDDLEWARE=middleware, ROOT_URLCONF=__name__, DEBUG=False):
+            handler = WSGIHandler()
+            meilleur = None
+            for _ in range(max(repetitions, 1)):
+                debut = time.perf_counter()
+                for _ in range(nombre):
+                    handler(dict(environ), lambda statut, entetes: None)
+                duree = (time.perf_counter() - debut) / nombre
+                meilleur = duree if meilleur is None else min(meilleur, duree)
+            return meilleur
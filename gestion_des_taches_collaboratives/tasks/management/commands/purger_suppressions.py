@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.sync import purger_suppressions
+
+
+class Command(BaseCommand):
+    help = (
+        "Supprime les suppressions enregistrées pour /api/sync/ depuis plus de SYNC_RETENTION_JOURS "
+        "(à planifier, par exemple chaque jour)"
+    )
+
+    def handle(self, *args, **options):
+        nombre = purger_suppressions()
+        self.stdout.write(self.style.SUCCESS(
+            f"{nombre} suppression(s) de plus de {settings.SYNC_RETENTION_JOURS} jour(s) purgée(s)."
+        ))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.statistiques import verifier_compteurs_projets
+
+
+class Command(BaseCommand):
+    help = "Détecte et corrige les écarts entre les compteurs de tâches des projets et les tâches réelles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Vérifie seulement les compteurs, sans les modifier (code de sortie 1 en cas d'écart)",
+        )
+
+    def handle(self, *args, **options):
+        ecarts = verifier_compteurs_projets(reparer=not options['check'])
+        for ecart in ecarts:
+            self.stderr.write(ecart)
+
+        if options['check'] and ecarts:
+            raise CommandError(f"{len(ecarts)} projet(s) avec des compteurs incohérents.")
+        if ecarts:
+            self.stdout.write(self.style.SUCCESS(f"{len(ecarts)} projet(s) corrigé(s)."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Compteurs des projets cohérents."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.statistiques import reconstruire_statistiques, verifier_statistiques
+
+
+class Command(BaseCommand):
+    help = "Reconstruit les compteurs de /api/statistiques/ à partir des tâches, puis les vérifie"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Vérifie seulement les compteurs, sans les modifier (code de sortie 1 en cas d'écart)",
+        )
+
+    def handle(self, *args, **options):
+        if not options['check']:
+            utilisateurs, jours = reconstruire_statistiques()
+            self.stdout.write(f"{utilisateurs} utilisateur(s) et {jours} jour(s) de complétion recalculés.")
+
+        ecarts = verifier_statistiques()
+        for ecart in ecarts:
+            self.stderr.write(ecart)
+        if ecarts:
+            raise CommandError(f"{len(ecarts)} écart(s) détecté(s) dans les statistiques.")
+        self.stdout.write(self.style.SUCCESS("Statistiques cohérentes."))
@@ -0,0 +1,124 @@
+from collections import Counter
+
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import BooleanField, Exists, ExpressionWrapper, Max, OuterRef, Q
+from django.utils import timezone
+
+from projects.models import Projet
+
+from .cache import invalider
+from .evenements import publier
+from .models import Tache, TacheAssignation
+from .statistiques import ajuster_compteurs_projets_en_masse, ajuster_statistiques_en_masse
+
+
+def _inserer_et_relire(projet_id, taches):
+    """
+    bulk_create pour les backends qui ne renvoient pas les ids d'un INSERT multi-lignes
+    (MySQL) : les ids sont relus en une requête, dans l'ordre d'insertion. Le projet est
+    verrouillé jusqu'au commit ; toute tâche créée ou déplacée dans ce projet ajuste ses
+    compteurs (ligne verrouillée) avant son commit, donc aucune autre tâche du projet ne
+    peut apparaître au-delà du dernier id lu avant l'insertion.
+    """
+    list(Projet.objects.select_for_update().filter(pk=projet_id).values_list('pk', flat=True))
+    dernier = Tache.objects.filter(projet_id=projet_id).aggregate(dernier=Max('pk'))['dernier'] or 0
+    Tache.objects.bulk_create(taches, batch_size=500)
+    ids = list(
+        Tache.objects.filter(projet_id=projet_id, pk__gt=dernier).order_by('pk').values_list('pk', flat=True)
+    )
+    if len(ids) != len(taches):
+        raise DatabaseError(
+            f"{len(ids)} tâches relues pour {len(taches)} insérées dans le projet {projet_id}."
+        )
+    for tache, pk in zip(taches, ids):
+        tache.pk = pk
+
+
+@transaction.atomic
+def creer_taches(projet_id, elements):
+    """
+    Insère des tâches déjà validées (validated_data de TacheCreationMasseSerializer)
+    avec bulk_create, puis leurs assignations en une seule insertion.
+    bulk_create n'envoie pas de signaux : compteurs et statistiques sont ajustés ici.
+    """
+    taches, assignes = [], []
+    for element in elements:
+        element = dict(element)
+        # Un même utilisateur listé deux fois ne donne qu'une assignation
+        assignes.append({user.pk for user in element.pop('assigne_a', [])})
+        taches.append(Tache(projet_id=projet_id, **element))
+
+    if connections[router.db_for_write(Tache)].features.can_return_rows_from_bulk_insert:
+        Tache.objects.bulk_create(taches, batch_size=500)
+    else:
+        _inserer_et_relire(projet_id, taches)
+    ajuster_compteurs_projets_en_masse(Counter((projet_id, tache.statut) for tache in taches))
+    for tache in taches:
+        publier('tache.creee', projet_id, tache.pk)
+
+    TacheAssignation.objects.bulk_create(
+        [
+            TacheAssignation(tache_id=tache.pk, customuser_id=user_id)
+            for tache, user_ids in zip(taches, assignes)
+            for user_id in user_ids
+        ],
+        batch_size=1000
+    )
+    increments = Counter()
+    for tache, user_ids in zip(taches, assignes):
+        for user_id in user_ids:
+            increments[user_id, tache.statut, tache.date_limite] += 1
+    ajuster_statistiques_en_masse(increments)
+    invalider([projet_id])
+    return taches
+
+
+@transaction.atomic
+def changer_statut(utilisateur, ids, statut):
+    """
+    Passe les tâches données au statut donné en un seul UPDATE.
+    Les droits (propriétaire du projet ou assigné) sont vérifiés en une requête, sur des
+    lignes verrouillées jusqu'au commit. Retourne (modifiées, introuvables, interdites) ;
+    rien n'est modifié si une tâche est introuvable ou interdite.
+    """
+    autorisee = ExpressionWrapper(
+        Q(projet__proprietaire=utilisateur)
+        | Exists(TacheAssignation.objects.filter(tache=OuterRef('pk'), customuser=utilisateur)),
+        output_field=BooleanField()
+    )
+    lignes = {
+        tache_id: (ancien, date_limite, projet_id, droit)
+        for tache_id, ancien, date_limite, projet_id, droit in Tache.objects.filter(pk__in=ids)
+        .select_for_update()
+        .annotate(autorisee=autorisee)
+        .values_list('id', 'statut', 'date_limite', 'projet_id', 'autorisee')
+    }
+    introuvables = sorted(set(ids) - set(lignes))
+    interdites = sorted(tache_id for tache_id, (*_, droit) in lignes.items() if not droit)
+    if introuvables or interdites:
+        return [], introuvables, interdites
+
+    modifiees = sorted(tache_id for tache_id, (ancien, *_) in lignes.items() if ancien != statut)
+    if not modifiees:
+        return [], [], []
+    Tache.objects.filter(pk__in=modifiees).update(statut=statut, date_modification=timezone.now())
+
+    # UPDATE n'envoie pas de signaux : compteurs et statistiques sont ajustés ici
+    compteurs = Counter()
+    for tache_id in modifiees:
+        ancien, _, projet_id, _ = lignes[tache_id]
+        compteurs[projet_id, ancien] -= 1
+        compteurs[projet_id, statut] += 1
+    ajuster_compteurs_projets_en_masse(compteurs)
+
+    increments = Counter()
+    for tache_id, user_id in TacheAssignation.objects.filter(tache_id__in=modifiees).values_list('tache_id', 'customuser_id'):
+        ancien, date_limite, _, _ = lignes[tache_id]
+        increments[user_id, ancien, date_limite] -= 1
+        increments[user_id, statut, date_limite] += 1
+    ajuster_statistiques_en_masse(increments)
+
+    invalider({lignes[tache_id][2] for tache_id in modifiees})
+    for tache_id in modifiees:
+        publier('tache.modifiee', lignes[tache_id][2], tache_id)
+    return modifiees, [], []
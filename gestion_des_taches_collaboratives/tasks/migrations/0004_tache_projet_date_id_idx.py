@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        ('tasks', '0003_remove_tache_assigne_a_tache_assigne_a'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tache',
+            index=models.Index(fields=['projet', 'date_limite', 'id'], name='tache_projet_date_id_idx'),
+        ),
+    ]
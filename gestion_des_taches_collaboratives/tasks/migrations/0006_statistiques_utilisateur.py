@@ -0,0 +1,74 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def remplir_statistiques(apps, schema_editor):
+    Tache = apps.get_model('tasks', 'Tache')
+    StatistiqueUtilisateur = apps.get_model('tasks', 'StatistiqueUtilisateur')
+    CompletionJournaliere = apps.get_model('tasks', 'CompletionJournaliere')
+    lien = Tache.assigne_a.through
+
+    StatistiqueUtilisateur.objects.bulk_create(
+        [
+            StatistiqueUtilisateur(
+                utilisateur_id=ligne['customuser_id'],
+                taches_totales=ligne['total'],
+                taches_terminees=ligne['terminees'],
+            )
+            for ligne in lien.objects.values('customuser_id').annotate(
+                total=Count('id'),
+                terminees=Count('id', filter=Q(tache__statut='TERMINE')),
+            )
+        ],
+        batch_size=1000
+    )
+    CompletionJournaliere.objects.bulk_create(
+        [
+            CompletionJournaliere(
+                utilisateur_id=ligne['customuser_id'],
+                jour=ligne['tache__date_limite'],
+                nombre=ligne['nombre'],
+            )
+            for ligne in lien.objects.filter(tache__statut='TERMINE')
+            .values('customuser_id', 'tache__date_limite')
+            .annotate(nombre=Count('id'))
+        ],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_tache_projet_statut_idx'),
+        ('users', '0002_alter_customuser_avatar'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatistiqueUtilisateur',
+            fields=[
+                ('utilisateur', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='statistique', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('taches_totales', models.IntegerField(default=0)),
+                ('taches_terminees', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CompletionJournaliere',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jour', models.DateField()),
+                ('nombre', models.IntegerField(default=0)),
+                ('utilisateur', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='completions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('utilisateur', 'jour'), name='completion_utilisateur_jour_unique')],
+            },
+        ),
+        migrations.RunPython(remplir_statistiques, migrations.RunPython.noop),
+    ]
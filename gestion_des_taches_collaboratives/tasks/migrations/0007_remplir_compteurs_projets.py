@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-18 11:01
+
+from django.db import migrations
+from django.db.models import Count
+
+COMPTEURS_TACHES = {
+    'A_FAIRE': 'taches_a_faire',
+    'EN_COURS': 'taches_en_cours',
+    'TERMINE': 'taches_terminees',
+}
+
+
+def remplir_compteurs_projets(apps, schema_editor):
+    Tache = apps.get_model('tasks', 'Tache')
+    Projet = apps.get_model('projects', 'Projet')
+
+    compteurs = {}
+    for ligne in Tache.objects.values('projet_id', 'statut').annotate(nombre=Count('id')).order_by():
+        champ = COMPTEURS_TACHES.get(ligne['statut'])
+        if champ:
+            compteurs.setdefault(ligne['projet_id'], {})[champ] = ligne['nombre']
+
+    for projet_id, valeurs in compteurs.items():
+        Projet.objects.filter(pk=projet_id).update(**valeurs)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_compteurs_taches'),
+        ('tasks', '0006_statistiques_utilisateur'),
+    ]
+
+    operations = [
+        migrations.RunPython(remplir_compteurs_projets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.6 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_remplir_compteurs_projets'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # La table tasks_tache_assigne_a existe déjà : seul l'état des modèles change
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='TacheAssignation',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('tache', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='tasks.tache')),
+                        ('customuser', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                    ],
+                    options={
+                        'db_table': 'tasks_tache_assigne_a',
+                        'unique_together': {('tache', 'customuser')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='tache',
+                    name='assigne_a',
+                    field=models.ManyToManyField(related_name='taches_assignees', through='tasks.TacheAssignation', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+            database_operations=[],
+        ),
+        migrations.AddIndex(
+            model_name='tache',
+            index=models.Index(fields=['date_limite'], name='tache_date_limite_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tacheassignation',
+            index=models.Index(fields=['customuser', 'tache'], name='tache_assigne_user_tache_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-18 14:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_index_taches_assignations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tache',
+            name='date_modification',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='tache',
+            index=models.Index(fields=['date_modification', 'id'], name='tache_modification_id_idx'),
+        ),
+        migrations.CreateModel(
+            name='Suppression',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('modele', models.CharField(choices=[('tache', 'Tâche'), ('projet', 'Projet')], max_length=10)),
+                ('objet_id', models.IntegerField()),
+                ('date_suppression', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date_suppression', 'id'], name='suppression_date_id_idx')],
+            },
+        ),
+    ]
@@ -21,7 +21,21 @@ class Tache(models.Model):
     date_limite = models.DateField()
     statut = models.CharField(max_length=10, choices=STATUT_CHOICES, default='A_FAIRE')
     projet = models.ForeignKey(Projet, on_delete=models.CASCADE, related_name="taches")
-    assigne_a = models.ManyToManyField(CustomUser, related_name="taches_assignees")
+    assigne_a = models.ManyToManyField(CustomUser, related_name="taches_assignees", through='TacheAssignation')
+    # Dernière modification de la tâche ou de ses assignations (flux /api/sync/)
+    date_modification = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Ordre de la pagination par curseur (voir tasks/pagination.py)
+            models.Index(fields=['projet', 'date_limite', 'id'], name='tache_projet_date_id_idx'),
+            # Compteurs par statut (recalcul des compteurs de Projet)
+            models.Index(fields=['projet', 'statut'], name='tache_projet_statut_idx'),
+            # Filtres par intervalle de date limite
+            models.Index(fields=['date_limite'], name='tache_date_limite_idx'),
+            # Lecture incrémentale de /api/sync/ : (date_modification, id) > curseur
+            models.Index(fields=['date_modification', 'id'], name='tache_modification_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.titre} - {self.projet.nom} (Assigné à : {self.assigne_a})"
@@ -34,3 +48,73 @@ class Tache(models.Model):
         self.clean()
         super().save(*args, **kwargs)
 
+
+class TacheAssignation(models.Model):
+    """
+    Table de liaison de Tache.assigne_a (ex-table auto-créée tasks_tache_assigne_a),
+    déclarée explicitement pour pouvoir l'indexer dans le sens utilisateur -> tâche.
+    """
+    tache = models.ForeignKey(Tache, on_delete=models.CASCADE)
+    customuser = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'tasks_tache_assigne_a'
+        unique_together = [('tache', 'customuser')]
+        indexes = [
+            # Jointure inverse taches_assignees (filtre assigne_a, recalcul des statistiques)
+            models.Index(fields=['customuser', 'tache'], name='tache_assigne_user_tache_idx'),
+        ]
+
+
+
+class Suppression(models.Model):
+    """
+    Trace de la suppression d'une tâche ou d'un projet, pour que /api/sync/ signale
+    aux répliques les lignes disparues. Enregistrée par tasks/signals.py.
+    """
+    MODELES = [
+        ('tache', 'Tâche'),
+        ('projet', 'Projet'),
+    ]
+
+    modele = models.CharField(max_length=10, choices=MODELES)
+    objet_id = models.IntegerField()
+    date_suppression = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['date_suppression', 'id'], name='suppression_date_id_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.modele} {self.objet_id} supprimé le {self.date_suppression}"
+
+
+class StatistiqueUtilisateur(models.Model):
+    """
+    Compteurs de tâches assignées par utilisateur, lus par StatistiqueView.
+    Tenus à jour par tasks/signals.py, reconstruits par `manage.py rebuild_statistiques`.
+    """
+    utilisateur = models.OneToOneField(
+        CustomUser, on_delete=models.CASCADE, primary_key=True, related_name="statistique"
+    )
+    taches_totales = models.IntegerField(default=0)
+    taches_terminees = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.utilisateur} : {self.taches_terminees}/{self.taches_totales}"
+
+
+class CompletionJournaliere(models.Model):
+    """Nombre de tâches terminées d'un utilisateur, regroupées par date limite"""
+    utilisateur = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="completions")
+    jour = models.DateField()
+    nombre = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['utilisateur', 'jour'], name='completion_utilisateur_jour_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.utilisateur} - {self.jour} : {self.nombre}"
@@ -0,0 +1,118 @@
+from datetime import date
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+
+
+class TacheCursorPagination(CursorPagination):
+    """
+    Pagination par curseur (keyset) sur l'ordre (projet_id, date_limite, id).
+
+    Contrairement à CursorPagination de DRF, qui ne place le curseur que sur le
+    premier champ de tri puis saute les doublons par offset, le curseur contient
+    ici les trois valeurs de la dernière ligne vue : chaque page est une simple
+    lecture de l'index (projet_id, date_limite, id), quelle que soit sa profondeur.
+    """
+    ordering = ('projet_id', 'date_limite', 'id')
+    page_size = getattr(settings, 'TACHE_PAGE_SIZE', 50)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'TACHE_MAX_PAGE_SIZE', 500)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+
+        if self.cursor is None:
+            reverse = False
+        else:
+            reverse = self.cursor.reverse
+            queryset = queryset.filter(self._keyset_filter(self.cursor.position, reverse))
+
+        if reverse:
+            queryset = queryset.order_by(*['-' + champ for champ in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        # Une ligne de plus pour savoir s'il reste une page après celle-ci
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        if self.cursor is None:
+            self.has_next = has_more
+            self.has_previous = False
+        elif reverse:
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = True
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[-1], self.ordering)
+        else:
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[0], self.ordering)
+        else:
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def decode_cursor(self, request):
+        cursor = super().decode_cursor(request)
+        if cursor is None:
+            return None
+        # On valide la position dès maintenant pour renvoyer 404 plutôt qu'une 500
+        self._parse_position(cursor.position)
+        return cursor
+
+    def _get_position_from_instance(self, instance, ordering):
+        if isinstance(instance, dict):
+            valeurs = [instance[champ] for champ in ordering]
+        else:
+            valeurs = [getattr(instance, champ) for champ in ordering]
+        projet_id, date_limite, tache_id = valeurs
+        return f"{projet_id}|{date_limite.isoformat()}|{tache_id}"
+
+    def _parse_position(self, position):
+        try:
+            projet_id, date_limite, tache_id = position.split('|')
+            return int(projet_id), date.fromisoformat(date_limite), int(tache_id)
+        except (AttributeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _keyset_filter(self, position, reverse):
+        """Équivalent portable de (projet_id, date_limite, id) > (a, b, c)."""
+        projet_id, date_limite, tache_id = self._parse_position(position)
+        op = 'lt' if reverse else 'gt'
+        return (
+            Q(**{f'projet_id__{op}': projet_id})
+            | Q(projet_id=projet_id, **{f'date_limite__{op}': date_limite})
+            | Q(projet_id=projet_id, date_limite=date_limite, **{f'id__{op}': tache_id})
+        )
+
+
+class StatistiquePagination(PageNumberPagination):
+    """Pagination par numéro de page de /api/statistiques/ (tri libre via ?ordering=)"""
+    page_size = getattr(settings, 'STATISTIQUE_PAGE_SIZE', 50)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'STATISTIQUE_MAX_PAGE_SIZE', 500)
@@ -1,5 +1,6 @@
 from rest_framework import permissions
-from .models import Tache
+from .identite import carte_identite
+from .models import TacheAssignation
 from projects.models import Projet
 
 
@@ -11,14 +12,13 @@ class EstProprietaireDuProjet(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
 
-        # Récupérer le projet depuis la requête (POST, PUT, GET)
-        projet_id = request.data.get('projet') or view.kwargs.get('projet_id') or request.query_params.get('projet')
+        # Récupérer le projet depuis la requête (POST, PUT, GET) ; une création en masse envoie une liste
+        donnees = request.data if isinstance(request.data, dict) else {}
+        projet_id = donnees.get('projet') or view.kwargs.get('projet_id') or request.query_params.get('projet')
         if projet_id:
-            try:
-                projet = Projet.objects.get(id=projet_id)
-                return projet.proprietaire == request.user
-            except Projet.DoesNotExist:
-                return False
+            # Projet partagé avec le serializer et perform_create par la carte d'identité
+            projet = carte_identite(request).obtenir(Projet, projet_id)
+            return projet is not None and projet.proprietaire_id == request.user.pk
         return False
 
 
@@ -30,12 +30,10 @@ class EstProprietaireOuAssigne(permissions.BasePermission):
             return True
 
         # Pour les méthodes de modification (PUT, PATCH, DELETE), vérifier les permissions
-        # Si l'utilisateur est le propriétaire du projet
-        if obj.projet.proprietaire == request.user:
+        # Si l'utilisateur est le propriétaire du projet (comparé par id, sans charger le propriétaire)
+        obj.projet = carte_identite(request).obtenir(Projet, obj.projet_id)
+        if obj.projet.proprietaire_id == request.user.pk:
             return True
 
-        # Si l'utilisateur est assigné à la tâche
-        if request.user in obj.assigne_a.all():
-            return True
-
-        return False
\ No newline at end of file
+        # Si l'utilisateur est assigné à la tâche : EXISTS sur l'index unique (tache, customuser)
+        return TacheAssignation.objects.filter(tache_id=obj.pk, customuser_id=request.user.pk).exists()
\ No newline at end of file
@@ -0,0 +1,96 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.permissions import SAFE_METHODS
+
+from .cache import cache_partage
+
+# Alias de la réplique qui sert les lectures de la vue en cours, None pour la base principale
+_alias_lecture = ContextVar('alias_lecture', default=None)
+
+
+def cle_ecriture(user_id):
+    return f'repliques:ecriture:{user_id}'
+
+
+def lecture_sur_replique():
+    return _alias_lecture.get() is not None
+
+
+def ecriture_recente(partage, utilisateur):
+    """L'utilisateur a écrit il y a moins de REPLIQUES_RETARD_MAX secondes : ses lectures vont à la base principale"""
+    return utilisateur.is_authenticated and partage.get(cle_ecriture(utilisateur.pk)) is not None
+
+
+class RouteurRepliques:
+    """
+    DATABASE_ROUTERS : les lectures des vues LectureRepliqueMixin vont à une des
+    DATABASES_REPLIQUES, tout le reste (et toutes les écritures) à la base principale.
+    """
+
+    def db_for_read(self, model, **hints):
+        # Le cache partagé en base (DatabaseCache) doit être lu à jour, sur la principale
+        if model._meta.app_label == 'django_cache':
+            return None
+        return _alias_lecture.get()
+
+    def db_for_write(self, model, **hints):
+        # Même pour une instance lue sur une réplique
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        bases = {DEFAULT_DB_ALIAS, *settings.DATABASES_REPLIQUES}
+        if obj1._state.db in bases and obj2._state.db in bases:
+            return True
+        return None
+
+
+class LectureRepliqueMixin:
+    """
+    Vue DRF dont les lectures (GET, HEAD, OPTIONS) sont servies par une réplique tirée au
+    hasard, sauf pour un utilisateur qui vient d'écrire (EcrituresRecentesMiddleware).
+    Les écritures récentes n'étant vues de tous les workers que dans cache_partage(),
+    tout est lu sur la base principale sans cache partagé.
+    Authentification et permissions sont vérifiées avant, sur la base principale.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        self._routage = None
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            if self._routage is not None:
+                _alias_lecture.reset(self._routage)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not settings.DATABASES_REPLIQUES or request.method not in SAFE_METHODS:
+            return
+        partage = cache_partage()
+        if partage is not None and not ecriture_recente(partage, request.user):
+            self._routage = _alias_lecture.set(random.choice(settings.DATABASES_REPLIQUES))
+
+
+class EcrituresRecentesMiddleware:
+    """
+    Retient pendant REPLIQUES_RETARD_MAX secondes qu'un utilisateur a écrit (requête hors
+    GET, HEAD, OPTIONS réussie) : il relit ses propres écritures sur la base principale
+    tant qu'une réplique peut ne pas les avoir reçues.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        # request.user est posé par l'authentification DRF pendant la vue
+        utilisateur = getattr(request, 'user', None)
+        partage = cache_partage()
+        if (
+            settings.DATABASES_REPLIQUES and partage is not None and request.method not in SAFE_METHODS
+            and response.status_code < 400 and utilisateur is not None and utilisateur.is_authenticated
+        ):
+            partage.set(cle_ecriture(utilisateur.pk), True, timeout=settings.REPLIQUES_RETARD_MAX)
+        return response
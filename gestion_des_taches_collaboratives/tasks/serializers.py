@@ -1,16 +1,78 @@
 from rest_framework import serializers
-from .models import Tache
+from .models import Suppression, Tache
 
 from users.models import CustomUser
 
+from django.conf import settings
+from django.db.models import Prefetch
 from rest_framework import serializers
 from .models import Tache
+from projects.models import Projet
+from projects.serializer import ProjetSerializer
 from users.models import CustomUser
 from users.serializers import UserSerializer
+from .champs import ChampsDynamiquesMixin, colonnes
+from .identite import RelationCarteField
+
+
+def prefetch_assignes():
+    """Charge les assignés en une seule requête, limitée aux colonnes de UserSerializer"""
+    return Prefetch('assigne_a', queryset=CustomUser.objects.only(*UserSerializer.Meta.fields))
+
+
+def optimiser_taches(queryset, champs):
+    """Colonnes et préchargements nécessaires aux champs demandés (None : tous)"""
+    if champs is None:
+        return queryset.prefetch_related(prefetch_assignes())
+    # projet et date_limite servent au curseur de pagination
+    queryset = queryset.only(*colonnes(Tache, champs, 'projet', 'date_limite'))
+    if 'assigne_a_detail' in champs:
+        return queryset.prefetch_related(prefetch_assignes())
+    if 'assigne_a' in champs:
+        return queryset.prefetch_related(Prefetch('assigne_a', queryset=CustomUser.objects.only('id')))
+    return queryset
+
+
+def charger_assignes(donnees):
+    """Utilisateurs référencés par un lot de tâches, chargés en une seule requête"""
+    ids = set()
+    for item in donnees:
+        if hasattr(item, 'getlist'):
+            # Formulaire (QueryDict) : une valeur par assigné
+            assignes = item.getlist('assigne_a')
+        else:
+            assignes = item.get('assigne_a') if isinstance(item, dict) else None
+        if isinstance(assignes, list):
+            for pk in assignes:
+                try:
+                    ids.add(int(pk))
+                except (TypeError, ValueError):
+                    pass  # Signalé par la validation de l'élément
+    return CustomUser.objects.in_bulk(ids)
+
+
+class AssignePrechargeField(serializers.PrimaryKeyRelatedField):
+    """Résout les ids depuis context['assignes'] (voir charger_assignes) au lieu d'une requête par id"""
+
+    def to_internal_value(self, data):
+        if 'assignes' not in self.context:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return self.context['assignes'][int(data)]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
 
-class TacheSerializer(serializers.ModelSerializer):
-    # Utilisé pour l'écriture (création/modification)
-    assigne_a = serializers.PrimaryKeyRelatedField(
+
+class TacheSerializer(ChampsDynamiquesMixin, serializers.ModelSerializer):
+    # Projet déjà chargé par la permission EstProprietaireDuProjet
+    projet = RelationCarteField(queryset=Projet.objects.all())
+
+    # Utilisé pour l'écriture (création/modification) ; ids résolus par context['assignes'] si fourni
+    assigne_a = AssignePrechargeField(
         queryset=CustomUser.objects.all(),
         many=True
     )
@@ -23,6 +85,43 @@ class TacheSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+class CalendrierParametresSerializer(serializers.Serializer):
+    """Fenêtre demandée à /api/calendrier/ (bornes incluses)"""
+    start = serializers.DateField()
+    end = serializers.DateField()
+    statut = serializers.ChoiceField(choices=Tache.STATUT_CHOICES, required=False)
+
+    def validate(self, data):
+        if data['end'] < data['start']:
+            raise serializers.ValidationError("end doit être postérieur à start.")
+        if (data['end'] - data['start']).days >= settings.CALENDRIER_MAX_JOURS:
+            raise serializers.ValidationError(f"La fenêtre est limitée à {settings.CALENDRIER_MAX_JOURS} jours.")
+        return data
+
+
+class CalendrierSerializer(serializers.Serializer):
+    """Tâche réduite à ce qu'affiche le calendrier"""
+    id = serializers.IntegerField()
+    titre = serializers.CharField()
+    statut = serializers.CharField()
+    date_limite = serializers.DateField()
+    projet = serializers.IntegerField(source='projet_id')
+    projet_nom = serializers.CharField(source='projet__nom')
+
+
+class TacheStatutMasseSerializer(serializers.Serializer):
+    """Changement de statut d'une liste de tâches"""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=settings.TACHE_MASSE_MAX
+    )
+    statut = serializers.ChoiceField(choices=Tache.STATUT_CHOICES)
+
+
+class TacheCreationMasseSerializer(TacheSerializer):
+    """Un élément de création en masse : le projet est celui de l'URL"""
+    projet = serializers.PrimaryKeyRelatedField(read_only=True)
+
+
 
 
 
@@ -37,14 +136,65 @@ class StatistiqueSerializer(serializers.Serializer):
     taches_terminees_annuelles = serializers.IntegerField()
     taux_completion = serializers.FloatField()
     prime = serializers.CharField()
-    badge = serializers.SerializerMethodField()
-
-    def get_badge(self, obj):
-        if obj.taux_completion == 100:
-            return "Top Performer"
-        elif obj.taux_completion >= 90:
-            return "Très bon"
-        elif obj.taux_completion >= 70:
-            return "Bon"
-        else:
-            return "En progrès"
+    badge = serializers.CharField()
+
+
+class DashboardProjetSerializer(serializers.ModelSerializer):
+    """Résumé d'un projet pour le tableau de bord"""
+    taches_total = serializers.IntegerField(read_only=True)
+    progression = serializers.IntegerField(read_only=True)
+    membres = serializers.IntegerField(source='nombre_membres', read_only=True)
+
+    class Meta:
+        model = Projet
+        fields = ['id', 'nom', 'etat', 'date_fin', 'taches_total', 'taches_terminees', 'progression', 'membres']
+
+
+class DashboardSerializer(serializers.Serializer):
+    """Réponse de /api/dashboard/"""
+    nombre_projets = serializers.IntegerField()
+    projets = DashboardProjetSerializer(many=True)
+    taches = serializers.DictField(child=serializers.IntegerField())
+    echeances = CalendrierSerializer(many=True)
+    statistique = StatistiqueSerializer(allow_null=True)
+
+
+class UtilisateurAssignableSerializer(serializers.ModelSerializer):
+    """Utilisateur proposé à l'assignation d'une tâche"""
+
+    class Meta:
+        model = CustomUser
+        fields = ['id', 'username', 'role']
+
+
+class PageTachesSerializer(serializers.Serializer):
+    """Première page des tâches d'un projet, au format de la pagination par curseur"""
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+    results = TacheSerializer(many=True)
+
+
+class ProjetOverviewSerializer(serializers.Serializer):
+    """Réponse de /api/projets/<id>/overview/"""
+    projet = ProjetSerializer()
+    taches = PageTachesSerializer()
+    stats = serializers.DictField(child=serializers.IntegerField())
+    utilisateurs = UtilisateurAssignableSerializer(many=True)
+
+
+class SuppressionSerializer(serializers.ModelSerializer):
+    """Tâche ou projet supprimé, identifié par son modèle et son ancien id"""
+    id = serializers.IntegerField(source='objet_id')
+
+    class Meta:
+        model = Suppression
+        fields = ['modele', 'id', 'date_suppression']
+
+
+class SyncSerializer(serializers.Serializer):
+    """Réponse de /api/sync/"""
+    taches = TacheSerializer(many=True)
+    projets = ProjetSerializer(many=True)
+    suppressions = SuppressionSerializer(many=True)
+    curseur = serializers.CharField()
+    suite = serializers.BooleanField()
@@ -0,0 +1,158 @@
+from django.db.models import Count
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from projects.models import Projet
+from users.models import CustomUser
+from users.serializers import UserSerializer
+from .cache import invalider, invalider_utilisateurs
+from .evenements import publier
+from .models import Suppression, Tache
+from .statistiques import ajuster_compteurs_projet, ajuster_statistiques
+
+
+def _assignes(tache):
+    return list(tache.assigne_a.values_list('id', flat=True))
+
+
+@receiver(pre_save, sender=Tache)
+def memoriser_etat_precedent(sender, instance, **kwargs):
+    # Statut, date limite et projet avant modification, pour corriger les compteurs après la sauvegarde
+    instance._etat_precedent = None
+    if instance.pk:
+        instance._etat_precedent = (
+            Tache.objects.filter(pk=instance.pk).values_list('statut', 'date_limite', 'projet_id').first()
+        )
+
+
+@receiver(post_save, sender=Tache)
+def suivre_changement_statut(sender, instance, created, **kwargs):
+    precedent = getattr(instance, '_etat_precedent', None)
+    if created or precedent is None:
+        ajuster_compteurs_projet(instance.projet_id, instance.statut, 1)
+        invalider([instance.projet_id])
+        return
+    statut, date_limite, projet_id = precedent
+
+    if (statut, projet_id) != (instance.statut, instance.projet_id):
+        ajuster_compteurs_projet(projet_id, statut, -1)
+        ajuster_compteurs_projet(instance.projet_id, instance.statut, 1)
+        invalider([projet_id, instance.projet_id])
+
+    if (statut, date_limite) != (instance.statut, instance.date_limite):
+        assignes = _assignes(instance)
+        ajuster_statistiques(assignes, statut, date_limite, -1)
+        ajuster_statistiques(assignes, instance.statut, instance.date_limite, 1)
+        invalider()
+
+
+@receiver(post_save, sender=Tache)
+def annoncer_tache(sender, instance, created, **kwargs):
+    precedent = getattr(instance, '_etat_precedent', None)
+    if precedent is not None and precedent[2] != instance.projet_id:
+        # Tâche déplacée : les membres de l'ancien projet la voient partir
+        publier('tache.supprimee', precedent[2], instance.pk)
+    publier('tache.creee' if created else 'tache.modifiee', instance.projet_id, instance.pk)
+
+
+@receiver(pre_delete, sender=Tache)
+def suivre_suppression(sender, instance, **kwargs):
+    ajuster_compteurs_projet(instance.projet_id, instance.statut, -1)
+    invalider([instance.projet_id])
+    # Les lignes de assigne_a sont supprimées en cascade, sans m2m_changed
+    ajuster_statistiques(_assignes(instance), instance.statut, instance.date_limite, -1)
+
+
+@receiver(m2m_changed, sender=Tache.assigne_a.through)
+def suivre_assignations(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'post_add':
+        delta = 1
+    elif action in ('pre_remove', 'pre_clear'):
+        # remove() peut recevoir des ids non liés : on ne retire que les liens existants
+        delta = -1
+        liens = sender.objects.filter(**{'customuser_id' if reverse else 'tache_id': instance.pk})
+        if pk_set is not None:
+            liens = liens.filter(**{'tache_id__in' if reverse else 'customuser_id__in': pk_set})
+        pk_set = set(liens.values_list('tache_id' if reverse else 'customuser_id', flat=True))
+    else:
+        return
+
+    if not pk_set:
+        return
+    # Les assignations font partie de la tâche telle que la voient /api/sync/ et /api/evenements/
+    Tache.objects.filter(pk__in=pk_set if reverse else [instance.pk]).update(date_modification=timezone.now())
+    if reverse:
+        # instance est un utilisateur, pk_set contient des tâches
+        taches = list(Tache.objects.filter(pk__in=pk_set).values_list('id', 'projet_id'))
+        invalider({projet_id for _, projet_id in taches})
+        for tache_id, projet_id in taches:
+            publier('tache.modifiee', projet_id, tache_id)
+        groupes = (
+            Tache.objects.filter(pk__in=pk_set)
+            .values_list('statut', 'date_limite')
+            .annotate(nombre=Count('id'))
+            .order_by()
+        )
+        for statut, date_limite, nombre in groupes:
+            ajuster_statistiques([instance.pk], statut, date_limite, delta * nombre)
+    else:
+        invalider([instance.projet_id])
+        publier('tache.modifiee', instance.projet_id, instance.pk)
+        ajuster_statistiques(pk_set, instance.statut, instance.date_limite, delta)
+
+
+@receiver(post_save, sender=Projet)
+@receiver(post_delete, sender=Projet)
+def invalider_projet(sender, instance, **kwargs):
+    invalider([instance.pk])
+
+
+@receiver(post_save, sender=Projet)
+def annoncer_projet(sender, instance, created, **kwargs):
+    publier('projet.cree' if created else 'projet.modifie', instance.pk, instance.pk)
+
+
+@receiver(post_delete, sender=Tache)
+@receiver(post_delete, sender=Projet)
+def enregistrer_suppression(sender, instance, **kwargs):
+    # Trace lue par /api/sync/ ; les tâches d'un projet supprimé ont chacune la leur
+    if sender is Tache:
+        Suppression.objects.create(modele='tache', objet_id=instance.pk)
+        publier('tache.supprimee', instance.projet_id, instance.pk)
+    else:
+        Suppression.objects.create(modele='projet', objet_id=instance.pk)
+        publier('projet.supprime', instance.pk, instance.pk)
+
+
+@receiver(m2m_changed, sender=Projet.membres.through)
+def suivre_membres(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            projet_ids = [instance.pk]
+        else:
+            return
+    elif action == 'pre_clear':
+        # instance est un utilisateur : ses projets ne sont plus connus après le clear
+        projet_ids = list(instance.projets.values_list('id', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        projet_ids = pk_set
+    else:
+        return
+    Projet.objects.filter(pk__in=projet_ids).update(date_modification=timezone.now())
+    invalider(projet_ids)
+    for projet_id in projet_ids:
+        publier('projet.modifie', projet_id, projet_id)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalider_utilisateur(sender, instance, created, update_fields=None, **kwargs):
+    # Une connexion ne met à jour que last_login : rien d'exposé ne change
+    champs = set(UserSerializer.Meta.fields) if created or update_fields is None else set(update_fields)
+    if champs & set(UserSerializer.Meta.fields):
+        invalider_utilisateurs(statistiques=bool({'username', 'role'} & champs))
+
+
+@receiver(post_delete, sender=CustomUser)
+def invalider_utilisateur_supprime(sender, instance, **kwargs):
+    invalider_utilisateurs(statistiques=True)
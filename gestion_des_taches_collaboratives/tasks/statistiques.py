@@ -0,0 +1,225 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from projects.models import Projet
+from .cache import invalider
+from .models import CompletionJournaliere, StatistiqueUtilisateur, Tache
+
+
+def ajuster_statistiques(user_ids, statut, date_limite, delta):
+    """
+    Ajoute (delta=1) ou retire (delta=-1) une tâche des compteurs de plusieurs utilisateurs.
+    Nombre de requêtes constant, quel que soit le nombre d'utilisateurs.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    termine = statut == 'TERMINE'
+
+    with transaction.atomic():
+        StatistiqueUtilisateur.objects.bulk_create(
+            [StatistiqueUtilisateur(utilisateur_id=user_id) for user_id in user_ids],
+            ignore_conflicts=True
+        )
+        StatistiqueUtilisateur.objects.filter(utilisateur_id__in=user_ids).update(
+            taches_totales=F('taches_totales') + delta,
+            taches_terminees=F('taches_terminees') + (delta if termine else 0),
+        )
+
+        if termine:
+            CompletionJournaliere.objects.bulk_create(
+                [CompletionJournaliere(utilisateur_id=user_id, jour=date_limite) for user_id in user_ids],
+                ignore_conflicts=True
+            )
+            CompletionJournaliere.objects.filter(utilisateur_id__in=user_ids, jour=date_limite).update(
+                nombre=F('nombre') + delta
+            )
+
+
+def ajuster_statistiques_en_masse(increments):
+    """
+    Applique des deltas différents par utilisateur en un nombre constant de requêtes.
+    increments : {(user_id, statut, date_limite): delta}
+    """
+    totaux = {}
+    jours = Counter()
+    for (user_id, statut, date_limite), delta in increments.items():
+        total, terminees = totaux.get(user_id, (0, 0))
+        if statut == 'TERMINE':
+            terminees += delta
+            jours[user_id, date_limite] += delta
+        totaux[user_id] = (total + delta, terminees)
+    if not totaux:
+        return
+
+    def par_utilisateur(index):
+        return Case(
+            *[When(utilisateur_id=user_id, then=Value(valeurs[index])) for user_id, valeurs in totaux.items()],
+            default=Value(0), output_field=IntegerField()
+        )
+
+    with transaction.atomic():
+        StatistiqueUtilisateur.objects.bulk_create(
+            [StatistiqueUtilisateur(utilisateur_id=user_id) for user_id in totaux],
+            ignore_conflicts=True
+        )
+        StatistiqueUtilisateur.objects.filter(utilisateur_id__in=totaux).update(
+            taches_totales=F('taches_totales') + par_utilisateur(0),
+            taches_terminees=F('taches_terminees') + par_utilisateur(1),
+        )
+
+        if jours:
+            CompletionJournaliere.objects.bulk_create(
+                [CompletionJournaliere(utilisateur_id=user_id, jour=jour) for user_id, jour in jours],
+                ignore_conflicts=True
+            )
+            # Filtre large (produit utilisateurs x jours) : les lignes hors lot reçoivent + 0
+            CompletionJournaliere.objects.filter(
+                utilisateur_id__in={user_id for user_id, _ in jours},
+                jour__in={jour for _, jour in jours},
+            ).update(
+                nombre=F('nombre') + Case(
+                    *[When(utilisateur_id=user_id, jour=jour, then=Value(nombre)) for (user_id, jour), nombre in jours.items()],
+                    default=Value(0), output_field=IntegerField()
+                )
+            )
+
+
+def calculer_statistiques():
+    """Recalcule les compteurs à partir des tâches, en deux requêtes groupées"""
+    lien = Tache.assigne_a.through
+
+    totaux = {
+        ligne['customuser_id']: (ligne['total'], ligne['terminees'])
+        for ligne in lien.objects.values('customuser_id').annotate(
+            total=Count('id'),
+            terminees=Count('id', filter=Q(tache__statut='TERMINE')),
+        )
+    }
+    jours = {
+        (ligne['customuser_id'], ligne['tache__date_limite']): ligne['nombre']
+        for ligne in lien.objects.filter(tache__statut='TERMINE')
+        .values('customuser_id', 'tache__date_limite')
+        .annotate(nombre=Count('id'))
+    }
+    return totaux, jours
+
+
+def lire_statistiques():
+    """Compteurs actuellement stockés, au même format que calculer_statistiques()"""
+    totaux = {
+        user_id: (total, terminees)
+        for user_id, total, terminees in StatistiqueUtilisateur.objects.values_list(
+            'utilisateur_id', 'taches_totales', 'taches_terminees'
+        )
+        if total or terminees
+    }
+    jours = {
+        (user_id, jour): nombre
+        for user_id, jour, nombre in CompletionJournaliere.objects.values_list('utilisateur_id', 'jour', 'nombre')
+        if nombre
+    }
+    return totaux, jours
+
+
+def verifier_statistiques():
+    """Liste des écarts entre les compteurs stockés et les tâches réelles"""
+    attendus_totaux, attendus_jours = calculer_statistiques()
+    stockes_totaux, stockes_jours = lire_statistiques()
+
+    ecarts = []
+    for user_id in sorted(set(attendus_totaux) | set(stockes_totaux)):
+        attendu = attendus_totaux.get(user_id, (0, 0))
+        stocke = stockes_totaux.get(user_id, (0, 0))
+        if attendu != stocke:
+            ecarts.append(f"utilisateur {user_id} : (total, terminées) attendu {attendu}, stocké {stocke}")
+    for cle in sorted(set(attendus_jours) | set(stockes_jours)):
+        attendu = attendus_jours.get(cle, 0)
+        stocke = stockes_jours.get(cle, 0)
+        if attendu != stocke:
+            ecarts.append(f"utilisateur {cle[0]} le {cle[1]} : attendu {attendu}, stocké {stocke}")
+    return ecarts
+
+
+@transaction.atomic
+def reconstruire_statistiques():
+    """Remplace tous les compteurs par un recalcul complet (après un import en masse)"""
+    totaux, jours = calculer_statistiques()
+
+    StatistiqueUtilisateur.objects.all().delete()
+    CompletionJournaliere.objects.all().delete()
+    StatistiqueUtilisateur.objects.bulk_create(
+        [
+            StatistiqueUtilisateur(utilisateur_id=user_id, taches_totales=total, taches_terminees=terminees)
+            for user_id, (total, terminees) in totaux.items()
+        ],
+        batch_size=1000
+    )
+    CompletionJournaliere.objects.bulk_create(
+        [
+            CompletionJournaliere(utilisateur_id=user_id, jour=jour, nombre=nombre)
+            for (user_id, jour), nombre in jours.items()
+        ],
+        batch_size=1000
+    )
+    invalider()
+    return len(totaux), len(jours)
+
+
+def ajuster_compteurs_projet(projet_id, statut, delta):
+    """Ajoute (delta=1) ou retire (delta=-1) une tâche du compteur de son statut sur le projet"""
+    champ = Projet.COMPTEURS_TACHES[statut]
+    Projet.objects.filter(pk=projet_id).update(**{champ: F(champ) + delta, 'date_modification': timezone.now()})
+
+
+def ajuster_compteurs_projets_en_masse(deltas):
+    """Ajuste les compteurs de plusieurs projets en une requête. deltas : {(projet_id, statut): delta}"""
+    champs = {}
+    for statut, champ in Projet.COMPTEURS_TACHES.items():
+        cas = [
+            When(pk=projet_id, then=Value(delta))
+            for (projet_id, statut_delta), delta in deltas.items() if statut_delta == statut and delta
+        ]
+        if cas:
+            champs[champ] = F(champ) + Case(*cas, default=Value(0), output_field=IntegerField())
+    if champs:
+        Projet.objects.filter(pk__in={projet_id for projet_id, _ in deltas}).update(
+            **champs, date_modification=timezone.now()
+        )
+
+
+def calculer_compteurs_projets():
+    """Compteurs de chaque projet recalculés à partir des tâches, en une requête groupée"""
+    compteurs = {}
+    for ligne in Tache.objects.values('projet_id', 'statut').annotate(nombre=Count('id')).order_by():
+        compteurs.setdefault(ligne['projet_id'], {})[Projet.COMPTEURS_TACHES[ligne['statut']]] = ligne['nombre']
+    return compteurs
+
+
+@transaction.atomic
+def verifier_compteurs_projets(reparer=False):
+    """
+    Liste des écarts entre les compteurs stockés sur Projet et les tâches réelles.
+    Avec reparer=True, les projets en écart sont corrigés dans la même transaction.
+    """
+    champs = list(Projet.COMPTEURS_TACHES.values())
+    projets = Projet.objects.only('id', *champs).order_by('id')
+    if reparer:
+        # Verrouille les projets avant le recalcul pour ne pas écraser une écriture concurrente
+        projets = projets.select_for_update()
+    projets = list(projets)
+    attendus = calculer_compteurs_projets()
+
+    ecarts = []
+    for projet in projets:
+        attendu = {champ: attendus.get(projet.id, {}).get(champ, 0) for champ in champs}
+        stocke = {champ: getattr(projet, champ) for champ in champs}
+        if attendu != stocke:
+            ecarts.append(f"projet {projet.id} : attendu {attendu}, stocké {stocke}")
+            if reparer:
+                Projet.objects.filter(pk=projet.id).update(**attendu, date_modification=timezone.now())
+                invalider([projet.id])
+    return ecarts
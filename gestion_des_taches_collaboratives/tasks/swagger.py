@@ -51,7 +51,10 @@ tache_list_by_project_swagger = swagger_auto_schema(
 
 # Documentation TacheListCreateView - POST
 tache_create_swagger = swagger_auto_schema(
-    operation_description="Création d'une nouvelle tâche dans un projet",
+    operation_description=(
+        "Création d'une nouvelle tâche dans un projet. Sur /api/projets/<id>/taches/, le corps peut aussi "
+        "être une liste de tâches : réponse {crees, erreurs}, 207 si certains éléments sont invalides"
+    ),
     manual_parameters=[
         openapi.Parameter(
             'Authorization',
@@ -59,6 +62,13 @@ tache_create_swagger = swagger_auto_schema(
             description="Token JWT (format: Bearer <token>)",
             type=openapi.TYPE_STRING,
             required=True
+        ),
+        openapi.Parameter(
+            'atomique',
+            openapi.IN_QUERY,
+            description="Création en masse : avec 1, aucune tâche n'est créée si un élément est invalide",
+            type=openapi.TYPE_BOOLEAN,
+            required=False
         )
     ],
     request_body=openapi.Schema(
@@ -197,6 +207,42 @@ tache_delete_swagger = swagger_auto_schema(
     }
 )
 
+tache_statut_masse_swagger = swagger_auto_schema(
+    operation_description="Changement de statut d'une liste de tâches, en une seule mise à jour",
+    manual_parameters=[
+        openapi.Parameter(
+            'Authorization',
+            openapi.IN_HEADER,
+            description="Token JWT (format: Bearer <token>)",
+            type=openapi.TYPE_STRING,
+            required=True
+        )
+    ],
+    request_body=openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        required=['ids', 'statut'],
+        properties={
+            'ids': openapi.Schema(
+                type=openapi.TYPE_ARRAY,
+                items=openapi.Schema(type=openapi.TYPE_INTEGER),
+                description="IDs des tâches à modifier"
+            ),
+            'statut': openapi.Schema(
+                type=openapi.TYPE_STRING,
+                description="Nouveau statut",
+                enum=['A_FAIRE', 'EN_COURS', 'TERMINE']
+            ),
+        }
+    ),
+    responses={
+        200: 'IDs des tâches dont le statut a changé',
+        400: 'Données invalides',
+        401: 'Non authentifié',
+        403: "Certaines tâches ne sont pas modifiables par l'utilisateur (aucune n'est modifiée)",
+        404: 'Certaines tâches sont introuvables (aucune n\'est modifiée)'
+    }
+)
+
 # Documentation StatistiqueView
 statistique_list_swagger = swagger_auto_schema(
     operation_description="Récupération des statistiques utilisateur (tâches terminées, primes, etc.)",
@@ -266,4 +312,156 @@ tache_stats_by_project_swagger = swagger_auto_schema(
         404: 'Projet non trouvé',
         500: 'Erreur serveur lors du calcul des statistiques'
     }
-)
\ No newline at end of file
+)
+
+calendrier_swagger = swagger_auto_schema(
+    operation_description=(
+        "Tâches assignées à l'utilisateur ou appartenant à ses projets, dont la date limite "
+        "est comprise entre start et end (inclus)"
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'Authorization',
+            openapi.IN_HEADER,
+            description="Token JWT (format: Bearer <token>)",
+            type=openapi.TYPE_STRING,
+            required=True
+        ),
+        openapi.Parameter(
+            'start',
+            openapi.IN_QUERY,
+            description="Début de la fenêtre (YYYY-MM-DD)",
+            type=openapi.TYPE_STRING,
+            format=openapi.FORMAT_DATE,
+            required=True
+        ),
+        openapi.Parameter(
+            'end',
+            openapi.IN_QUERY,
+            description="Fin de la fenêtre (YYYY-MM-DD), au plus 92 jours après start",
+            type=openapi.TYPE_STRING,
+            format=openapi.FORMAT_DATE,
+            required=True
+        ),
+        openapi.Parameter(
+            'statut',
+            openapi.IN_QUERY,
+            description="Filtrer par statut",
+            type=openapi.TYPE_STRING,
+            enum=['A_FAIRE', 'EN_COURS', 'TERMINE'],
+            required=False
+        )
+    ],
+    responses={
+        200: 'Liste des tâches (id, titre, statut, date_limite, projet, projet_nom)',
+        400: 'Fenêtre invalide',
+        401: 'Non authentifié'
+    }
+)
+
+
+dashboard_swagger = swagger_auto_schema(
+    operation_description=(
+        "Tableau de bord de l'utilisateur connecté : nombre de projets et projets récents, "
+        "tâches assignées par statut, prochaines échéances et statistiques personnelles"
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'Authorization',
+            openapi.IN_HEADER,
+            description="Token JWT (format: Bearer <token>)",
+            type=openapi.TYPE_STRING,
+            required=True
+        )
+    ],
+    responses={
+        200: 'Tableau de bord',
+        401: 'Non authentifié'
+    }
+)
+
+projet_overview_swagger = swagger_auto_schema(
+    operation_description=(
+        "Vue d'ensemble d'un projet en une seule réponse : le projet, la première page de ses tâches "
+        "(le lien 'next' pointe vers /api/projets/<id>/taches/), ses statistiques et les utilisateurs "
+        "que l'utilisateur connecté peut assigner"
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'pk',
+            openapi.IN_PATH,
+            description="ID du projet",
+            type=openapi.TYPE_INTEGER,
+            required=True
+        ),
+        openapi.Parameter(
+            'page_size',
+            openapi.IN_QUERY,
+            description="Nombre de tâches de la première page",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        ),
+        openapi.Parameter(
+            'Authorization',
+            openapi.IN_HEADER,
+            description="Token JWT (format: Bearer <token>)",
+            type=openapi.TYPE_STRING,
+            required=True
+        )
+    ],
+    responses={
+        200: "Vue d'ensemble du projet",
+        401: 'Non authentifié',
+        404: 'Projet non trouvé'
+    }
+)
+
+sync_swagger = swagger_auto_schema(
+    operation_description=(
+        "Tâches et projets modifiés, et suppressions, depuis le curseur 'since'. "
+        "Rappeler avec le 'curseur' renvoyé ; 'suite' indique qu'il reste des lignes à lire. "
+        "Sans 'since', le flux part du début"
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'since',
+            openapi.IN_QUERY,
+            description="Curseur renvoyé par l'appel précédent",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'Authorization',
+            openapi.IN_HEADER,
+            description="Token JWT (format: Bearer <token>)",
+            type=openapi.TYPE_STRING,
+            required=True
+        )
+    ],
+    responses={
+        200: 'Modifications depuis le curseur',
+        400: 'Curseur invalide',
+        401: 'Non authentifié',
+        410: 'Curseur plus ancien que SYNC_RETENTION_JOURS : resynchroniser sans since'
+    }
+)
+
+ticket_flux_swagger = swagger_auto_schema(
+    operation_description=(
+        "Ticket à passer en ?ticket= à /api/evenements/ (EventSource ne peut pas envoyer d'en-tête). "
+        "Valable quelques secondes pour ce seul flux ; le flux se ferme à l'expiration du jeton d'accès"
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'Authorization',
+            openapi.IN_HEADER,
+            description="Token JWT (format: Bearer <token>)",
+            type=openapi.TYPE_STRING,
+            required=True
+        )
+    ],
+    responses={
+        201: 'Ticket du flux',
+        401: 'Non authentifié'
+    }
+)
@@ -0,0 +1,99 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from projects.models import Projet
+from projects.serializer import optimiser_projets
+from .models import Suppression, Tache
+from .serializers import optimiser_taches
+
+# Flux de /api/sync/ : requête de base et date qui ordonne ses lignes (index (date, id))
+FLUX = {
+    'taches': (lambda: optimiser_taches(Tache.objects.all(), None), 'date_modification'),
+    'projets': (lambda: optimiser_projets(Projet.objects.all(), None), 'date_modification'),
+    'suppressions': (lambda: Suppression.objects.all(), 'date_suppression'),
+}
+
+# Clé du curseur : date jusqu'à laquelle toutes les suppressions ont été lues
+A_JOUR = 'a_jour'
+
+
+class CurseurExpire(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "Curseur trop ancien, des suppressions ont été purgées : resynchroniser sans 'since'."
+    default_code = 'resynchroniser'
+
+
+def limite_retention():
+    """Date avant laquelle les suppressions peuvent avoir été purgées (purger_suppressions)"""
+    return timezone.now() - timedelta(days=settings.SYNC_RETENTION_JOURS)
+
+
+def encoder_curseur(positions, a_jour):
+    """Curseur opaque : dernière position (date, id) lue dans chaque flux, et date A_JOUR"""
+    donnees = {flux: [date.isoformat(), pk] for flux, (date, pk) in positions.items()}
+    donnees[A_JOUR] = a_jour.isoformat()
+    return base64.urlsafe_b64encode(json.dumps(donnees).encode()).decode()
+
+
+def decoder_curseur(curseur):
+    """
+    Positions du curseur. CurseurExpire s'il n'a pas lu des suppressions qui ont pu être
+    purgées depuis : le client ne saurait plus quelles lignes effacer.
+    """
+    if not curseur:
+        return {}
+    try:
+        donnees = json.loads(base64.urlsafe_b64decode(curseur.encode()))
+        positions = {
+            flux: (datetime.fromisoformat(position[0]), int(position[1]))
+            for flux, position in donnees.items() if flux in FLUX
+        }
+        if A_JOUR in donnees:
+            a_jour = datetime.fromisoformat(donnees[A_JOUR])
+        else:
+            # Curseur émis sans A_JOUR : la dernière suppression lue, ou la ligne la plus récente
+            a_jour = positions.get('suppressions', max(positions.values(), default=(None,)))[0]
+    except (AttributeError, TypeError, ValueError):
+        raise ValidationError({'since': "Curseur invalide."})
+    if a_jour is not None and a_jour < limite_retention():
+        raise CurseurExpire()
+    return positions
+
+
+def lire_modifications(positions, limite):
+    """
+    Lignes de chaque flux modifiées après sa position, au plus `limite` par flux, dans
+    l'ordre (date, id). Les lignes plus récentes que SYNC_MARGE_SECONDES sont laissées
+    au prochain appel : une transaction encore ouverte ne peut plus valider une ligne
+    derrière le curseur. Retourne (lignes par flux, nouvelles positions, reste-t-il des lignes,
+    date jusqu'à laquelle toutes les suppressions ont été lues).
+    """
+    horizon = timezone.now() - timedelta(seconds=settings.SYNC_MARGE_SECONDES)
+    lignes_par_flux, suivantes, reste, a_jour = {}, dict(positions), False, horizon
+    for flux, (source, champ) in FLUX.items():
+        lignes = source().filter(**{f'{champ}__lte': horizon})
+        if flux in positions:
+            date, pk = positions[flux]
+            # (date, id) > (d, i), avec une borne date >= d que l'index peut parcourir
+            lignes = lignes.filter(Q(**{f'{champ}__gte': date}) & (Q(**{f'{champ}__gt': date}) | Q(pk__gt=pk)))
+        lignes = list(lignes.order_by(champ, 'pk')[:limite + 1])
+        reste = reste or len(lignes) > limite
+        if flux == 'suppressions' and len(lignes) > limite:
+            a_jour = getattr(lignes[limite - 1], champ)
+        lignes = lignes[:limite]
+        if lignes:
+            suivantes[flux] = (getattr(lignes[-1], champ), lignes[-1].pk)
+        lignes_par_flux[flux] = lignes
+    return lignes_par_flux, suivantes, reste, a_jour
+
+
+def purger_suppressions():
+    """Supprime les suppressions plus anciennes que SYNC_RETENTION_JOURS ; retourne leur nombre"""
+    return Suppression.objects.filter(date_suppression__lt=limite_retention()).delete()[0]
@@ -0,0 +1,100 @@
+# tasks/tests/test_cache.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestCacheStatistiques:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def projets(self, user):
+        return [
+            Projet.objects.create(
+                nom=f'Projet {i}', description='Description',
+                date_fin=date.today() + timedelta(days=30), proprietaire=user
+            )
+            for i in range(2)
+        ]
+
+    def test_statistiques_servies_depuis_le_cache(self, api_client, user):
+        api_client.force_authenticate(user=user)
+        premiere = api_client.get(reverse('statistiques'))
+        seconde = api_client.get(reverse('statistiques'))
+
+        assert premiere['X-Cache'] == 'MISS'
+        assert seconde['X-Cache'] == 'HIT'
+        assert seconde.data == premiere.data
+
+    def test_parametres_dans_la_cle(self, api_client, user):
+        api_client.force_authenticate(user=user)
+        api_client.get(reverse('statistiques'))
+        response = api_client.get(reverse('statistiques'), {'role': 'etudiant'})
+
+        assert response['X-Cache'] == 'MISS'
+
+    def test_ecriture_invalide_le_projet_concerne(
+            self, api_client, user, projets, django_capture_on_commit_callbacks):
+        api_client.force_authenticate(user=user)
+        url_a = reverse('tache-stats-projet', kwargs={'projet_id': projets[0].id})
+        url_b = reverse('tache-stats-projet', kwargs={'projet_id': projets[1].id})
+        api_client.get(url_a)
+        api_client.get(url_b)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(reverse('projet-tache-list', kwargs={'projet_id': projets[0].id}), {
+                'titre': 'Nouvelle', 'description': 'Description', 'date_limite': date.today().isoformat(),
+                'statut': 'TERMINE', 'projet': projets[0].id, 'assigne_a': [user.id],
+            }, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+
+        apres_a = api_client.get(url_a)
+        assert apres_a['X-Cache'] == 'MISS'
+        assert apres_a.data['termine'] == 1
+        assert api_client.get(url_b)['X-Cache'] == 'HIT'
+
+    def test_modification_tache_invalide_statistiques(
+            self, api_client, user, projets, django_capture_on_commit_callbacks):
+        tache = Tache.objects.create(
+            titre='Tâche', description='Description', date_limite=date.today(), projet=projets[0]
+        )
+        tache.assigne_a.add(user)
+        api_client.force_authenticate(user=user)
+        avant = api_client.get(reverse('statistiques'), {'username': user.username})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.patch(reverse('tache-detail', kwargs={'pk': tache.pk}), {'statut': 'TERMINE'}, format='json')
+        apres = api_client.get(reverse('statistiques'), {'username': user.username})
+
+        assert avant.data['results'][0]['taches_terminees'] == 0
+        assert apres['X-Cache'] == 'MISS'
+        assert apres.data['results'][0]['taches_terminees'] == 1
+
+    def test_compteurs_exposes_aux_admins(self, api_client, user):
+        admin = get_user_model().objects.create_superuser(username='admin', password='p', email='admin@test.com')
+        api_client.force_authenticate(user=user)
+        api_client.get(reverse('statistiques'))
+        api_client.get(reverse('statistiques'))
+        assert api_client.get(reverse('cache-stats')).status_code == status.HTTP_403_FORBIDDEN
+
+        api_client.force_authenticate(user=admin)
+        response = api_client.get(reverse('cache-stats'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['hits'] >= 1
+        assert response.data['misses'] >= 1
+        assert response.data['max_entries'] == 1000
@@ -0,0 +1,108 @@
+# tasks/tests/test_calendrier.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestCalendrier:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def prof(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def etudiant(self):
+        return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+    @pytest.fixture
+    def projets(self, prof, etudiant):
+        return {
+            proprietaire.username: Projet.objects.create(
+                nom=f'Projet de {proprietaire.username}', description='Description',
+                date_fin=date.today() + timedelta(days=30), proprietaire=proprietaire
+            )
+            for proprietaire in (prof, etudiant)
+        }
+
+    def _tache(self, projet, jours, assignes=(), statut='A_FAIRE'):
+        tache = Tache.objects.create(
+            titre=f'Tâche J+{jours}', description='Description', statut=statut,
+            date_limite=date.today() + timedelta(days=jours), projet=projet
+        )
+        tache.assigne_a.add(*assignes)
+        return tache
+
+    def _fenetre(self, debut=0, fin=30, **params):
+        return {
+            'start': (date.today() + timedelta(days=debut)).isoformat(),
+            'end': (date.today() + timedelta(days=fin)).isoformat(),
+            **params,
+        }
+
+    def test_taches_assignees_ou_possedees(self, api_client, prof, etudiant, projets):
+        possedee = self._tache(projets['prof1'], 1)
+        assignee = self._tache(projets['etu1'], 2, [prof])
+        assignee_et_possedee = self._tache(projets['prof1'], 3, [prof, etudiant])
+        self._tache(projets['etu1'], 4, [etudiant])
+        self._tache(projets['prof1'], 40)
+        api_client.force_authenticate(user=prof)
+
+        response = api_client.get(reverse('calendrier'), self._fenetre())
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [t['id'] for t in response.data] == [possedee.id, assignee.id, assignee_et_possedee.id]
+        assert response.data[1] == {
+            'id': assignee.id, 'titre': 'Tâche J+2', 'statut': 'A_FAIRE',
+            'date_limite': assignee.date_limite.isoformat(),
+            'projet': projets['etu1'].id, 'projet_nom': 'Projet de etu1',
+        }
+
+    def test_une_seule_requete(self, api_client, prof, projets):
+        for jours in range(10):
+            self._tache(projets['prof1'], jours, [prof])
+        api_client.force_authenticate(user=prof)
+
+        with CaptureQueriesContext(connection) as requetes:
+            response = api_client.get(reverse('calendrier'), self._fenetre())
+        assert len(response.data) == 10
+        assert len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']]) == 1
+
+    def test_filtre_statut(self, api_client, prof, projets):
+        self._tache(projets['prof1'], 1)
+        terminee = self._tache(projets['prof1'], 2, statut='TERMINE')
+        api_client.force_authenticate(user=prof)
+
+        response = api_client.get(reverse('calendrier'), self._fenetre(statut='TERMINE'))
+        assert [t['id'] for t in response.data] == [terminee.id]
+
+    @pytest.mark.parametrize('params', [
+        {},
+        {'start': '2025-01-01'},
+        {'start': '2025-02-01', 'end': '2025-01-01'},
+        {'start': '2025-01-01', 'end': '2026-01-01'},
+    ])
+    def test_fenetre_invalide(self, api_client, prof, params):
+        api_client.force_authenticate(user=prof)
+        assert api_client.get(reverse('calendrier'), params).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_etag_propre_a_l_utilisateur(self, api_client, prof, etudiant, projets):
+        api_client.force_authenticate(user=prof)
+        etag = api_client.get(reverse('calendrier'), self._fenetre())['ETag']
+
+        api_client.force_authenticate(user=etudiant)
+        response = api_client.get(reverse('calendrier'), self._fenetre(), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,114 @@
+# tasks/tests/test_champs.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestChampsDynamiques:
+    @pytest.fixture
+    def api_client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def projet(self, user):
+        projet = Projet.objects.create(
+            nom='Projet', description='Description longue',
+            date_fin=date.today() + timedelta(days=30), proprietaire=user
+        )
+        projet.membres.add(user)
+        return projet
+
+    @pytest.fixture
+    def taches(self, projet, user):
+        taches = []
+        for i in range(3):
+            tache = Tache.objects.create(
+                titre=f'Tâche {i}', description='Description longue',
+                date_limite=date.today() + timedelta(days=i), projet=projet
+            )
+            tache.assigne_a.add(user)
+            taches.append(tache)
+        return taches
+
+    def _requetes(self, api_client, url, params):
+        with CaptureQueriesContext(connection) as requetes:
+            response = api_client.get(url, params)
+        assert response.status_code == status.HTTP_200_OK
+        return response, [q['sql'] for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']]
+
+    def test_fields_taches(self, api_client, taches):
+        response, requetes = self._requetes(api_client, reverse('tache-list'), {'fields': 'id,titre,statut'})
+
+        assert set(response.data['results'][0]) == {'id', 'titre', 'statut'}
+        assert len(requetes) == 1
+        assert '"description"' not in requetes[0]
+
+    def test_exclude_taches(self, api_client, taches, user):
+        response, requetes = self._requetes(
+            api_client, reverse('tache-list'), {'exclude': 'description,assigne_a_detail'}
+        )
+
+        resultat = response.data['results'][0]
+        assert 'description' not in resultat and 'assigne_a_detail' not in resultat
+        assert resultat['assigne_a'] == [user.id]
+        assert len(requetes) == 2
+        assert '"email"' not in requetes[1]
+
+    def test_sans_parametre_inchange(self, api_client, taches, user):
+        response = api_client.get(reverse('tache-detail', kwargs={'pk': taches[0].pk}))
+        assert response.data['description'] == 'Description longue'
+        assert response.data['assigne_a_detail'][0]['username'] == user.username
+
+    def test_pagination_avec_fields(self, api_client, taches):
+        response = api_client.get(reverse('tache-list'), {'fields': 'id', 'page_size': 2})
+        suite = api_client.get(response.data['next'])
+
+        assert [t['id'] for t in response.data['results'] + suite.data['results']] == [t.id for t in taches]
+
+    def test_fields_projets(self, api_client, projet, taches, user):
+        response, requetes = self._requetes(
+            api_client, reverse('projet-list'), {'fields': 'id,nom,proprietaire,progression'}
+        )
+
+        assert response.data == [{
+            'id': projet.id, 'nom': 'Projet',
+            'proprietaire': {'id': user.id, 'username': user.username}, 'progression': 0,
+        }]
+        assert len(requetes) == 1
+        assert '"description"' not in requetes[0]
+        assert '"email"' not in requetes[0]
+
+    def test_membres_sans_details(self, api_client, projet, user):
+        response, requetes = self._requetes(
+            api_client, reverse('projet-detail', kwargs={'pk': projet.id}), {'exclude': 'membres_details'}
+        )
+
+        assert response.data['membres'] == [user.id]
+        assert 'membres_details' not in response.data
+        assert len(requetes) == 2
+        assert '"email"' not in requetes[1]
+
+    def test_ecriture_non_restreinte(self, api_client, taches):
+        url = reverse('tache-detail', kwargs={'pk': taches[0].pk}) + '?fields=id'
+        response = api_client.patch(url, {'statut': 'EN_COURS'}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['statut'] == 'EN_COURS'
+        assert 'titre' in response.data
@@ -0,0 +1,92 @@
+# tasks/tests/test_compteurs_projets.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestCompteursProjet:
+    """Les compteurs a_faire / en_cours / terminees de Projet suivent les tâches"""
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def projets(self, user):
+        return [
+            Projet.objects.create(
+                nom=f'Projet {i}', description='Description',
+                date_fin=date.today() + timedelta(days=30), proprietaire=user
+            )
+            for i in range(2)
+        ]
+
+    def _tache(self, projet, statut='A_FAIRE'):
+        return Tache.objects.create(
+            titre='Tâche', description='Description', date_limite=date.today(), statut=statut, projet=projet
+        )
+
+    def _compteurs(self, projet):
+        projet.refresh_from_db()
+        return projet.taches_a_faire, projet.taches_en_cours, projet.taches_terminees
+
+    def test_creation_transition_suppression(self, projets):
+        tache = self._tache(projets[0])
+        self._tache(projets[0], statut='TERMINE')
+        assert self._compteurs(projets[0]) == (1, 0, 1)
+
+        tache.statut = 'EN_COURS'
+        tache.save()
+        assert self._compteurs(projets[0]) == (0, 1, 1)
+
+        tache.projet = projets[1]
+        tache.save()
+        assert self._compteurs(projets[0]) == (0, 0, 1)
+        assert self._compteurs(projets[1]) == (0, 1, 0)
+
+        tache.delete()
+        assert self._compteurs(projets[1]) == (0, 0, 0)
+        assert projets[0].progression == 100
+
+    def test_sauvegarde_projet_conserve_compteurs(self, projets):
+        projet = Projet.objects.get(pk=projets[0].pk)  # instance lue avant l'ajout des tâches
+        self._tache(projets[0])
+        self._tache(projets[0])
+
+        projet.nom = 'Renommé'
+        projet.save()
+        assert self._compteurs(projet) == (2, 0, 0)
+
+    def test_liste_projets_expose_progression(self, user, projets):
+        self._tache(projets[0])
+        self._tache(projets[0], statut='TERMINE')
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get(reverse('projet-list'))
+
+        ligne = next(p for p in response.data if p['id'] == projets[0].id)
+        assert ligne['taches_a_faire'] == 1
+        assert ligne['taches_terminees'] == 1
+        assert ligne['taches_total'] == 2
+        assert ligne['progression'] == 50
+
+    def test_commande_detecte_et_repare(self, projets):
+        self._tache(projets[0], statut='TERMINE')
+        Projet.objects.filter(pk=projets[0].pk).update(taches_terminees=5)
+
+        with pytest.raises(CommandError):
+            call_command('rebuild_compteurs_projets', '--check')
+        call_command('rebuild_compteurs_projets')
+
+        assert self._compteurs(projets[0]) == (0, 0, 1)
+        call_command('rebuild_compteurs_projets', '--check')
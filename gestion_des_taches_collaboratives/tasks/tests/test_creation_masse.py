@@ -0,0 +1,148 @@
+# tasks/tests/test_creation_masse.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+from tasks.statistiques import verifier_compteurs_projets, verifier_statistiques
+
+
+@pytest.mark.django_db
+class TestCreationMasse:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def etudiants(self):
+        return [
+            get_user_model().objects.create_user(username=f'etu{i}', password='p', email=f'etu{i}@test.com')
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def projet(self, user):
+        return Projet.objects.create(
+            nom='Projet', description='Description',
+            date_fin=date.today() + timedelta(days=30), proprietaire=user
+        )
+
+    def _taches(self, nombre, etudiants):
+        return [
+            {
+                'titre': f'Tâche {i}', 'description': 'Description',
+                'date_limite': (date.today() + timedelta(days=i % 4)).isoformat(),
+                'statut': ['A_FAIRE', 'EN_COURS', 'TERMINE'][i % 3],
+                'assigne_a': [etudiant.id for etudiant in etudiants[:i % 3 + 1]],
+            }
+            for i in range(nombre)
+        ]
+
+    def _poster(self, api_client, projet, donnees, **params):
+        url = reverse('projet-tache-list', kwargs={'projet_id': projet.id})
+        if params:
+            url += '?' + '&'.join(f'{cle}={valeur}' for cle, valeur in params.items())
+        return api_client.post(url, donnees, format='json')
+
+    def test_creation_et_compteurs(self, api_client, user, projet, etudiants):
+        api_client.force_authenticate(user=user)
+        response = self._poster(api_client, projet, self._taches(30, etudiants))
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data['crees']) == 30
+        assert response.data['erreurs'] == []
+        assert response.data['crees'][2]['assigne_a'] == [etudiant.id for etudiant in etudiants]
+        assert Tache.objects.filter(projet=projet).count() == 30
+        assert verifier_compteurs_projets() == []
+        assert verifier_statistiques() == []
+
+    def test_nombre_de_requetes_constant(self, api_client, user, projet, etudiants):
+        api_client.force_authenticate(user=user)
+
+        def compter(nombre):
+            with CaptureQueriesContext(connection) as requetes:
+                assert self._poster(api_client, projet, self._taches(nombre, etudiants)).status_code == 201
+            return len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+        assert compter(5) == compter(60)
+
+    def test_sans_ids_renvoyes(self, api_client, user, projet, etudiants, monkeypatch):
+        # Comme MySQL : ids relus après l'insertion, toujours sans requête par tâche
+        monkeypatch.setattr(type(connection.features), 'can_return_rows_from_bulk_insert', False)
+        autre = Projet.objects.create(
+            nom='Autre', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=user
+        )
+        Tache.objects.create(titre='Avant', description='Description', date_limite=date.today(), projet=autre)
+        api_client.force_authenticate(user=user)
+
+        def compter(nombre):
+            with CaptureQueriesContext(connection) as requetes:
+                response = self._poster(api_client, projet, self._taches(nombre, etudiants))
+            assert response.status_code == status.HTTP_201_CREATED
+            return response, len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+        response, requetes = compter(60)
+        assert requetes == compter(5)[1]
+        ids = [tache['id'] for tache in response.data['crees']]
+        assert ids == sorted(Tache.objects.filter(projet=projet).values_list('id', flat=True))[:60]
+        assert [Tache.objects.get(pk=pk).titre for pk in ids[:3]] == ['Tâche 0', 'Tâche 1', 'Tâche 2']
+        assert response.data['crees'][2]['assigne_a'] == [etudiant.id for etudiant in etudiants]
+        assert verifier_compteurs_projets() == []
+        assert verifier_statistiques() == []
+
+    def test_erreurs_par_element(self, api_client, user, projet, etudiants):
+        api_client.force_authenticate(user=user)
+        donnees = self._taches(3, etudiants)
+        donnees[1]['assigne_a'] = [999]
+        donnees[2].pop('titre')
+        donnees.append('pas une tâche')
+
+        response = self._poster(api_client, projet, donnees)
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert len(response.data['crees']) == 1
+        assert [erreur['index'] for erreur in response.data['erreurs']] == [1, 2, 3]
+        assert 'assigne_a' in response.data['erreurs'][0]['erreurs']
+        assert 'titre' in response.data['erreurs'][1]['erreurs']
+        assert verifier_compteurs_projets() == []
+
+    def test_mode_atomique(self, api_client, user, projet, etudiants):
+        api_client.force_authenticate(user=user)
+        donnees = self._taches(3, etudiants)
+        donnees[1]['statut'] = 'INCONNU'
+
+        response = self._poster(api_client, projet, donnees, atomique=1)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['erreurs'][0]['index'] == 1
+        assert not Tache.objects.exists()
+
+    def test_assigne_en_double(self, api_client, user, projet, etudiants):
+        api_client.force_authenticate(user=user)
+        donnees = self._taches(1, etudiants)
+        donnees[0]['assigne_a'] = [etudiants[0].id, str(etudiants[0].id)]
+
+        response = self._poster(api_client, projet, donnees)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['crees'][0]['assigne_a'] == [etudiants[0].id]
+        assert verifier_statistiques() == []
+
+    def test_reserve_au_proprietaire(self, api_client, projet, etudiants):
+        api_client.force_authenticate(user=etudiants[0])
+        response = self._poster(api_client, projet, self._taches(2, etudiants))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert not Tache.objects.exists()
@@ -0,0 +1,107 @@
+# tasks/tests/test_dashboard.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks import views
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestDashboard:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def prof(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def etudiant(self):
+        return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+    def _projet(self, proprietaire, nom, membres=()):
+        projet = Projet.objects.create(
+            nom=nom, description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=proprietaire
+        )
+        projet.membres.add(*membres)
+        return projet
+
+    def _tache(self, projet, jours, assignes=(), statut='A_FAIRE'):
+        tache = Tache.objects.create(
+            titre=f'Tâche J+{jours}', description='Description', statut=statut,
+            date_limite=date.today() + timedelta(days=jours), projet=projet
+        )
+        tache.assigne_a.add(*assignes)
+        return tache
+
+    def test_contenu(self, api_client, prof, etudiant):
+        possede = self._projet(prof, 'Possédé', [etudiant])
+        membre = self._projet(etudiant, 'Membre', [prof])
+        self._projet(etudiant, 'Étranger')
+        self._tache(possede, 3, [etudiant], 'TERMINE')
+        proche = self._tache(possede, 1)
+        assignee = self._tache(membre, 2, [prof])
+        self._tache(membre, -1, [prof], 'EN_COURS')
+        api_client.force_authenticate(user=prof)
+
+        response = api_client.get(reverse('dashboard'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['nombre_projets'] == 2
+        assert [p['nom'] for p in response.data['projets']] == ['Membre', 'Possédé']
+        assert response.data['projets'][1] == {
+            'id': possede.id, 'nom': 'Possédé', 'etat': possede.etat, 'date_fin': possede.date_fin.isoformat(),
+            'taches_total': 2, 'taches_terminees': 1, 'progression': 50, 'membres': 1,
+        }
+        assert response.data['taches'] == {'a_faire': 1, 'en_cours': 1, 'termine': 0, 'total': 2}
+        assert [t['id'] for t in response.data['echeances']] == [proche.id, assignee.id]
+        assert response.data['statistique']['utilisateur'] == 'prof1'
+        assert response.data['statistique']['taches_totales'] == 2
+
+    def test_nombre_de_requetes_fixe(self, api_client, prof, etudiant):
+        api_client.force_authenticate(user=prof)
+
+        def compter():
+            with CaptureQueriesContext(connection) as requetes:
+                assert api_client.get(reverse('dashboard')).status_code == status.HTTP_200_OK
+            return len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+        avant = compter()
+        for i in range(8):
+            projet = self._projet(prof, f'Projet {i}', [etudiant])
+            for jours in range(3):
+                self._tache(projet, jours, [prof, etudiant])
+        assert compter() == avant == 5
+
+    def test_utilisateur_sans_donnees(self, api_client, etudiant):
+        api_client.force_authenticate(user=etudiant)
+        response = api_client.get(reverse('dashboard'))
+
+        assert response.data['nombre_projets'] == 0
+        assert response.data['taches']['total'] == 0
+        assert response.data['echeances'] == []
+        assert response.data['statistique']['taux_completion'] == 0
+
+    def test_etag_change_avec_la_date(self, api_client, etudiant, monkeypatch):
+        api_client.force_authenticate(user=etudiant)
+        self._tache(self._projet(etudiant, 'Projet'), 0, [etudiant])
+        etag = api_client.get(reverse('dashboard'))['ETag']
+        assert api_client.get(reverse('dashboard'), HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        # Le lendemain, sans aucune écriture, l'échéance du jour est passée
+        demain = timezone.now() + timedelta(days=1)
+        monkeypatch.setattr(views, 'now', lambda: demain)
+        response = api_client.get(reverse('dashboard'), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['echeances'] == []
@@ -0,0 +1,175 @@
+# tasks/tests/test_etag.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from Gestion_des_taches_collaboratives import settings as reglages
+from projects.models import Projet
+from tasks.models import Tache
+from users.admin import CustomUserAdmin
+
+
+@pytest.mark.django_db
+class TestETag:
+    @pytest.fixture
+    def api_client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def projets(self, user):
+        return [
+            Projet.objects.create(
+                nom=f'Projet {i}', description='Description',
+                date_fin=date.today() + timedelta(days=30), proprietaire=user
+            )
+            for i in range(2)
+        ]
+
+    @pytest.fixture
+    def tache(self, projets, user):
+        tache = Tache.objects.create(
+            titre='Tâche', description='Description', date_limite=date.today(), projet=projets[0]
+        )
+        tache.assigne_a.add(user)
+        return tache
+
+    def _revalider(self, api_client, url, etag, **params):
+        return api_client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+    def test_304_sans_requete(self, api_client, projets, tache):
+        url = reverse('projet-tache-list', kwargs={'projet_id': projets[0].id})
+        premiere = api_client.get(url)
+        assert premiere.status_code == status.HTTP_200_OK
+        assert premiere['ETag'].startswith('"')
+
+        with CaptureQueriesContext(connection) as requetes:
+            response = self._revalider(api_client, url, premiere['ETag'])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == premiere['ETag']
+        assert not response.content
+        assert [q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']] == []
+
+    def test_etag_depend_des_parametres(self, api_client, projets, tache):
+        url = reverse('tache-list')
+        etag = api_client.get(url, {'projet': projets[0].id})['ETag']
+        assert api_client.get(url, {'projet': projets[1].id})['ETag'] != etag
+        assert self._revalider(api_client, url, f'W/{etag}', projet=projets[0].id).status_code == 304
+
+    def test_modification_change_seulement_le_projet_concerne(
+            self, api_client, projets, tache, django_capture_on_commit_callbacks):
+        url_a = reverse('projet-tache-list', kwargs={'projet_id': projets[0].id})
+        url_b = reverse('projet-tache-list', kwargs={'projet_id': projets[1].id})
+        etag_a = api_client.get(url_a)['ETag']
+        etag_b = api_client.get(url_b)['ETag']
+        etag_detail = api_client.get(reverse('tache-detail', kwargs={'pk': tache.pk}))['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.patch(reverse('tache-detail', kwargs={'pk': tache.pk}), {'statut': 'TERMINE'}, format='json')
+
+        response = self._revalider(api_client, url_a, etag_a)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['statut'] == 'TERMINE'
+        assert self._revalider(api_client, url_b, etag_b).status_code == status.HTTP_304_NOT_MODIFIED
+        detail = self._revalider(api_client, reverse('tache-detail', kwargs={'pk': tache.pk}), etag_detail)
+        assert detail.status_code == status.HTTP_200_OK
+
+    def test_assignation_change_l_etag(self, api_client, projets, tache, django_capture_on_commit_callbacks):
+        url = reverse('projet-tache-list', kwargs={'projet_id': projets[0].id})
+        autre = get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+        etag = api_client.get(url)['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            autre.taches_assignees.add(tache)
+        assert self._revalider(api_client, url, etag).status_code == status.HTTP_200_OK
+
+    def test_projet_et_membres(self, api_client, projets, django_capture_on_commit_callbacks):
+        url = reverse('projet-detail', kwargs={'pk': projets[0].id})
+        autre = get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+        etag = api_client.get(url)['ETag']
+        etag_liste = api_client.get(reverse('projet-list'))['ETag']
+        assert self._revalider(api_client, url, etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            projets[0].membres.add(autre)
+        response = self._revalider(api_client, url, etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['membres'] == [autre.id]
+        assert self._revalider(api_client, reverse('projet-list'), etag_liste).status_code == 200
+
+    def test_utilisateurs(self, api_client, user, django_capture_on_commit_callbacks):
+        url = reverse('user_list')
+        etag = api_client.get(url)['ETag']
+
+        # Une connexion ne modifie que last_login, qui n'est pas exposé
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save(update_fields=['last_login'])
+        assert self._revalider(api_client, url, etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.nom = 'Diop'
+            user.save()
+        response = self._revalider(api_client, url, etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]['nom'] == 'Diop'
+
+    def test_activation_par_l_admin(self, api_client, rf, django_capture_on_commit_callbacks):
+        en_attente = get_user_model().objects.create_user(
+            username='prof2', password='p', email='prof2@test.com', role='enseignant', is_active=False
+        )
+        url = reverse('user_list')
+        etag = api_client.get(url)['ETag']
+
+        admin = CustomUserAdmin(get_user_model(), AdminSite())
+        admin.message_user = lambda *args, **kwargs: None
+        with django_capture_on_commit_callbacks(execute=True):
+            admin.activate_users(rf.post('/'), get_user_model().objects.filter(pk=en_attente.pk))
+
+        response = self._revalider(api_client, url, etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert next(u for u in response.data if u['id'] == en_attente.id)['is_active'] is True
+
+    def test_pas_d_etag_sur_les_erreurs(self, api_client):
+        response = api_client.get(reverse('tache-detail', kwargs={'pk': 999}))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert 'ETag' not in response
+
+
+@pytest.mark.django_db
+class TestSansCachePartage:
+    def test_pas_d_etag(self, settings):
+        # Versions propres au processus : un autre worker pourrait répondre 304 sur des données périmées
+        settings.CACHE_PARTAGE = None
+        user = get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(reverse('projet-list'))
+        assert response.status_code == status.HTTP_200_OK
+        assert 'ETag' not in response
+
+
+@pytest.mark.django_db
+class TestCachePartageParDefaut:
+    def test_table_de_la_base(self, settings):
+        # Configuration livrée (sans REDIS_URL) : DatabaseCache, table créée par createcachetable
+        settings.CACHES = {**settings.CACHES, 'partage': reglages.CACHES['partage']}
+        user = get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        etag = client.get(reverse('projet-list'))['ETag']
+        assert client.get(reverse('projet-list'), HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
@@ -0,0 +1,263 @@
+# tasks/tests/test_evenements.py
+import asyncio
+import json
+import pytest
+from asgiref.sync import sync_to_async
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, Client
+from rest_framework.test import APIClient
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from projects.models import Projet
+from tasks import evenements
+from tasks.evenements import BusMemoire
+from tasks.masse import changer_statut
+from tasks.models import Tache
+
+
+class BusEnregistreur:
+    def __init__(self):
+        self.publies = []
+
+    def publier(self, projet_id, evenement):
+        self.publies.append((evenement['type'], projet_id, evenement['id']))
+
+
+@pytest.fixture
+def prof():
+    return get_user_model().objects.create_user(
+        username='prof1', password='p', email='prof1@test.com', role='enseignant'
+    )
+
+
+@pytest.fixture
+def etudiant():
+    return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+
+@pytest.fixture
+def projet(prof, etudiant):
+    projet = Projet.objects.create(
+        nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=prof
+    )
+    projet.membres.add(etudiant)
+    return projet
+
+
+def _ticket(utilisateur, acces=None):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {acces or AccessToken.for_user(utilisateur)}')
+    return client.post(reverse('evenements-ticket')).data['ticket']
+
+
+def _tache(projet, titre='Tâche'):
+    return Tache.objects.create(
+        titre=titre, description='Description', date_limite=date.today() + timedelta(days=1), projet=projet
+    )
+
+
+@pytest.mark.django_db
+class TestPublication:
+    @pytest.fixture
+    def enregistreur(self, monkeypatch):
+        enregistreur = BusEnregistreur()
+        monkeypatch.setattr(evenements, 'bus', lambda: enregistreur)
+        return enregistreur
+
+    def test_apres_commit_seulement(self, projet, enregistreur, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks() as rappels:
+            tache = _tache(projet)
+        assert enregistreur.publies == []
+
+        for rappel in rappels:
+            rappel()
+        assert enregistreur.publies == [('tache.creee', projet.id, tache.id)]
+
+    def test_chemins_d_ecriture(self, prof, etudiant, projet, enregistreur, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            tache = _tache(projet)
+            tache.assigne_a.add(etudiant)
+            changer_statut(prof, [tache.id], 'TERMINE')
+            projet.nom = 'Renommé'
+            projet.save()
+            tache_id = tache.id
+            tache.delete()
+
+        assert enregistreur.publies == [
+            ('tache.creee', projet.id, tache_id),
+            ('tache.modifiee', projet.id, tache_id),
+            ('tache.modifiee', projet.id, tache_id),
+            ('projet.modifie', projet.id, projet.id),
+            ('tache.supprimee', projet.id, tache_id),
+        ]
+
+    def test_tache_deplacee(self, prof, projet, enregistreur, django_capture_on_commit_callbacks):
+        autre = Projet.objects.create(
+            nom='Autre', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=prof
+        )
+        tache = _tache(projet)
+        with django_capture_on_commit_callbacks(execute=True):
+            tache.projet = autre
+            tache.save()
+
+        assert enregistreur.publies == [
+            ('tache.supprimee', projet.id, tache.id),
+            ('tache.modifiee', autre.id, tache.id),
+        ]
+
+
+class TestBusMemoire:
+    def test_remis_aux_abonnes_du_projet(self):
+        bus = BusMemoire()
+
+        async def scenario():
+            async with bus.abonner([1]) as abonnement:
+                bus.publier(2, {'type': 'tache.modifiee', 'projet': 2, 'id': 20})
+                bus.publier(1, {'type': 'tache.modifiee', 'projet': 1, 'id': 10})
+                return await abonnement.suivant(1), await abonnement.suivant(0.01)
+
+        assert asyncio.run(scenario()) == ({'type': 'tache.modifiee', 'projet': 1, 'id': 10}, None)
+        assert bus._abonnements == {}
+
+    def test_debordement(self, settings):
+        settings.EVENEMENTS_FILE_MAX = 1
+        bus = BusMemoire()
+
+        async def scenario():
+            async with bus.abonner([1]) as abonnement:
+                for i in range(3):
+                    bus.publier(1, {'type': 'tache.modifiee', 'projet': 1, 'id': i})
+                await asyncio.sleep(0)
+                return abonnement.debordement, await abonnement.suivant(1)
+
+        assert asyncio.run(scenario()) == (True, {'type': 'tache.modifiee', 'projet': 1, 'id': 0})
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFluxEvenements:
+    @pytest.fixture(autouse=True)
+    def bus_neuf(self):
+        evenements.bus.cache_clear()
+        yield
+        evenements.bus.cache_clear()
+
+    def test_flux_sse(self, etudiant, projet):
+        async def scenario():
+            response = await AsyncClient().get(reverse('evenements'), {'ticket': await sync_to_async(_ticket)(etudiant)})
+            contenu = response.streaming_content
+            premier = await contenu.__anext__()
+            evenements.bus().publier(projet.id, {'type': 'tache.creee', 'projet': projet.id, 'id': 7})
+            second = await contenu.__anext__()
+            await contenu.aclose()
+            return response, premier, second
+
+        response, premier, second = asyncio.run(scenario())
+        assert response['Content-Type'] == 'text/event-stream'
+        assert premier.startswith(b':')
+        lignes = second.decode().splitlines()
+        assert lignes[0] == 'event: tache.creee'
+        assert json.loads(lignes[1].removeprefix('data: ')) == {'type': 'tache.creee', 'projet': projet.id, 'id': 7}
+        assert evenements.bus()._abonnements == {}
+
+    def _apres_perte_d_acces(self, etudiant, projet, retirer_acces):
+        async def scenario():
+            response = await AsyncClient().get(reverse('evenements'), {'ticket': await sync_to_async(_ticket)(etudiant)})
+            contenu = response.streaming_content
+            await contenu.__anext__()
+            await sync_to_async(retirer_acces)()
+            await asyncio.sleep(0.1)
+            evenements.bus().publier(projet.id, {'type': 'tache.creee', 'projet': projet.id, 'id': 7})
+            with pytest.raises(StopAsyncIteration):
+                await contenu.__anext__()
+
+        asyncio.run(scenario())
+        assert evenements.bus()._abonnements == {}
+
+    def test_membre_retire(self, etudiant, projet, settings):
+        settings.EVENEMENTS_KEEPALIVE = 0.05
+        self._apres_perte_d_acces(etudiant, projet, lambda: projet.membres.remove(etudiant))
+
+    def test_compte_desactive(self, etudiant, projet, settings):
+        settings.EVENEMENTS_KEEPALIVE = 0.05
+
+        def desactiver():
+            etudiant.is_active = False
+            etudiant.save()
+
+        self._apres_perte_d_acces(etudiant, projet, desactiver)
+
+    def test_toujours_autorise(self, etudiant, projet, settings):
+        settings.EVENEMENTS_KEEPALIVE = 0.05
+
+        async def scenario():
+            response = await AsyncClient().get(reverse('evenements'), {'ticket': await sync_to_async(_ticket)(etudiant)})
+            contenu = response.streaming_content
+            await contenu.__anext__()
+            keepalive = await contenu.__anext__()
+            await contenu.aclose()
+            return keepalive
+
+        assert asyncio.run(scenario()) == b': keepalive\n\n'
+
+    def test_fermeture_a_l_expiration_du_jeton(self, etudiant, projet):
+        acces = AccessToken.for_user(etudiant)
+        acces.set_exp(lifetime=timedelta(seconds=1))
+        ticket = _ticket(etudiant, acces)
+
+        async def scenario():
+            response = await AsyncClient().get(reverse('evenements'), {'ticket': ticket})
+            contenu = response.streaming_content
+            await contenu.__anext__()
+            expire = await contenu.__anext__()
+            with pytest.raises(StopAsyncIteration):
+                await contenu.__anext__()
+            return expire
+
+        assert asyncio.run(scenario()) == b'event: expire\ndata: {}\n\n'
+        assert evenements.bus()._abonnements == {}
+
+    def test_jeton_d_acces_refuse_dans_l_url(self, prof, projet):
+        # Il finirait dans les journaux : seul un ticket de flux est accepté en paramètre
+        async def scenario():
+            codes = []
+            for parametres in ({'ticket': str(AccessToken.for_user(prof))}, {'token': str(AccessToken.for_user(prof))}):
+                codes.append((await AsyncClient().get(reverse('evenements'), parametres)).status_code)
+            return codes
+
+        assert asyncio.run(scenario()) == [401, 401]
+
+    def test_jeton_dans_l_en_tete(self, prof, projet):
+        async def scenario():
+            response = await AsyncClient().get(
+                reverse('evenements'), headers={'Authorization': f'Bearer {AccessToken.for_user(prof)}'}
+            )
+            await response.streaming_content.aclose()
+            return response.status_code
+
+        assert asyncio.run(scenario()) == 200
+
+    def test_sans_jeton(self):
+        async def scenario():
+            return (await AsyncClient().get(reverse('evenements'), {'ticket': 'invalide'})).status_code
+
+        assert asyncio.run(scenario()) == 401
+
+    def test_projet_non_suivi(self, prof, projet):
+        etranger = Projet.objects.create(
+            nom='Étranger', description='Description', date_fin=date.today() + timedelta(days=30),
+            proprietaire=get_user_model().objects.create_user(username='x', password='p', email='x@test.com')
+        )
+
+        async def scenario():
+            response = await AsyncClient().get(
+                reverse('evenements'), {'ticket': await sync_to_async(_ticket)(prof), 'projet': [projet.id, etranger.id]}
+            )
+            return response.status_code
+
+        assert asyncio.run(scenario()) == 403
+
+    def test_wsgi_refuse(self, prof):
+        response = Client().get(reverse('evenements'), {'ticket': _ticket(prof)})
+        assert response.status_code == 501
@@ -0,0 +1,86 @@
+# tasks/tests/test_identite.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.identite import CarteIdentite
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestCarteIdentite:
+    @pytest.fixture
+    def api_client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def projet(self, user):
+        return Projet.objects.create(
+            nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=user
+        )
+
+    def _selects(self, requetes, table):
+        return [
+            q['sql'] for q in requetes.captured_queries
+            if q['sql'].startswith('SELECT') and f'FROM "{table}"' in q['sql']
+        ]
+
+    def test_obtenir(self, projet):
+        carte = CarteIdentite()
+
+        assert carte.obtenir(Projet, projet.id) is carte.obtenir(Projet, str(projet.id))
+        assert carte.obtenir(Projet, 999) is None
+        assert carte.obtenir(Projet, 'abc') is None
+        assert (carte.chargees, carte.evitees) == (2, 1)
+
+    def test_creation_un_seul_chargement_du_projet(self, api_client, projet, settings):
+        settings.DEBUG = True
+        donnees = {
+            'titre': 'Tâche', 'description': 'Description', 'statut': 'A_FAIRE',
+            'date_limite': (date.today() + timedelta(days=3)).isoformat(), 'projet': projet.id, 'assigne_a': [],
+        }
+
+        with CaptureQueriesContext(connection) as requetes:
+            response = api_client.post(reverse('tache-list'), donnees, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(self._selects(requetes, 'projets')) == 1
+        # Propriétaire comparé par id : jamais chargé
+        assert not any('WHERE "users_customuser"."id" =' in q for q in self._selects(requetes, 'users_customuser'))
+        assert response['X-Carte-Identite'] == 'chargees=1; evitees=2'
+
+    def test_modification_sans_charger_le_proprietaire(self, api_client, projet):
+        tache = Tache.objects.create(
+            titre='Tâche', description='Description', date_limite=date.today() + timedelta(days=3), projet=projet
+        )
+
+        with CaptureQueriesContext(connection) as requetes:
+            response = api_client.patch(
+                reverse('tache-detail', kwargs={'pk': tache.pk}), {'projet': projet.id}, format='json'
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(self._selects(requetes, 'projets')) == 1
+        assert 'X-Carte-Identite' not in response
+
+    def test_projet_inexistant(self, api_client):
+        donnees = {
+            'titre': 'Tâche', 'description': 'Description', 'date_limite': date.today().isoformat(),
+            'projet': 999, 'assigne_a': [],
+        }
+        response = api_client.post(reverse('tache-list'), donnees, format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
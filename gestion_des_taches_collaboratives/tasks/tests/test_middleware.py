@@ -0,0 +1,34 @@
+# tasks/tests/test_middleware.py
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db
+class TestPileHorsApi:
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+    def test_api_sans_sessions_ni_x_frame(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(reverse('tache-list'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'X-Frame-Options' not in response
+        assert not hasattr(response.wsgi_request, 'session')
+
+    def test_pages_avec_la_pile_complete(self, client):
+        response = client.get(reverse('account_login'))
+
+        assert response['X-Frame-Options'] == 'DENY'
+        assert hasattr(response.wsgi_request, 'session')
+        assert 'csrftoken' in response.cookies
+
+    def test_verifications_admin_et_allauth(self):
+        call_command('check')
@@ -0,0 +1,129 @@
+# tasks/tests/test_overview.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestProjetOverview:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def prof(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def etudiant(self):
+        return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+    @pytest.fixture
+    def admin(self):
+        return get_user_model().objects.create_user(
+            username='admin1', password='p', email='admin1@test.com', role='admin'
+        )
+
+    @pytest.fixture
+    def projet(self, prof, etudiant):
+        projet = Projet.objects.create(
+            nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=prof
+        )
+        projet.membres.add(etudiant)
+        return projet
+
+    def _tache(self, projet, jours, assignes=(), statut='A_FAIRE'):
+        tache = Tache.objects.create(
+            titre=f'Tâche J+{jours}', description='Description', statut=statut,
+            date_limite=date.today() + timedelta(days=jours), projet=projet
+        )
+        tache.assigne_a.add(*assignes)
+        return tache
+
+    def _url(self, projet):
+        return reverse('projet-overview', kwargs={'pk': projet.pk})
+
+    def test_contenu(self, api_client, prof, etudiant, admin, projet):
+        terminee = self._tache(projet, 1, [etudiant], 'TERMINE')
+        a_faire = self._tache(projet, 2, [prof, etudiant])
+        api_client.force_authenticate(user=prof)
+
+        response = api_client.get(self._url(projet))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['projet']['nom'] == 'Projet'
+        assert response.data['projet']['membres_details'][0]['username'] == 'etu1'
+        assert [t['id'] for t in response.data['taches']['results']] == [terminee.id, a_faire.id]
+        assert response.data['taches']['results'][1]['assigne_a_detail'][0]['username'] == 'prof1'
+        assert response.data['taches']['next'] is None
+        assert response.data['stats'] == {'total': 2, 'a_faire': 1, 'en_cours': 0, 'termine': 1, 'progression': 50}
+        assert response.data['utilisateurs'] == [
+            {'id': etudiant.id, 'username': 'etu1', 'role': 'etudiant'},
+            {'id': prof.id, 'username': 'prof1', 'role': 'enseignant'},
+        ]
+
+    @pytest.mark.parametrize('role, attendus', [
+        ('etudiant', ['etu1']),
+        ('enseignant', ['etu1', 'prof1']),
+        ('admin', ['admin1', 'etu1', 'prof1']),
+    ])
+    def test_utilisateurs_assignables(self, api_client, prof, etudiant, admin, projet, role, attendus):
+        api_client.force_authenticate(user={'etudiant': etudiant, 'enseignant': prof, 'admin': admin}[role])
+        response = api_client.get(self._url(projet))
+        assert [u['username'] for u in response.data['utilisateurs']] == attendus
+
+    def test_pages_suivantes_sur_la_liste_des_taches(self, api_client, prof, projet):
+        taches = [self._tache(projet, jours) for jours in range(5)]
+        api_client.force_authenticate(user=prof)
+
+        response = api_client.get(self._url(projet), {'page_size': 2})
+        suivante = response.data['taches']['next']
+        assert reverse('projet-tache-list', kwargs={'projet_id': projet.pk}) in suivante
+
+        ids = [t['id'] for t in response.data['taches']['results']]
+        while suivante:
+            page = api_client.get(suivante).data
+            ids += [t['id'] for t in page['results']]
+            suivante = page['next']
+        assert ids == [t.id for t in taches]
+
+    def test_nombre_de_requetes_fixe(self, api_client, prof, etudiant, projet):
+        api_client.force_authenticate(user=prof)
+
+        def compter():
+            with CaptureQueriesContext(connection) as requetes:
+                assert api_client.get(self._url(projet)).status_code == status.HTTP_200_OK
+            return len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+        self._tache(projet, 0, [prof])
+        avant = compter()
+        for i in range(5):
+            membre = get_user_model().objects.create_user(username=f'etu{i + 2}', password='p', email=f'e{i}@test.com')
+            projet.membres.add(membre)
+            for jours in range(3):
+                self._tache(projet, jours, [prof, etudiant, membre])
+        assert compter() == avant == 5
+
+    def test_projet_inexistant(self, api_client, prof):
+        api_client.force_authenticate(user=prof)
+        response = api_client.get(reverse('projet-overview', kwargs={'pk': 999}))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_etag_invalide_par_une_tache(self, api_client, prof, projet, django_capture_on_commit_callbacks):
+        api_client.force_authenticate(user=prof)
+        etag = api_client.get(self._url(projet))['ETag']
+        assert api_client.get(self._url(projet), HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self._tache(projet, 1)
+        assert api_client.get(self._url(projet), HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
@@ -0,0 +1,111 @@
+# tasks/tests/test_pagination.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestTachePagination:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1',
+            password='password123',
+            email='prof1@test.com',
+            role='enseignant'
+        )
+
+    @pytest.fixture
+    def taches(self, user):
+        """Deux projets, plusieurs tâches partageant la même date limite"""
+        taches = []
+        for i in range(2):
+            projet = Projet.objects.create(
+                nom=f'Projet {i}',
+                description='Description',
+                date_fin=date.today() + timedelta(days=30),
+                proprietaire=user
+            )
+            for j in range(7):
+                taches.append(Tache.objects.create(
+                    titre=f'Tâche {i}-{j}',
+                    description='Description',
+                    date_limite=date.today() + timedelta(days=j % 3),
+                    statut='TERMINE' if j % 2 else 'A_FAIRE',
+                    projet=projet
+                ))
+        return taches
+
+    def _parcourir(self, api_client, url):
+        resultats = []
+        while url:
+            response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            resultats.extend(response.data['results'])
+            url = response.data['next']
+        return resultats
+
+    def test_premiere_page(self, api_client, user, taches):
+        """La réponse est paginée et limitée par page_size"""
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse('tache-list'), {'page_size': 5})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 5
+        assert response.data['next'] is not None
+        assert response.data['previous'] is None
+
+    def test_parcours_complet_ordre_stable(self, api_client, user, taches):
+        """Toutes les tâches sont vues une seule fois, dans l'ordre (projet, date_limite, id)"""
+        api_client.force_authenticate(user=user)
+        resultats = self._parcourir(api_client, reverse('tache-list') + '?page_size=4')
+
+        attendus = sorted(taches, key=lambda t: (t.projet_id, t.date_limite, t.id))
+        assert [t['id'] for t in resultats] == [t.id for t in attendus]
+
+    def test_page_precedente(self, api_client, user, taches):
+        """Le lien previous ramène exactement la page précédente"""
+        api_client.force_authenticate(user=user)
+        page1 = api_client.get(reverse('tache-list'), {'page_size': 4})
+        page2 = api_client.get(page1.data['next'])
+        retour = api_client.get(page2.data['previous'])
+
+        assert [t['id'] for t in retour.data['results']] == [t['id'] for t in page1.data['results']]
+        assert retour.data['next'] is not None
+
+    def test_pagination_avec_filtres(self, api_client, user, taches):
+        """Les filtres DjangoFilterBackend se combinent avec le curseur"""
+        api_client.force_authenticate(user=user)
+        projet_id = taches[0].projet_id
+        url = reverse('tache-list') + f'?page_size=2&statut=TERMINE&projet={projet_id}'
+        resultats = self._parcourir(api_client, url)
+
+        attendus = [t.id for t in taches if t.projet_id == projet_id and t.statut == 'TERMINE']
+        assert sorted(t['id'] for t in resultats) == sorted(attendus)
+
+    def test_pagination_par_projet(self, api_client, user, taches):
+        """La route /api/projets/<id>/taches/ est paginée de la même façon"""
+        api_client.force_authenticate(user=user)
+        projet_id = taches[-1].projet_id
+        url = reverse('projet-tache-list', kwargs={'projet_id': projet_id}) + '?page_size=3'
+        resultats = self._parcourir(api_client, url)
+
+        assert len(resultats) == 7
+        assert all(t['projet'] == projet_id for t in resultats)
+
+    def test_curseur_invalide(self, api_client, user, taches):
+        """Un curseur illisible renvoie 404 et non une erreur serveur"""
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse('tache-list'), {'cursor': 'cD1pbnZhbGlkZQ=='})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
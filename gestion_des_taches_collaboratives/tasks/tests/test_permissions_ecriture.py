@@ -0,0 +1,118 @@
+# tasks/tests/test_permissions_ecriture.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestPermissionsEcriture:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def prof(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def etudiant(self):
+        return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+    @pytest.fixture
+    def projet(self, prof):
+        return Projet.objects.create(
+            nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=prof
+        )
+
+    def _tache(self, projet, assignes=()):
+        tache = Tache.objects.create(
+            titre='Tâche', description='Description', date_limite=date.today() + timedelta(days=3), projet=projet
+        )
+        tache.assigne_a.add(*assignes)
+        return tache
+
+    def _etudiants(self, nombre, debut=2):
+        return [
+            get_user_model().objects.create_user(username=f'etu{i}', password='p', email=f'etu{i}@test.com')
+            for i in range(debut, debut + nombre)
+        ]
+
+    def _patch(self, api_client, tache, donnees):
+        with CaptureQueriesContext(connection) as requetes:
+            response = api_client.patch(reverse('tache-detail', kwargs={'pk': tache.pk}), donnees, format='json')
+        return response, len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+    def test_assigne_peut_modifier(self, api_client, projet, etudiant):
+        tache = self._tache(projet, [etudiant])
+        api_client.force_authenticate(user=etudiant)
+
+        response, _ = self._patch(api_client, tache, {'statut': 'EN_COURS'})
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_ni_proprietaire_ni_assigne(self, api_client, projet, etudiant):
+        tache = self._tache(projet, self._etudiants(3))
+        api_client.force_authenticate(user=etudiant)
+
+        response, _ = self._patch(api_client, tache, {'statut': 'EN_COURS'})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_nombre_de_requetes_independant_des_assignes(self, api_client, projet, etudiant):
+        api_client.force_authenticate(user=etudiant)
+        petite = self._tache(projet, [etudiant, *self._etudiants(1)])
+        grande = self._tache(projet, [etudiant, *self._etudiants(20, debut=10)])
+
+        _, avant = self._patch(api_client, petite, {'titre': 'Renommée'})
+        _, apres = self._patch(api_client, grande, {'titre': 'Renommée'})
+        assert apres == avant
+
+        # Remplacement des autres assignés : un retrait et un ajout, quel que soit leur nombre
+        nouveaux = [etudiant.id, *[u.id for u in self._etudiants(1, debut=40)]]
+        _, avant = self._patch(api_client, petite, {'assigne_a': nouveaux})
+        nouveaux = [etudiant.id, *[u.id for u in self._etudiants(20, debut=50)]]
+        _, apres = self._patch(api_client, grande, {'assigne_a': nouveaux})
+        assert apres == avant
+
+    def test_etudiant_n_assigne_pas_un_enseignant(self, api_client, projet, prof, etudiant):
+        tache = self._tache(projet, [etudiant])
+        api_client.force_authenticate(user=etudiant)
+
+        response, _ = self._patch(api_client, tache, {'titre': 'Modifiée', 'assigne_a': [etudiant.id, prof.id]})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        tache.refresh_from_db()
+        assert tache.titre == 'Tâche'
+        assert list(tache.assigne_a.all()) == [etudiant]
+
+    def test_enseignant_deja_assigne(self, api_client, projet, prof, etudiant):
+        tache = self._tache(projet, [etudiant, prof])
+        api_client.force_authenticate(user=etudiant)
+
+        response, _ = self._patch(api_client, tache, {'statut': 'TERMINE'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Tache.objects.get(pk=tache.pk).statut == 'A_FAIRE'
+
+    def test_enseignant_peut_assigner_un_enseignant(self, api_client, projet, prof, etudiant):
+        tache = self._tache(projet, [etudiant])
+        api_client.force_authenticate(user=prof)
+
+        response, _ = self._patch(api_client, tache, {'assigne_a': [etudiant.id, prof.id]})
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(response.data['assigne_a']) == sorted([etudiant.id, prof.id])
+
+    def test_assigne_inconnu(self, api_client, projet, prof):
+        tache = self._tache(projet)
+        api_client.force_authenticate(user=prof)
+
+        response, _ = self._patch(api_client, tache, {'assigne_a': [999]})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'assigne_a' in response.data
@@ -0,0 +1,90 @@
+# tasks/tests/test_queries.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestTacheNombreRequetes:
+    """Le nombre de requêtes SQL ne doit pas dépendre du nombre de tâches ou d'assignés"""
+
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1',
+            password='password123',
+            email='prof1@test.com',
+            role='enseignant'
+        )
+
+    @pytest.fixture
+    def projet(self, user):
+        return Projet.objects.create(
+            nom='Projet Test',
+            description='Description',
+            date_fin=date.today() + timedelta(days=30),
+            proprietaire=user
+        )
+
+    def _creer_taches(self, projet, nombre, nb_assignes):
+        User = get_user_model()
+        debut = User.objects.count()
+        for i in range(debut, debut + nombre):
+            tache = Tache.objects.create(
+                titre=f'Tâche {i}',
+                description='Description',
+                date_limite=date.today(),
+                projet=projet
+            )
+            for j in range(nb_assignes):
+                tache.assigne_a.add(User.objects.create_user(
+                    username=f'etu{i}-{j}',
+                    password='password123',
+                    email=f'etu{i}-{j}@test.com',
+                    role='etudiant'
+                ))
+
+    def _compter(self, api_client, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(ctx.captured_queries), response
+
+    def test_liste_nombre_requetes_constant(self, api_client, user, projet):
+        api_client.force_authenticate(user=user)
+        url = reverse('tache-list')
+
+        self._creer_taches(projet, 2, 1)
+        peu, _ = self._compter(api_client, url)
+
+        self._creer_taches(projet, 8, 3)
+        beaucoup, response = self._compter(api_client, url)
+
+        assert len(response.data['results']) == 10
+        assert all(len(t['assigne_a_detail']) >= 1 for t in response.data['results'])
+        assert beaucoup == peu
+
+    def test_detail_nombre_requetes_constant(self, api_client, user, projet):
+        api_client.force_authenticate(user=user)
+
+        self._creer_taches(projet, 1, 1)
+        peu, _ = self._compter(api_client, reverse('tache-detail', kwargs={'pk': Tache.objects.get().pk}))
+
+        Tache.objects.all().delete()
+        self._creer_taches(projet, 1, 6)
+        beaucoup, response = self._compter(api_client, reverse('tache-detail', kwargs={'pk': Tache.objects.get().pk}))
+
+        assert len(response.data['assigne_a_detail']) == 6
+        assert beaucoup == peu
@@ -0,0 +1,125 @@
+# tasks/tests/test_repliques.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache.backends.db import DatabaseCache
+from django.core.management import call_command
+from django.db import connections
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.cache import cache_partage
+from tasks.repliques import RouteurRepliques, _alias_lecture, cle_ecriture
+
+
+@pytest.fixture
+def replique(settings, tmp_path, monkeypatch, django_db_blocker):
+    """
+    Réplique dans un second fichier SQLite, hors de la transaction du test : elle ne reçoit
+    rien de la base principale, ce qui simule une réplique en retard.
+    """
+    configuration = connections.configure_settings({
+        'default': dict(connections.settings['default']),
+        'replique': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': str(tmp_path / 'replique.sqlite3')},
+    })['replique']
+    monkeypatch.setitem(connections.settings, 'replique', configuration)
+    with django_db_blocker.unblock():
+        # run_syncdb : les tests tournent avec --nomigrations
+        call_command('migrate', database='replique', run_syncdb=True, verbosity=0)
+    settings.DATABASES_REPLIQUES = ['replique']
+    yield 'replique'
+    connections['replique'].close()
+    del connections['replique']
+
+
+@pytest.mark.django_db
+class TestRepliques:
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def api_client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    def _projet(self, proprietaire, nom='Projet', using='default'):
+        return Projet.objects.using(using).create(
+            nom=nom, description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=proprietaire
+        )
+
+    def _copier_utilisateur(self, user, replique):
+        # Le propriétaire doit exister sur la réplique pour la clé étrangère
+        get_user_model().objects.using(replique).create(
+            id=user.id, username=user.username, email=user.email, role=user.role
+        )
+
+    def test_lecture_sur_la_replique(self, api_client, user, replique):
+        self._projet(user, 'Principale')
+        self._copier_utilisateur(user, replique)
+        self._projet(get_user_model().objects.using(replique).get(), 'Réplique', using=replique)
+
+        response = api_client.get(reverse('projet-list'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [projet['nom'] for projet in response.data] == ['Réplique']
+
+    def test_sans_cache_partage(self, api_client, user, replique, settings):
+        # Une écriture faite sur un autre worker n'y serait pas vue : pas de lecture sur la réplique
+        settings.CACHE_PARTAGE = None
+        self._projet(user, 'Principale')
+
+        response = api_client.get(reverse('projet-list'))
+        assert [projet['nom'] for projet in response.data] == ['Principale']
+
+    def test_relecture_de_ses_ecritures(self, api_client, user, replique):
+        donnees = {
+            'nom': 'Nouveau', 'description': 'Description',
+            'date_fin': (date.today() + timedelta(days=30)).isoformat(), 'membres': [],
+        }
+        assert api_client.post(reverse('projet-list'), donnees, format='json').status_code == status.HTTP_201_CREATED
+
+        assert cache_partage().get(cle_ecriture(user.pk)) is not None
+        response = api_client.get(reverse('projet-list'))
+        assert [projet['nom'] for projet in response.data] == ['Nouveau']
+
+        # Un autre utilisateur lit toujours la réplique
+        autre = get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+        api_client.force_authenticate(user=autre)
+        assert api_client.get(reverse('projet-list')).data == []
+
+    def test_vues_non_concernees_sur_la_principale(self, api_client, user, replique):
+        projet = self._projet(user)
+
+        response = api_client.get(reverse('projet-detail', kwargs={'pk': projet.id}))
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_pas_de_cache_juste_apres_une_ecriture(self, api_client, user, replique, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            self._projet(user)
+
+        assert 'ETag' not in api_client.get(reverse('projet-list'))
+        assert api_client.get(reverse('tache-stats'))['X-Cache'] == 'MISS'
+        assert api_client.get(reverse('tache-stats'))['X-Cache'] == 'MISS'
+
+    def test_cache_hors_fenetre(self, api_client, user, replique, settings, django_capture_on_commit_callbacks):
+        settings.REPLIQUES_RETARD_MAX = 0
+        with django_capture_on_commit_callbacks(execute=True):
+            self._projet(user)
+
+        assert 'ETag' in api_client.get(reverse('projet-list'))
+        api_client.get(reverse('tache-stats'))
+        assert api_client.get(reverse('tache-stats'))['X-Cache'] == 'HIT'
+
+    def test_cache_en_base_lu_sur_la_principale(self, replique):
+        routage = _alias_lecture.set(replique)
+        try:
+            assert RouteurRepliques().db_for_read(DatabaseCache('cache_partage', {}).cache_model_class) is None
+            assert RouteurRepliques().db_for_read(Projet) == replique
+        finally:
+            _alias_lecture.reset(routage)
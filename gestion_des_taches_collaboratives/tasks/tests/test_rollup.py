@@ -0,0 +1,105 @@
+# tasks/tests/test_rollup.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from projects.models import Projet
+from tasks.models import CompletionJournaliere, StatistiqueUtilisateur, Tache
+from tasks.statistiques import verifier_statistiques
+
+
+@pytest.mark.django_db
+class TestStatistiquesIncrementales:
+    """Les compteurs par utilisateur suivent les écritures sur les tâches"""
+
+    @pytest.fixture
+    def users(self):
+        User = get_user_model()
+        return [
+            User.objects.create_user(username=f'etu{i}', password='p', email=f'etu{i}@test.com', role='etudiant')
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def projet(self, users):
+        return Projet.objects.create(
+            nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=users[0]
+        )
+
+    def _tache(self, projet, statut='A_FAIRE', jour=None):
+        return Tache.objects.create(
+            titre='Tâche', description='Description', date_limite=jour or date.today(), statut=statut, projet=projet
+        )
+
+    def _compteurs(self, user):
+        stat = StatistiqueUtilisateur.objects.filter(utilisateur=user).first()
+        return (stat.taches_totales, stat.taches_terminees) if stat else (0, 0)
+
+    def test_assignation_et_changement_statut(self, users, projet):
+        tache = self._tache(projet)
+        tache.assigne_a.add(users[0], users[1])
+        assert self._compteurs(users[0]) == (1, 0)
+
+        tache.statut = 'TERMINE'
+        tache.save()
+        assert self._compteurs(users[1]) == (1, 1)
+        assert CompletionJournaliere.objects.get(utilisateur=users[1], jour=date.today()).nombre == 1
+
+        tache.date_limite = date.today() - timedelta(days=2)
+        tache.save()
+        assert CompletionJournaliere.objects.get(utilisateur=users[1], jour=date.today()).nombre == 0
+        assert CompletionJournaliere.objects.get(utilisateur=users[1], jour=tache.date_limite).nombre == 1
+        assert verifier_statistiques() == []
+
+    def test_retrait_set_et_clear(self, users, projet):
+        tache = self._tache(projet, statut='TERMINE')
+        tache.assigne_a.add(users[0], users[1])
+
+        tache.assigne_a.remove(users[0], users[2])  # users[2] n'était pas assigné
+        assert self._compteurs(users[0]) == (0, 0)
+        assert self._compteurs(users[2]) == (0, 0)
+
+        tache.assigne_a.set([users[2]])
+        assert self._compteurs(users[1]) == (0, 0)
+        assert self._compteurs(users[2]) == (1, 1)
+
+        tache.assigne_a.clear()
+        assert self._compteurs(users[2]) == (0, 0)
+        assert verifier_statistiques() == []
+
+    def test_assignation_depuis_utilisateur(self, users, projet):
+        taches = [self._tache(projet, statut='TERMINE'), self._tache(projet, statut='TERMINE'), self._tache(projet)]
+        users[0].taches_assignees.add(*taches)
+        assert self._compteurs(users[0]) == (3, 2)
+
+        users[0].taches_assignees.remove(taches[0])
+        assert self._compteurs(users[0]) == (2, 1)
+        assert verifier_statistiques() == []
+
+    def test_suppression_tache_et_projet(self, users, projet):
+        tache = self._tache(projet, statut='TERMINE')
+        tache.assigne_a.add(users[0])
+        autre = self._tache(projet)
+        autre.assigne_a.add(users[0])
+
+        tache.delete()
+        assert self._compteurs(users[0]) == (1, 0)
+
+        projet.delete()
+        assert self._compteurs(users[0]) == (0, 0)
+        assert verifier_statistiques() == []
+
+    def test_commande_rebuild(self, users, projet):
+        tache = self._tache(projet, statut='TERMINE')
+        tache.assigne_a.add(users[0])
+
+        # Simule un import en masse qui contourne les signaux
+        Tache.objects.filter(pk=tache.pk).update(statut='A_FAIRE')
+        with pytest.raises(CommandError):
+            call_command('rebuild_statistiques', '--check')
+
+        call_command('rebuild_statistiques')
+        assert self._compteurs(users[0]) == (1, 0)
+        call_command('rebuild_statistiques', '--check')
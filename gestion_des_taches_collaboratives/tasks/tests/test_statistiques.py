@@ -0,0 +1,89 @@
+# tasks/tests/test_statistiques.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestStatistiqueView:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def utilisateurs(self):
+        """Un enseignant à 100 %, un enseignant à 50 %, un étudiant à 75 %"""
+        User = get_user_model()
+        prof_top = User.objects.create_user(username='prof_top', password='p', email='a@test.com', role='enseignant')
+        prof_moyen = User.objects.create_user(username='prof_moyen', password='p', email='b@test.com', role='enseignant')
+        etudiant = User.objects.create_user(username='etu', password='p', email='c@test.com', role='etudiant')
+        projet = Projet.objects.create(
+            nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=prof_top
+        )
+
+        def taches(user, statuts):
+            for statut in statuts:
+                tache = Tache.objects.create(
+                    titre='Tâche', description='Description', date_limite=date.today(), statut=statut, projet=projet
+                )
+                tache.assigne_a.add(user)
+
+        taches(prof_top, ['TERMINE', 'TERMINE'])
+        taches(prof_moyen, ['TERMINE', 'A_FAIRE'])
+        taches(etudiant, ['TERMINE', 'TERMINE', 'TERMINE', 'EN_COURS'])
+        return prof_top, prof_moyen, etudiant
+
+    def _par_utilisateur(self, response):
+        return {ligne['utilisateur']: ligne for ligne in response.data['results']}
+
+    def test_taux_prime_badge(self, api_client, utilisateurs):
+        api_client.force_authenticate(user=utilisateurs[0])
+        response = api_client.get(reverse('statistiques'))
+
+        assert response.status_code == status.HTTP_200_OK
+        lignes = self._par_utilisateur(response)
+        assert lignes['prof_top']['taux_completion'] == 100
+        assert lignes['prof_top']['prime'] == '100000$'
+        assert lignes['prof_top']['badge'] == 'Top Performer'
+        assert lignes['prof_moyen']['taux_completion'] == 50
+        assert lignes['prof_moyen']['prime'] == '0$'
+        assert lignes['prof_moyen']['badge'] == 'En progrès'
+        assert lignes['etu']['taches_totales'] == 4
+        assert lignes['etu']['taches_terminees'] == 3
+        assert lignes['etu']['taux_completion'] == 75
+        assert lignes['etu']['prime'] == 'Non concerné'
+        assert lignes['etu']['badge'] == 'Bon'
+
+    def test_filtre_role(self, api_client, utilisateurs):
+        api_client.force_authenticate(user=utilisateurs[0])
+        response = api_client.get(reverse('statistiques'), {'role': 'enseignant'})
+
+        assert set(self._par_utilisateur(response)) == {'prof_top', 'prof_moyen'}
+
+    def test_tri_et_pagination(self, api_client, utilisateurs):
+        api_client.force_authenticate(user=utilisateurs[0])
+        response = api_client.get(reverse('statistiques'), {'ordering': '-taux_completion', 'page_size': 2})
+
+        assert response.data['count'] == 3
+        assert [ligne['utilisateur'] for ligne in response.data['results']] == ['prof_top', 'etu']
+        assert response.data['next'] is not None
+
+    def test_pages_du_client(self, api_client, utilisateurs):
+        # Requêtes du tableau de bord : administrateurs exclus, tri stable par id, page suivante par le lien next
+        admin = get_user_model().objects.create_user(username='admin1', password='p', email='d@test.com', role='admin')
+        api_client.force_authenticate(user=admin)
+        params = {'role__in': 'enseignant,etudiant', 'ordering': '-taches_terminees,id', 'page_size': 2}
+
+        premiere = api_client.get(reverse('statistiques'), params)
+        seconde = api_client.get(premiere.data['next'])
+
+        assert premiere.data['count'] == 3
+        assert [ligne['utilisateur'] for ligne in premiere.data['results']] == ['etu', 'prof_top']
+        assert [ligne['utilisateur'] for ligne in seconde.data['results']] == ['prof_moyen']
+        assert seconde.data['next'] is None
@@ -0,0 +1,83 @@
+# tasks/tests/test_stats.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+
+
+@pytest.mark.django_db
+class TestTacheStatsView:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1',
+            password='password123',
+            email='prof1@test.com',
+            role='enseignant'
+        )
+
+    @pytest.fixture
+    def projets(self, user):
+        projets = []
+        for i, statuts in enumerate([['A_FAIRE', 'EN_COURS', 'TERMINE', 'TERMINE'], ['A_FAIRE', 'TERMINE']]):
+            projet = Projet.objects.create(
+                nom=f'Projet {i}',
+                description='Description',
+                date_fin=date.today() + timedelta(days=30),
+                proprietaire=user
+            )
+            for statut in statuts:
+                Tache.objects.create(
+                    titre='Tâche',
+                    description='Description',
+                    date_limite=date.today(),
+                    statut=statut,
+                    projet=projet
+                )
+            projets.append(projet)
+        return projets
+
+    def _get(self, api_client, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        requetes = [q for q in ctx.captured_queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+        return response.data, len(requetes)
+
+    def test_stats_globales(self, api_client, user, projets):
+        api_client.force_authenticate(user=user)
+        stats, nb_requetes = self._get(api_client, reverse('tache-stats'))
+
+        assert stats == {'total': 6, 'a_faire': 2, 'en_cours': 1, 'termine': 3, 'progression': 50}
+        assert nb_requetes == 1
+
+    def test_stats_par_parametre_projet(self, api_client, user, projets):
+        api_client.force_authenticate(user=user)
+        stats, nb_requetes = self._get(api_client, reverse('tache-stats') + f'?projet={projets[0].id}')
+
+        assert stats == {'total': 4, 'a_faire': 1, 'en_cours': 1, 'termine': 2, 'progression': 50}
+        assert nb_requetes == 1
+
+    def test_stats_par_route_projet(self, api_client, user, projets):
+        api_client.force_authenticate(user=user)
+        stats, nb_requetes = self._get(api_client, reverse('tache-stats-projet', kwargs={'projet_id': projets[1].id}))
+
+        assert stats == {'total': 2, 'a_faire': 1, 'en_cours': 0, 'termine': 1, 'progression': 50}
+        assert nb_requetes == 1
+
+    def test_stats_projet_vide(self, api_client, user):
+        api_client.force_authenticate(user=user)
+        stats, _ = self._get(api_client, reverse('tache-stats-projet', kwargs={'projet_id': 999}))
+
+        assert stats == {'total': 0, 'a_faire': 0, 'en_cours': 0, 'termine': 0, 'progression': 0}
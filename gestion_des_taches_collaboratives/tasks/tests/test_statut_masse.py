@@ -0,0 +1,123 @@
+# tasks/tests/test_statut_masse.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.models import Tache
+from tasks.statistiques import verifier_compteurs_projets, verifier_statistiques
+
+
+@pytest.mark.django_db
+class TestStatutMasse:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def etudiant(self):
+        return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+    @pytest.fixture
+    def projets(self, user):
+        return [
+            Projet.objects.create(
+                nom=f'Projet {i}', description='Description',
+                date_fin=date.today() + timedelta(days=30), proprietaire=user
+            )
+            for i in range(2)
+        ]
+
+    def _creer(self, projet, nombre, statut='A_FAIRE', assignes=()):
+        taches = []
+        for i in range(nombre):
+            tache = Tache.objects.create(
+                titre=f'Tâche {i}', description='Description', statut=statut,
+                date_limite=date.today() + timedelta(days=i % 3), projet=projet
+            )
+            tache.assigne_a.add(*assignes)
+            taches.append(tache)
+        return taches
+
+    def _patcher(self, api_client, ids, statut='TERMINE'):
+        return api_client.patch(reverse('tache-statut-masse'), {'ids': ids, 'statut': statut}, format='json')
+
+    def test_changement_et_compteurs(self, api_client, user, etudiant, projets):
+        taches = self._creer(projets[0], 4, assignes=[etudiant]) + self._creer(projets[1], 2, 'EN_COURS')
+        deja_terminee = self._creer(projets[0], 1, 'TERMINE', assignes=[etudiant])[0]
+        api_client.force_authenticate(user=user)
+
+        ids = [tache.id for tache in taches] + [deja_terminee.id]
+        response = self._patcher(api_client, ids)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['modifiees'] == sorted(tache.id for tache in taches)
+        assert set(Tache.objects.values_list('statut', flat=True)) == {'TERMINE'}
+        assert verifier_compteurs_projets() == []
+        assert verifier_statistiques() == []
+
+        projets[0].refresh_from_db()
+        assert (projets[0].taches_a_faire, projets[0].taches_terminees) == (0, 5)
+
+    def test_nombre_de_requetes_constant(self, api_client, user, etudiant, projets):
+        api_client.force_authenticate(user=user)
+
+        def compter(nombre, statut):
+            ids = [tache.id for tache in self._creer(projets[0], nombre, assignes=[user, etudiant])]
+            with CaptureQueriesContext(connection) as requetes:
+                assert self._patcher(api_client, ids, statut).status_code == status.HTTP_200_OK
+            return len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+        assert compter(3, 'TERMINE') == compter(40, 'TERMINE')
+
+    def test_assigne_autorise(self, api_client, user, etudiant, projets):
+        tache = self._creer(projets[0], 1, assignes=[etudiant])[0]
+        api_client.force_authenticate(user=etudiant)
+
+        assert self._patcher(api_client, [tache.id], 'EN_COURS').status_code == status.HTTP_200_OK
+        tache.refresh_from_db()
+        assert tache.statut == 'EN_COURS'
+
+    def test_tout_ou_rien(self, api_client, user, etudiant, projets):
+        assignee = self._creer(projets[0], 1, assignes=[etudiant])[0]
+        autre = self._creer(projets[0], 1)[0]
+        api_client.force_authenticate(user=etudiant)
+
+        response = self._patcher(api_client, [assignee.id, autre.id])
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data['ids'] == [autre.id]
+
+        response = self._patcher(api_client, [assignee.id, 999])
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data['ids'] == [999]
+
+        assert set(Tache.objects.values_list('statut', flat=True)) == {'A_FAIRE'}
+
+    def test_donnees_invalides(self, api_client, user):
+        api_client.force_authenticate(user=user)
+        assert self._patcher(api_client, [], 'TERMINE').status_code == status.HTTP_400_BAD_REQUEST
+        assert self._patcher(api_client, [1], 'INCONNU').status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invalide_le_cache(self, api_client, user, projets, django_capture_on_commit_callbacks):
+        tache = self._creer(projets[0], 1)[0]
+        api_client.force_authenticate(user=user)
+        url = reverse('tache-stats-projet', kwargs={'projet_id': projets[0].id})
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self._patcher(api_client, [tache.id])
+        response = api_client.get(url)
+
+        assert response['X-Cache'] == 'MISS'
+        assert response.data['termine'] == 1
@@ -0,0 +1,178 @@
+# tasks/tests/test_sync.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+from tasks.masse import changer_statut
+from tasks.models import Suppression, Tache
+from tasks.sync import encoder_curseur
+
+
+@pytest.mark.django_db
+class TestSync:
+    @pytest.fixture(autouse=True)
+    def sans_marge(self, settings):
+        settings.SYNC_MARGE_SECONDES = 0
+
+    @pytest.fixture
+    def api_client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    @pytest.fixture
+    def etudiant(self):
+        return get_user_model().objects.create_user(username='etu1', password='p', email='etu1@test.com')
+
+    @pytest.fixture
+    def projet(self, user):
+        return Projet.objects.create(
+            nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=user
+        )
+
+    def _tache(self, projet, titre='Tâche'):
+        return Tache.objects.create(
+            titre=titre, description='Description', date_limite=date.today() + timedelta(days=1), projet=projet
+        )
+
+    def _sync(self, api_client, curseur=None):
+        response = api_client.get(reverse('sync'), {'since': curseur} if curseur else {})
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    def test_copie_initiale_puis_increment(self, api_client, projet):
+        tache = self._tache(projet)
+        autre = self._tache(projet, 'Autre')
+
+        initial = self._sync(api_client)
+        assert [t['id'] for t in initial['taches']] == [tache.id, autre.id]
+        assert [p['id'] for p in initial['projets']] == [projet.id]
+        assert initial['suite'] is False
+
+        assert self._sync(api_client, initial['curseur'])['taches'] == []
+
+        tache.titre = 'Modifiée'
+        tache.save()
+        increment = self._sync(api_client, initial['curseur'])
+        assert [t['titre'] for t in increment['taches']] == ['Modifiée']
+        # Le compteur du projet a changé avec la tâche créée, pas avec le renommage
+        assert increment['projets'] == []
+
+    def test_suppressions(self, api_client, projet):
+        tache = self._tache(projet)
+        curseur = self._sync(api_client)['curseur']
+
+        tache_id = tache.id
+        tache.delete()
+        donnees = self._sync(api_client, curseur)
+        assert [(s['modele'], s['id']) for s in donnees['suppressions']] == [('tache', tache_id)]
+        assert [p['taches_total'] for p in donnees['projets']] == [0]
+
+        tache = self._tache(projet)
+        curseur = donnees['curseur']
+        projet_id = projet.id
+        projet.delete()
+        suppressions = self._sync(api_client, curseur)['suppressions']
+        assert {(s['modele'], s['id']) for s in suppressions} == {('tache', tache.id), ('projet', projet_id)}
+
+    def test_assignations_et_membres(self, api_client, projet, etudiant):
+        tache = self._tache(projet)
+        curseur = self._sync(api_client)['curseur']
+
+        tache.assigne_a.add(etudiant)
+        projet.membres.add(etudiant)
+        donnees = self._sync(api_client, curseur)
+        assert donnees['taches'][0]['assigne_a'] == [etudiant.id]
+        assert donnees['projets'][0]['membres'] == [etudiant.id]
+
+    def test_changement_de_statut_en_masse(self, api_client, user, projet):
+        tache = self._tache(projet)
+        curseur = self._sync(api_client)['curseur']
+
+        changer_statut(user, [tache.id], 'TERMINE')
+        donnees = self._sync(api_client, curseur)
+        assert [t['statut'] for t in donnees['taches']] == ['TERMINE']
+        assert [p['progression'] for p in donnees['projets']] == [100]
+
+    def test_pages(self, api_client, projet, settings):
+        settings.SYNC_LIMITE = 2
+        taches = [self._tache(projet, f'Tâche {i}') for i in range(5)]
+
+        ids, curseur, suite = [], None, True
+        while suite:
+            donnees = self._sync(api_client, curseur)
+            ids += [t['id'] for t in donnees['taches']]
+            curseur, suite = donnees['curseur'], donnees['suite']
+        assert ids == [t.id for t in taches]
+
+    def test_marge(self, api_client, projet, settings):
+        settings.SYNC_MARGE_SECONDES = 60
+        self._tache(projet)
+        donnees = self._sync(api_client)
+        assert donnees['taches'] == [] and donnees['projets'] == []
+
+    def test_nombre_de_requetes_fixe(self, api_client, projet, etudiant):
+        for i in range(10):
+            self._tache(projet, f'Tâche {i}').assigne_a.add(etudiant)
+        projet.membres.add(etudiant)
+
+        with CaptureQueriesContext(connection) as requetes:
+            donnees = self._sync(api_client)
+        assert len(donnees['taches']) == 10
+        assert len([q for q in requetes.captured_queries if 'SAVEPOINT' not in q['sql']]) == 5
+
+    @pytest.mark.parametrize('curseur', ['xyz', 'W10=', 'eyJ0YWNoZXMiOiBbImhpZXIiLCAxXX0='])
+    def test_curseur_invalide(self, api_client, curseur):
+        response = api_client.get(reverse('sync'), {'since': curseur})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_purge_des_suppressions(self, projet, settings):
+        settings.SYNC_RETENTION_JOURS = 30
+        ancienne, recente = self._tache(projet, 'Ancienne'), self._tache(projet, 'Récente')
+        ancienne_id, recente_id = ancienne.id, recente.id
+        ancienne.delete()
+        recente.delete()
+        Suppression.objects.filter(objet_id=ancienne_id).update(
+            date_suppression=timezone.now() - timedelta(days=31)
+        )
+
+        call_command('purger_suppressions')
+        assert list(Suppression.objects.values_list('objet_id', flat=True)) == [recente_id]
+
+    def test_curseur_expire(self, api_client, projet, settings):
+        settings.SYNC_RETENTION_JOURS = 30
+        self._tache(projet)
+        # Suppressions lues jusqu'à il y a 31 jours : celles d'après ont pu être purgées
+        curseur = encoder_curseur({}, timezone.now() - timedelta(days=31))
+
+        response = api_client.get(reverse('sync'), {'since': curseur})
+        assert response.status_code == status.HTTP_410_GONE
+        assert response.data['detail'].code == 'resynchroniser'
+        assert len(self._sync(api_client)['taches']) == 1
+
+    def test_curseur_sans_suppression_recente(self, api_client, projet, settings):
+        settings.SYNC_RETENTION_JOURS = 30
+        tache = self._tache(projet)
+        tache_id = tache.id
+        tache.delete()
+        curseur = self._sync(api_client)['curseur']
+        Suppression.objects.update(date_suppression=timezone.now() - timedelta(days=40))
+
+        # La dernière suppression lue est ancienne, mais le client a tout lu jusqu'à maintenant
+        donnees = self._sync(api_client, curseur)
+        assert donnees['suppressions'] == []
+        assert Suppression.objects.filter(objet_id=tache_id).exists()
@@ -0,0 +1,68 @@
+# tasks/tests/test_transactions.py
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from projects.models import Projet
+
+
+@pytest.mark.django_db
+class TestLectureAutocommit:
+    """Sous pytest la requête est déjà dans une transaction : ATOMIC_REQUESTS s'y voit par un SAVEPOINT"""
+
+    @pytest.fixture
+    def api_client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model().objects.create_user(
+            username='prof1', password='p', email='prof1@test.com', role='enseignant'
+        )
+
+    def _savepoints(self, appel):
+        with CaptureQueriesContext(connection) as requetes:
+            response = appel()
+        return response, [q for q in requetes.captured_queries if q['sql'].startswith('SAVEPOINT')]
+
+    def test_lecture_hors_transaction(self, api_client):
+        response, savepoints = self._savepoints(lambda: api_client.get(reverse('statistiques')))
+        assert response.status_code == status.HTTP_200_OK
+        assert savepoints == []
+
+    def test_ecriture_atomique(self, api_client):
+        donnees = {
+            'nom': 'Projet', 'description': 'Description',
+            'date_fin': (date.today() + timedelta(days=30)).isoformat(), 'membres': [],
+        }
+        response, savepoints = self._savepoints(lambda: api_client.post(reverse('projet-list'), donnees, format='json'))
+        assert response.status_code == status.HTTP_201_CREATED
+        assert savepoints
+
+    def test_vue_en_lecture_atomique(self, api_client):
+        response, savepoints = self._savepoints(lambda: api_client.get(reverse('sync')))
+        assert response.status_code == status.HTTP_200_OK
+        assert savepoints
+
+    def test_erreur_en_lecture(self, api_client, user):
+        projet = Projet.objects.create(
+            nom='Projet', description='Description', date_fin=date.today() + timedelta(days=30), proprietaire=user
+        )
+        response = api_client.get(reverse('projet-detail', kwargs={'pk': projet.id + 1}))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_mecanisme_de_django(self):
+        # Vues de l'API marquées non atomiques ; les autres (admin, allauth) gardent
+        # ATOMIC_REQUESTS et toute la chaîne des middlewares (process_view, process_exception)
+        assert DEFAULT_DB_ALIAS in resolve(reverse('statistiques')).func._non_atomic_requests
+        assert not hasattr(resolve(reverse('account_login')).func, '_non_atomic_requests')
+
+    def test_pages_hors_api(self, client):
+        assert client.get(reverse('account_login')).status_code == status.HTTP_200_OK
@@ -0,0 +1,27 @@
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from rest_framework.permissions import SAFE_METHODS
+
+
+class LectureAutocommitMixin:
+    """
+    Vue DRF dont les lectures (GET, HEAD, OPTIONS) s'exécutent en autocommit malgré
+    ATOMIC_REQUESTS : chaque requête SQL voit les dernières données validées et aucune
+    transaction ne reste ouverte pendant la vue. La vue est marquée non atomique
+    (transaction.non_atomic_requests) et dispatch ouvre lui-même la transaction des
+    écritures. `lecture_atomique = True` garde aussi les lectures dans une transaction.
+    """
+    lecture_atomique = False
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
+
+    def dispatch(self, request, *args, **kwargs):
+        if (
+            not connections[DEFAULT_DB_ALIAS].settings_dict['ATOMIC_REQUESTS']
+            or (request.method in SAFE_METHODS and not self.lecture_atomique)
+        ):
+            return super().dispatch(request, *args, **kwargs)
+        # Comme make_view_atomic : les erreurs gérées par DRF annulent la transaction (set_rollback)
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            return super().dispatch(request, *args, **kwargs)
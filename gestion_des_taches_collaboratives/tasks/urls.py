@@ -1,16 +1,27 @@
 from django.urls import path
 
 from . import views
-from .views import TacheListCreateView, TacheDetailView, StatistiqueView, TacheStatsView
+from .views import (
+    TacheListCreateView, TacheDetailView, TacheStatutMasseView, StatistiqueView, TacheStatsView, CacheStatsView,
+    CalendrierView, DashboardView, ProjetOverviewView, SyncView, TicketFluxView
+)
 
 urlpatterns = [
     path('api/taches/', TacheListCreateView.as_view(), name='tache-list'),
     path('api/taches/<int:pk>/', TacheDetailView.as_view(), name='tache-detail'),
+    path('api/taches/statut/', TacheStatutMasseView.as_view(), name='tache-statut-masse'),
     path('api/projets/<int:projet_id>/taches/', TacheListCreateView.as_view(), name='projet-tache-list'),
     path('api/statistiques/', StatistiqueView.as_view(), name='statistiques'),
 
     # Routes pour les statistiques des tâches
     path('api/tache-stats/', TacheStatsView.as_view(), name='tache-stats'),
     path('api/projets/<int:projet_id>/tache-stats/', TacheStatsView.as_view(), name='tache-stats-projet'),
+    path('api/cache-stats/', CacheStatsView.as_view(), name='cache-stats'),
+    path('api/calendrier/', CalendrierView.as_view(), name='calendrier'),
+    path('api/dashboard/', DashboardView.as_view(), name='dashboard'),
+    path('api/projets/<int:pk>/overview/', ProjetOverviewView.as_view(), name='projet-overview'),
+    path('api/sync/', SyncView.as_view(), name='sync'),
+    path('api/evenements/', views.flux_evenements, name='evenements'),
+    path('api/evenements/ticket/', TicketFluxView.as_view(), name='evenements-ticket'),
 
 ]
\ No newline at end of file
@@ -1,9 +1,54 @@
-from rest_framework import generics, serializers, permissions
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Q
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from users.authentication import CHAMPS_ACCES, JWTAuthentificationLegere
+from rest_framework import generics, serializers, permissions, status
+from rest_framework.response import Response
+from django.urls import reverse
+from rest_framework.utils.urls import replace_query_param
 from projects.models import Projet
+from projects.serializer import optimiser_projets
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics
-from .models import Tache
-from .serializers import TacheSerializer
+from .masse import changer_statut, creer_taches
+from .models import CompletionJournaliere, Tache, TacheAssignation
+from .serializers import (
+    CalendrierParametresSerializer,
+    CalendrierSerializer,
+    DashboardSerializer,
+    ProjetOverviewSerializer,
+    SyncSerializer,
+    TacheCreationMasseSerializer,
+    TacheSerializer,
+    TacheStatutMasseSerializer,
+    charger_assignes,
+    optimiser_taches,
+    prefetch_assignes,
+)
+from .champs import ChampsDynamiquesViewMixin
+from .evenements import TicketFlux, bus
+from .identite import carte_identite
+from .repliques import LectureRepliqueMixin
+from .transactions import LectureAutocommitMixin
+from .cache import (
+    VERSION_GLOBALE,
+    VERSION_UTILISATEURS,
+    VersionETagMixin,
+    cle_version_projet,
+    reponse_en_cache,
+    statistiques_cache,
+)
+from .pagination import StatistiquePagination, TacheCursorPagination
+from .sync import decoder_curseur, encoder_curseur, lire_modifications
 from .permission import EstProprietaireDuProjet, EstProprietaireOuAssigne
 from .swagger import (
     tache_list_swagger,
@@ -12,53 +57,128 @@ from .swagger import (
     tache_detail_swagger,
     tache_update_swagger,
     tache_delete_swagger,
+    tache_statut_masse_swagger,
+    calendrier_swagger,
+    dashboard_swagger,
+    projet_overview_swagger,
+    sync_swagger,
+    ticket_flux_swagger,
     statistique_list_swagger,
     tache_stats_swagger,
     tache_stats_by_project_swagger  # Nouveau décorateur pour les stats par projet
 )
 
+def contexte_assignes(request, context):
+    """Contexte d'écriture d'une tâche : ses assignés chargés en une requête (voir charger_assignes)"""
+    if request.method not in permissions.SAFE_METHODS and isinstance(request.data, dict):
+        context['assignes'] = charger_assignes([request.data])
+    return context
+
+
 #  Seuls les créateurs du projet peuvent ajouter une tâche
-class TacheListCreateView(generics.ListCreateAPIView):
+class TacheListCreateView(LectureAutocommitMixin, LectureRepliqueMixin, ChampsDynamiquesViewMixin, VersionETagMixin, generics.ListCreateAPIView):
     serializer_class = TacheSerializer
     permission_classes = [permissions.IsAuthenticated, EstProprietaireDuProjet]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['statut', 'date_limite', 'assigne_a', 'projet']
+    pagination_class = TacheCursorPagination
 
     def get_queryset(self):
+        queryset = optimiser_taches(Tache.objects.all(), self.champs_serialises())
         projet_id = self.kwargs.get('projet_id')
         if projet_id:
-            return Tache.objects.filter(projet_id=projet_id)
-        return Tache.objects.all()
+            return queryset.filter(projet_id=projet_id)
+        return queryset
+
+    def get_etag_versions(self):
+        # Limitée à un projet, la liste ne change qu'avec ce projet
+        projet_id = self.kwargs.get('projet_id') or self.request.query_params.get('projet')
+        if projet_id:
+            return [cle_version_projet(projet_id), VERSION_UTILISATEURS]
+        return [VERSION_GLOBALE, VERSION_UTILISATEURS]
 
-    # Utiliser le décorateur approprié selon la présence ou non d'un projet_id
+    # Les deux routes (avec ou sans projet_id) partagent la même liste
+    @tache_list_swagger
     def get(self, request, *args, **kwargs):
-        if 'projet_id' in self.kwargs:
-            return self.list(request, *args, **kwargs)
-        return self.list(request, *args, **kwargs)
+        return super().get(request, *args, **kwargs)
 
     # Le décorateur original peut être utilisé pour POST car il ne dépend pas du projet_id
     @tache_create_swagger
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
 
+    def get_serializer_context(self):
+        return contexte_assignes(self.request, super().get_serializer_context())
+
     def perform_create(self, serializer):
         projet_id = self.request.data.get('projet')
-        projet = Projet.objects.get(id=projet_id)
+        projet = carte_identite(self.request).obtenir(Projet, projet_id)
+        if projet is None:
+            raise serializers.ValidationError({'projet': "Projet introuvable."})
 
         #  Vérification du propriétaire du projet
-        if projet.proprietaire != self.request.user:
+        if projet.proprietaire_id != self.request.user.pk:
             raise serializers.ValidationError("Vous n'êtes pas autorisé à ajouter une tâche à ce projet.")
 
         #  Enregistrer la tâche
         serializer.save(projet=projet)
 
+    def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            return self.creer_en_masse(request)
+        return super().create(request, *args, **kwargs)
+
+    def creer_en_masse(self, request):
+        """
+        Crée une liste de tâches dans le projet de l'URL (propriété vérifiée une fois par
+        EstProprietaireDuProjet). Les éléments invalides sont signalés par leur index sans
+        bloquer les autres (réponse 207), sauf avec ?atomique=1 où rien n'est créé.
+        """
+        projet_id = self.kwargs.get('projet_id')
+        if projet_id is None:
+            raise serializers.ValidationError("La création en masse se fait via /api/projets/<id>/taches/.")
+        if len(request.data) > settings.TACHE_MASSE_MAX:
+            raise serializers.ValidationError(f"Au plus {settings.TACHE_MASSE_MAX} tâches par requête.")
+        atomique = request.query_params.get('atomique') in ('1', 'true')
+
+        context = {**self.get_serializer_context(), 'assignes': charger_assignes(request.data)}
+        valides, erreurs = [], []
+        for index, donnees in enumerate(request.data):
+            serializer = TacheCreationMasseSerializer(data=donnees, context=context)
+            if serializer.is_valid():
+                valides.append(serializer.validated_data)
+            else:
+                erreurs.append({'index': index, 'erreurs': serializer.errors})
+
+        if erreurs and (atomique or not valides):
+            return Response({'crees': [], 'erreurs': erreurs}, status=status.HTTP_400_BAD_REQUEST)
+
+        taches = creer_taches(projet_id, valides)
+        crees = Tache.objects.filter(pk__in=[tache.pk for tache in taches]).prefetch_related(prefetch_assignes())
+        return Response(
+            {'crees': TacheSerializer(crees.order_by('id'), many=True, context=context).data, 'erreurs': erreurs},
+            status=status.HTTP_207_MULTI_STATUS if erreurs else status.HTTP_201_CREATED
+        )
+
 
 #  Seuls les créateurs ou l'assigné peuvent modifier ou supprimer la tâche
-class TacheDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Tache.objects.all()
+class TacheDetailView(LectureAutocommitMixin, ChampsDynamiquesViewMixin, VersionETagMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = TacheSerializer
     permission_classes = [permissions.IsAuthenticated, EstProprietaireOuAssigne]
 
+    def get_queryset(self):
+        return optimiser_taches(Tache.objects.all(), self.champs_serialises())
+
+    def get_object(self):
+        return carte_identite(self.request).enregistrer(super().get_object())
+
+    def get_etag_versions(self):
+        # Un déplacement de tâche invalide l'ancien et le nouveau projet
+        projet_id = Tache.objects.filter(pk=self.kwargs['pk']).values_list('projet_id', flat=True).first()
+        if projet_id is None:
+            return None
+        return [cle_version_projet(projet_id), VERSION_UTILISATEURS]
+
     @tache_detail_swagger
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
@@ -75,67 +195,172 @@ class TacheDetailView(generics.RetrieveUpdateDestroyAPIView):
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
 
-    def perform_update(self, serializer):
-        instance = serializer.save()
+    def get_serializer_context(self):
+        return contexte_assignes(self.request, super().get_serializer_context())
 
-        # Itérer sur la liste d'utilisateurs
-        for user in instance.assigne_a.all():
-            if user.role == "enseignant" and self.request.user.role == "etudiant":
+    def perform_update(self, serializer):
+        # Vérifié avant l'écriture, sur les assignés qu'aura la tâche après la modification
+        if self.request.user.role == "etudiant":
+            if 'assigne_a' in serializer.validated_data:
+                # Rôles chargés avec les assignés, en une requête (contexte_assignes)
+                assigne_enseignant = any(user.role == "enseignant" for user in serializer.validated_data['assigne_a'])
+            else:
+                assigne_enseignant = TacheAssignation.objects.filter(
+                    tache_id=serializer.instance.pk, customuser__role="enseignant"
+                ).exists()
+            if assigne_enseignant:
                 raise serializers.ValidationError("Un étudiant ne peut pas assigner une tâche à un enseignant.")
 
-        return instance
+        return serializer.save()
+
+
+# Colonnes de CalendrierSerializer
+CHAMPS_CALENDRIER = ('id', 'titre', 'statut', 'date_limite', 'projet_id', 'projet__nom')
+
+
+def taches_de_l_utilisateur(utilisateur, champs, **filtres):
+    """
+    Tâches assignées à l'utilisateur ou appartenant à ses projets, en values(*champs).
+    UNION de deux parcours indexés plutôt qu'un OR sur deux jointures : (customuser, tache)
+    de la table d'assignation, et (projet, date_limite, id) des projets possédés.
+    """
+    assignees = Tache.objects.filter(assigne_a=utilisateur, **filtres).values(*champs)
+    possedees = Tache.objects.filter(projet__proprietaire=utilisateur, **filtres).values(*champs)
+    return assignees.union(possedees)
+
+
+class CalendrierView(LectureAutocommitMixin, VersionETagMixin, generics.ListAPIView):
+    """
+    Tâches de l'utilisateur (assignées ou dans ses projets) dont la date limite est
+    dans [start, end], sans pagination : une fenêtre tient dans une seule réponse.
+    """
+    serializer_class = CalendrierSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+
+    def get_etag_versions(self):
+        return [VERSION_GLOBALE]
+
+    def get_queryset(self):
+        parametres = CalendrierParametresSerializer(data=self.request.query_params)
+        parametres.is_valid(raise_exception=True)
+        filtres = {'date_limite__range': (parametres.validated_data['start'], parametres.validated_data['end'])}
+        if 'statut' in parametres.validated_data:
+            filtres['statut'] = parametres.validated_data['statut']
+        return taches_de_l_utilisateur(self.request.user, CHAMPS_CALENDRIER, **filtres).order_by('date_limite', 'id')
+
+    @calendrier_swagger
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class TacheStatutMasseView(generics.GenericAPIView):
+    """Change le statut d'une liste de tâches (propriétaire du projet ou assigné, pour chacune)"""
+    serializer_class = TacheStatutMasseSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    @tache_statut_masse_swagger
+    def patch(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        statut = serializer.validated_data['statut']
+
+        modifiees, introuvables, interdites = changer_statut(request.user, serializer.validated_data['ids'], statut)
+        if introuvables:
+            return Response({'detail': "Tâches introuvables.", 'ids': introuvables}, status=status.HTTP_404_NOT_FOUND)
+        if interdites:
+            return Response(
+                {'detail': "Vous n'êtes ni propriétaire du projet ni assigné à ces tâches.", 'ids': interdites},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return Response({'statut': statut, 'modifiees': modifiees})
 
 
 from django.utils.timezone import now
 from datetime import timedelta
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.filters import OrderingFilter
 from .serializers import StatistiqueSerializer
 from users.models import CustomUser
-from django.db.models import Count, Q
+from django.db.models import (
+    Case, CharField, ExpressionWrapper, F, FloatField, OuterRef, Subquery, Sum, Value, When
+)
+from django.db.models.functions import Coalesce, Round
 
 # ici boul faté pourque sa marche faut mettre dans setting USE_TZ = False a cause des date la
-class StatistiqueView(generics.ListAPIView):
+def statistiques_utilisateurs():
+    """Utilisateurs annotés de leurs statistiques (voir StatistiqueSerializer)"""
+    today = now().date()
+    il_y_a_3_mois = today - timedelta(days=90)
+    il_y_a_1_an = today - timedelta(days=365)
+
+    # Compteurs lus dans StatistiqueUtilisateur / CompletionJournaliere (tasks/signals.py)
+    # au lieu de joindre toutes les tâches assignées
+    def terminees_depuis(jour):
+        return Coalesce(Subquery(
+            CompletionJournaliere.objects.filter(utilisateur=OuterRef('pk'), jour__gte=jour)
+            .values('utilisateur')
+            .annotate(total=Sum('nombre'))
+            .values('total')
+        ), 0)
+
+    utilisateurs = CustomUser.objects.only('id', 'username', 'role').annotate(
+        taches_totales=Coalesce(F('statistique__taches_totales'), 0),
+        taches_terminees=Coalesce(F('statistique__taches_terminees'), 0),
+        taches_terminees_recent=terminees_depuis(il_y_a_3_mois),
+        taches_terminees_annuelles=terminees_depuis(il_y_a_1_an),
+    )
+
+    # Taux, prime et badge sont calculés par la base : seule la page demandée est chargée
+    return utilisateurs.annotate(
+        taux_completion=Case(
+            When(taches_totales__gt=0, then=Round(
+                ExpressionWrapper(F('taches_terminees') * 100.0 / F('taches_totales'), output_field=FloatField()),
+                2
+            )),
+            default=Value(0.0),
+            output_field=FloatField(),
+        ),
+    ).annotate(
+        prime=Case(
+            When(role="enseignant", taux_completion=100, then=Value("100000$")),
+            When(role="enseignant", taux_completion__gte=90, then=Value("30000$")),
+            When(role="enseignant", then=Value("0$")),
+            default=Value("Non concerné"),
+            output_field=CharField(),
+        ),
+        badge=Case(
+            When(taux_completion=100, then=Value("Top Performer")),
+            When(taux_completion__gte=90, then=Value("Très bon")),
+            When(taux_completion__gte=70, then=Value("Bon")),
+            default=Value("En progrès"),
+            output_field=CharField(),
+        ),
+    )
+
+
+class StatistiqueView(LectureAutocommitMixin, LectureRepliqueMixin, generics.ListAPIView):
     serializer_class = StatistiqueSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StatistiquePagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    # role__in : plusieurs rôles à la fois (le client exclut les administrateurs)
+    filterset_fields = {'role': ['exact', 'in'], 'username': ['exact']}
+    # id en second critère (?ordering=-taux_completion,id) : pages stables
+    ordering_fields = ['username', 'taches_totales', 'taches_terminees', 'taux_completion', 'id']
+    ordering = ['id']
 
     @statistique_list_swagger
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
-    def get_queryset(self):
-        today = now().date()
-        il_y_a_3_mois = today - timedelta(days=90)
-        il_y_a_1_an = today - timedelta(days=365)
-
-        utilisateurs = CustomUser.objects.annotate(
-            taches_totales=Count('taches_assignees'),
-            taches_terminees=Count('taches_assignees', filter=Q(taches_assignees__statut="TERMINE")),
-            taches_terminees_recent=Count('taches_assignees', filter=Q(
-                taches_assignees__statut="TERMINE",
-                taches_assignees__date_limite__gte=il_y_a_3_mois
-            )),
-            taches_terminees_annuelles=Count('taches_assignees', filter=Q(
-                taches_assignees__statut="TERMINE",
-                taches_assignees__date_limite__gte=il_y_a_1_an
-            )),
-        ).all()
-
-        for user in utilisateurs:
-            user.taux_completion = round(
-                (user.taches_terminees / user.taches_totales * 100) if user.taches_totales > 0 else 0, 2
-            )
-            user.role = getattr(user, 'role', 'Utilisateur')
-            if user.role == "enseignant":
-                if user.taux_completion == 100:
-                    user.prime = "100000$"
-                elif user.taux_completion >= 90:
-                    user.prime = "30000$"
-                else:
-                    user.prime = "0$"
-            else:
-                user.prime = "Non concerné"
+    def list(self, request, *args, **kwargs):
+        return reponse_en_cache(
+            'statistiques', request, lambda: super(StatistiqueView, self).list(request, *args, **kwargs)
+        )
 
-        return utilisateurs
+    def get_queryset(self):
+        return statistiques_utilisateurs()
 
 
 from rest_framework.views import APIView
@@ -143,39 +368,47 @@ from rest_framework.response import Response
 from rest_framework import permissions, status
 
 
-class TacheStatsView(APIView):
+class TacheStatsView(LectureAutocommitMixin, LectureRepliqueMixin, APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, projet_id=None):
         if projet_id is not None:
-            return self._get_stats_by_project_id(request, projet_id)
+            return reponse_en_cache(
+                'tache-stats', request, lambda: self._get_stats_by_project_id(request, projet_id), projet_id
+            )
         else:
-            return self._get_global_stats(request)
+            return reponse_en_cache(
+                'tache-stats', request, lambda: self._get_global_stats(request), request.query_params.get('projet')
+            )
+
+    @staticmethod
+    def _calculer_stats(projets):
+        # Somme des compteurs tenus à jour sur Projet (tasks/signals.py) : aucune lecture des tâches
+        stats = projets.aggregate(
+            a_faire=Coalesce(Sum('taches_a_faire'), 0),
+            en_cours=Coalesce(Sum('taches_en_cours'), 0),
+            termine=Coalesce(Sum('taches_terminees'), 0),
+        )
+        stats['total'] = stats['a_faire'] + stats['en_cours'] + stats['termine']
+
+        # Calculer le pourcentage de progression
+        if stats['total'] > 0:
+            stats['progression'] = round((stats['termine'] / stats['total']) * 100)
+        else:
+            stats['progression'] = 0
+
+        return stats
 
     @tache_stats_swagger
     def _get_global_stats(self, request):
         try:
             projet_param = request.query_params.get('projet')
             if projet_param:
-                queryset = Tache.objects.filter(projet_id=projet_param)
+                projets = Projet.objects.filter(id=projet_param)
             else:
-                queryset = Tache.objects.all()
-
-
-            stats = {
-                'total': queryset.count(),
-                'a_faire': queryset.filter(statut='A_FAIRE').count(),
-                'en_cours': queryset.filter(statut='EN_COURS').count(),
-                'termine': queryset.filter(statut='TERMINE').count(),
-            }
+                projets = Projet.objects.all()
 
-            # Calculer le pourcentage de progression
-            if stats['total'] > 0:
-                stats['progression'] = round((stats['termine'] / stats['total']) * 100)
-            else:
-                stats['progression'] = 0
-
-            return Response(stats)
+            return Response(self._calculer_stats(projets))
         except Exception as e:
             print(f"Erreur dans TacheStatsView: {str(e)}")
             return Response(
@@ -186,25 +419,271 @@ class TacheStatsView(APIView):
     @tache_stats_by_project_swagger
     def _get_stats_by_project_id(self, request, projet_id):
         try:
-            queryset = Tache.objects.filter(projet_id=projet_id)
-
-            stats = {
-                'total': queryset.count(),
-                'a_faire': queryset.filter(statut='A_FAIRE').count(),
-                'en_cours': queryset.filter(statut='EN_COURS').count(),
-                'termine': queryset.filter(statut='TERMINE').count(),
-            }
-
-            # Calculer le pourcentage de progression
-            if stats['total'] > 0:
-                stats['progression'] = round((stats['termine'] / stats['total']) * 100)
-            else:
-                stats['progression'] = 0
+            projets = Projet.objects.filter(id=projet_id)
 
-            return Response(stats)
+            return Response(self._calculer_stats(projets))
         except Exception as e:
             print(f"Erreur dans TacheStatsView: {str(e)}")
             return Response(
                 {"error": "Une erreur s'est produite lors du calcul des statistiques."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+
+class CacheStatsView(LectureAutocommitMixin, APIView):
+    """Compteurs de succès / défauts du cache des statistiques (processus courant)"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(statistiques_cache())
+
+
+class DashboardView(LectureAutocommitMixin, VersionETagMixin, generics.RetrieveAPIView):
+    """
+    Tableau de bord de l'utilisateur en un nombre fixe de requêtes agrégées : ses projets
+    récents, ses tâches par statut, ses prochaines échéances et sa ligne de statistiques.
+    """
+    serializer_class = DashboardSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_etag_versions(self):
+        return [VERSION_GLOBALE]
+
+    def get_etag_contexte(self):
+        # Échéances à venir et fenêtres de 90 / 365 jours : la réponse change à minuit
+        return [now().date()]
+
+    @dashboard_swagger
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_object(self):
+        utilisateur = self.request.user
+        projets = Projet.objects.filter(Q(proprietaire=utilisateur) | Q(pk__in=utilisateur.projets.values('pk')))
+        recents = (
+            projets.only('id', 'nom', 'etat', 'date_fin', *Projet.COMPTEURS_TACHES.values())
+            .annotate(nombre_membres=Count('membres'))
+            .order_by('-date_creation', '-id')[:settings.DASHBOARD_PROJETS]
+        )
+
+        par_statut = dict(
+            TacheAssignation.objects.filter(customuser=utilisateur)
+            .values_list('tache__statut')
+            .annotate(nombre=Count('id'))
+            .order_by()
+        )
+        taches = {
+            'a_faire': par_statut.get('A_FAIRE', 0),
+            'en_cours': par_statut.get('EN_COURS', 0),
+            'termine': par_statut.get('TERMINE', 0),
+        }
+        taches['total'] = sum(taches.values())
+
+        echeances = taches_de_l_utilisateur(
+            utilisateur, CHAMPS_CALENDRIER, date_limite__gte=now().date(), statut__in=['A_FAIRE', 'EN_COURS']
+        ).order_by('date_limite', 'id')[:settings.DASHBOARD_ECHEANCES]
+
+        return {
+            'nombre_projets': projets.count(),
+            'projets': recents,
+            'taches': taches,
+            'echeances': echeances,
+            'statistique': statistiques_utilisateurs().filter(pk=utilisateur.pk).first(),
+        }
+
+
+def utilisateurs_assignables(utilisateur):
+    """
+    Utilisateurs actifs que l'utilisateur peut assigner à une tâche : un étudiant
+    n'assigne que des étudiants, un enseignant des étudiants et des enseignants.
+    """
+    utilisateurs = CustomUser.objects.filter(is_active=True).only('id', 'username', 'role').order_by('username')
+    if utilisateur.role == 'etudiant':
+        return utilisateurs.filter(role='etudiant')
+    if utilisateur.role == 'enseignant':
+        return utilisateurs.filter(role__in=['etudiant', 'enseignant'])
+    return utilisateurs
+
+
+class ProjetOverviewView(LectureAutocommitMixin, VersionETagMixin, generics.RetrieveAPIView):
+    """
+    Vue d'ensemble d'un projet pour sa page de détail, en un nombre fixe de requêtes :
+    le projet et ses membres, la première page de ses tâches, ses statistiques (tirées
+    des compteurs du projet) et les utilisateurs assignables.
+    """
+    serializer_class = ProjetOverviewSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return optimiser_projets(Projet.objects.all(), None)
+
+    def get_etag_versions(self):
+        return [cle_version_projet(self.kwargs['pk']), VERSION_UTILISATEURS]
+
+    @projet_overview_swagger
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_object(self):
+        projet = super().get_object()
+
+        pagination = TacheCursorPagination()
+        page = pagination.paginate_queryset(
+            optimiser_taches(Tache.objects.filter(projet=projet), None), self.request, view=self
+        )
+        # Les pages suivantes se lisent sur la liste des tâches du projet, même curseur
+        base_url = self.request.build_absolute_uri(reverse('projet-tache-list', kwargs={'projet_id': projet.pk}))
+        if pagination.page_size_query_param in self.request.query_params:
+            base_url = replace_query_param(base_url, pagination.page_size_query_param, pagination.page_size)
+        pagination.base_url = base_url
+
+        return {
+            'projet': projet,
+            'taches': {
+                'next': pagination.get_next_link(),
+                'previous': pagination.get_previous_link(),
+                'results': page,
+            },
+            'stats': {
+                'total': projet.taches_total,
+                'a_faire': projet.taches_a_faire,
+                'en_cours': projet.taches_en_cours,
+                'termine': projet.taches_terminees,
+                'progression': projet.progression,
+            },
+            'utilisateurs': utilisateurs_assignables(self.request.user),
+        }
+
+
+class SyncView(LectureAutocommitMixin, generics.RetrieveAPIView):
+    """
+    Flux des tâches et projets modifiés ou supprimés depuis ?since=<curseur>, lu par
+    l'index (date de modification, id) de chaque table. Sans curseur, le flux part du
+    début : les appels successifs avec le curseur renvoyé constituent une copie complète.
+    """
+    serializer_class = SyncSerializer
+    permission_classes = [IsAuthenticated]
+    # Les trois flux lus dans un même instantané (voir LectureAutocommitMixin)
+    lecture_atomique = True
+
+    @sync_swagger
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_object(self):
+        positions = decoder_curseur(self.request.query_params.get('since'))
+        lignes, suivantes, reste, a_jour = lire_modifications(positions, settings.SYNC_LIMITE)
+        return {**lignes, 'curseur': encoder_curseur(suivantes, a_jour), 'suite': reste}
+
+
+class TicketFluxView(APIView):
+    """Ticket d'ouverture de /api/evenements/ (voir TicketFlux), pour EventSource"""
+    permission_classes = [IsAuthenticated]
+
+    @ticket_flux_swagger
+    def post(self, request):
+        ticket = TicketFlux.for_user(request.user)
+        ticket['fin'] = request.auth['exp']
+        return Response({'ticket': str(ticket)}, status=status.HTTP_201_CREATED)
+
+
+def authentifier_flux(request):
+    """
+    (utilisateur, fin) du ticket ?ticket= (TicketFlux) ou du jeton d'accès de l'en-tête
+    Authorization ; `fin` est l'expiration du jeton d'accès (timestamp). None si absent ou invalide.
+    """
+    authentification = JWTAuthentificationLegere()
+    try:
+        brut = request.GET.get('ticket')
+        if brut:
+            jeton = TicketFlux(brut)
+            return authentification.get_user(jeton), jeton['fin']
+        entete = authentification.get_header(request)
+        brut = entete and authentification.get_raw_token(entete)
+        if not brut:
+            return None
+        jeton = authentification.get_validated_token(brut)
+        return authentification.get_user(jeton), jeton['exp']
+    except (AuthenticationFailed, InvalidToken, TokenError, KeyError):
+        return None
+
+
+def projets_suivis(utilisateur, demandes):
+    """Projets dont l'utilisateur est propriétaire ou membre, restreints à ?projet= si donné"""
+    projets = set(
+        Projet.objects.filter(Q(proprietaire=utilisateur) | Q(membres=utilisateur)).values_list('id', flat=True)
+    )
+    if not demandes:
+        return projets
+    try:
+        demandes = {int(projet_id) for projet_id in demandes}
+    except ValueError:
+        return None
+    return demandes if demandes <= projets else None
+
+
+def abonnement_autorise(utilisateur, projet_ids):
+    """
+    L'utilisateur n'a perdu aucun accès depuis l'ouverture du flux (compte désactivé, rôle
+    ou mot de passe changés : voir CHAMPS_ACCES) et suit toujours les projets de l'abonnement
+    """
+    acces = CustomUser.objects.filter(pk=utilisateur.pk).values_list(*CHAMPS_ACCES).first()
+    if acces != tuple(getattr(utilisateur, champ) for champ in CHAMPS_ACCES):
+        return False
+    return projets_suivis(utilisateur, projet_ids) is not None
+
+
+async def _flux_evenements(utilisateur, projet_ids, fin):
+    async with bus().abonner(projet_ids) as abonnement:
+        verifie_le = time.monotonic()
+        yield ': connecté\n\n'
+        while True:
+            evenement = await abonnement.suivant(min(settings.EVENEMENTS_KEEPALIVE, max(fin - time.time(), 0)))
+            if time.time() >= fin:
+                # Jeton d'accès expiré : le client rouvre le flux avec un nouveau ticket
+                yield 'event: expire\ndata: {}\n\n'
+                return
+            # Autorisation revérifiée au plus toutes les EVENEMENTS_KEEPALIVE secondes, avant
+            # de remettre quoi que ce soit : un membre retiré ne reçoit plus rien
+            if time.monotonic() - verifie_le >= settings.EVENEMENTS_KEEPALIVE:
+                if not await sync_to_async(abonnement_autorise)(utilisateur, projet_ids):
+                    return
+                verifie_le = time.monotonic()
+            if abonnement.debordement:
+                # Des événements ont été perdus : le client relit ses données via /api/sync/
+                abonnement.debordement = False
+                yield 'event: resynchroniser\ndata: {}\n\n'
+            if evenement is None:
+                # Commentaire SSE : garde la connexion ouverte à travers les proxys
+                yield ': keepalive\n\n'
+            else:
+                yield f"event: {evenement['type']}\ndata: {json.dumps(evenement)}\n\n"
+
+
+@transaction.non_atomic_requests
+@require_GET
+async def flux_evenements(request):
+    """
+    Server-Sent Events : modifications des tâches et projets dont l'utilisateur est membre
+    ou propriétaire (événements 'tache.creee', 'tache.modifiee', 'tache.supprimee',
+    'projet.cree', 'projet.modifie', 'projet.supprime'). Nécessite un serveur ASGI.
+    Authentification par l'en-tête Authorization ou par ?ticket= (POST /api/evenements/ticket/) ;
+    un jeton d'accès n'est jamais accepté dans l'URL, où il finirait dans les journaux.
+    Le flux se ferme dès que l'utilisateur perd ses accès ou quitte un des projets suivis,
+    et à l'expiration du jeton d'accès (événement 'expire').
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({'detail': "Ce flux nécessite un serveur ASGI."}, status=501)
+    authentification = await sync_to_async(authentifier_flux)(request)
+    if authentification is None:
+        return JsonResponse({'detail': "Authentification requise."}, status=401)
+    utilisateur, fin = authentification
+    projet_ids = await sync_to_async(projets_suivis)(utilisateur, request.GET.getlist('projet'))
+    if projet_ids is None:
+        return JsonResponse({'detail': "Vous n'êtes pas membre de ces projets."}, status=403)
+
+    response = StreamingHttpResponse(_flux_evenements(utilisateur, projet_ids, fin), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Pas de mise en tampon par nginx
+    response['X-Accel-Buffering'] = 'no'
+    return response
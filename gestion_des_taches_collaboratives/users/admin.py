@@ -2,6 +2,11 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.forms import UserCreationForm
+from django.db import transaction
+
+from tasks.cache import invalider_utilisateurs
+
+from .authentication import revoquer
 from .models import CustomUser
 
 
@@ -59,13 +64,22 @@ class CustomUserAdmin(UserAdmin):
     )
 
     def activate_users(self, request, queryset):
-        updated = queryset.update(is_active=True)
+        updated = self._changer_activation(queryset, True)
         self.message_user(request, f"{updated} compte(s) activé(s) avec succès.")
 
     def deactivate_users(self, request, queryset):
-        updated = queryset.update(is_active=False)
+        updated = self._changer_activation(queryset, False)
         self.message_user(request, f"{updated} compte(s) désactivé(s) avec succès.")
 
+    def _changer_activation(self, queryset, actif):
+        # update() ne passe pas par les signaux : révocation explicite des jetons et du cache,
+        # et invalidation des réponses qui exposent is_active (listes d'utilisateurs, assignables)
+        user_ids = list(queryset.values_list('id', flat=True))
+        updated = CustomUser.objects.filter(pk__in=user_ids).update(is_active=actif)
+        transaction.on_commit(lambda: revoquer(user_ids))
+        invalider_utilisateurs()
+        return updated
+
     activate_users.short_description = "Activer les comptes sélectionnés"
     deactivate_users.short_description = "Désactiver les comptes sélectionnés"
 
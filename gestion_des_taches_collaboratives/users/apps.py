@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        # Révocation des jetons et du cache d'authentification (voir users/authentication.py)
+        from . import signals  # noqa: F401
@@ -0,0 +1,222 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from tasks.cache import cache_partage
+
+from .models import CustomUser
+
+# Champs dont la modification invalide les jetons déjà émis et les utilisateurs en cache
+CHAMPS_ACCES = ('is_active', 'role', 'password')
+
+
+def cle_revocation(user_id):
+    return f'auth:revocation:{user_id}'
+
+
+def _revocation(partage, user_id):
+    """Date de la dernière révocation de l'utilisateur dans le cache partagé, ou None"""
+    return partage.get(cle_revocation(user_id))
+
+
+class CacheUtilisateurs:
+    """
+    Utilisateurs complets du processus, par id : au plus `taille` entrées (les moins
+    récemment lues sont évincées), chacune valable `duree` secondes.
+    """
+
+    def __init__(self, taille, duree):
+        self.taille = taille
+        self.duree = duree
+        self._entrees = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def lire(self, user_id, revocation=None):
+        """Utilisateur en cache, s'il a été chargé après la dernière révocation et n'a pas expiré"""
+        with self._verrou:
+            entree = self._entrees.get(user_id)
+            if entree is None:
+                return None
+            utilisateur, charge_le = entree
+            if time.time() - charge_le > self.duree or (revocation is not None and charge_le <= revocation):
+                del self._entrees[user_id]
+                return None
+            self._entrees.move_to_end(user_id)
+            return utilisateur
+
+    def ecrire(self, utilisateur):
+        with self._verrou:
+            self._entrees[utilisateur.pk] = (utilisateur, time.time())
+            self._entrees.move_to_end(utilisateur.pk)
+            while len(self._entrees) > self.taille:
+                self._entrees.popitem(last=False)
+
+    def retirer(self, user_ids):
+        with self._verrou:
+            for user_id in user_ids:
+                self._entrees.pop(user_id, None)
+
+    def vider(self):
+        with self._verrou:
+            self._entrees.clear()
+
+
+class CacheJetons:
+    """
+    Jetons déjà vérifiés (signature, type, expiration), par empreinte SHA-256 du jeton brut :
+    au plus `taille` entrées (les moins récemment lues sont évincées), chacune gardée
+    jusqu'à l'expiration (claim exp) du jeton. `succes` et `echecs` comptent les lectures.
+    """
+
+    def __init__(self, taille):
+        self.taille = taille
+        self._entrees = OrderedDict()
+        self._verrou = threading.Lock()
+        self.succes = 0
+        self.echecs = 0
+
+    @staticmethod
+    def empreinte(brut):
+        return hashlib.sha256(brut if isinstance(brut, bytes) else brut.encode()).digest()
+
+    def lire(self, cle):
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None and entree[1] <= time.time():
+                del self._entrees[cle]
+                entree = None
+            if entree is None:
+                self.echecs += 1
+                return None
+            self.succes += 1
+            self._entrees.move_to_end(cle)
+            return entree[0]
+
+    def ecrire(self, cle, jeton):
+        with self._verrou:
+            self._entrees[cle] = (jeton, jeton['exp'])
+            self._entrees.move_to_end(cle)
+            while len(self._entrees) > self.taille:
+                self._entrees.popitem(last=False)
+
+    def statistiques(self):
+        with self._verrou:
+            lectures = self.succes + self.echecs
+            return {
+                'entrees': len(self._entrees),
+                'succes': self.succes,
+                'echecs': self.echecs,
+                'taux_succes': self.succes / lectures if lectures else 0.0,
+            }
+
+    def vider(self):
+        with self._verrou:
+            self._entrees.clear()
+            self.succes = self.echecs = 0
+
+
+utilisateurs = CacheUtilisateurs(settings.AUTH_CACHE_UTILISATEURS_MAX, settings.AUTH_CACHE_UTILISATEURS_DUREE)
+jetons = CacheJetons(settings.AUTH_CACHE_JETONS_MAX)
+
+
+def revoquer(user_ids):
+    """
+    is_active, rôle ou mot de passe modifiés : les utilisateurs en cache ne font plus foi
+    et les jetons de ces utilisateurs, dont les claims peuvent être périmés, sont vérifiés
+    en base jusqu'à l'expiration du dernier jeton de rafraîchissement émis avant.
+    La marque est posée dans cache_partage() pour être vue de tous les workers ; sans
+    cache partagé, l'authentification lit déjà la base à chaque requête. Ce cache ne doit
+    rien évincer avant expiration (voir CACHES['partage']) : sans la marque, les claims
+    du jeton seraient de nouveau crus.
+    """
+    user_ids = list(user_ids)
+    partage = cache_partage()
+    if partage is not None:
+        maintenant = time.time()
+        partage.set_many(
+            {cle_revocation(user_id): maintenant for user_id in user_ids},
+            timeout=api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()
+        )
+    utilisateurs.retirer(user_ids)
+
+
+class JWTAuthentificationLegere(JWTAuthentication):
+    """
+    JWTAuthentication sans lecture de la table des utilisateurs à chaque requête :
+    - en lecture (GET, HEAD, OPTIONS), l'utilisateur est construit depuis les claims
+      user_id et role du jeton (CustomUser.get_token) ; ses autres champs sont chargés
+      à la demande ;
+    - en écriture, l'utilisateur complet vient d'un cache du processus (CacheUtilisateurs).
+    Un utilisateur révoqué (revoquer()) repasse par la base dans les deux cas.
+    Les révocations devant être vues de tous les workers, ces deux raccourcis exigent un
+    cache partagé (cache_partage()) : sans lui, l'utilisateur est lu en base à chaque requête.
+    Un jeton déjà vérifié n'est pas redécodé (CacheJetons, désactivable par AUTH_CACHE_JETONS).
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        brut = self.get_raw_token(header)
+        if brut is None:
+            return None
+        jeton = self.get_validated_token(brut)
+
+        if request.method in SAFE_METHODS:
+            utilisateur = self.utilisateur_du_jeton(jeton)
+            if utilisateur is not None:
+                return utilisateur, jeton
+        return self.get_user(jeton), jeton
+
+    def get_validated_token(self, raw_token):
+        if not settings.AUTH_CACHE_JETONS:
+            return super().get_validated_token(raw_token)
+        cle = jetons.empreinte(raw_token)
+        jeton = jetons.lire(cle)
+        if jeton is None:
+            jeton = super().get_validated_token(raw_token)
+            jetons.ecrire(cle, jeton)
+        return jeton
+
+    def utilisateur_du_jeton(self, jeton):
+        """Utilisateur construit depuis les claims, ou None s'ils manquent ou ont été révoqués"""
+        partage = cache_partage()
+        user_id = jeton.get(api_settings.USER_ID_CLAIM)
+        role = jeton.get('role')
+        if partage is None or user_id is None or role is None or _revocation(partage, user_id) is not None:
+            return None
+        connus = {'id': user_id, 'role': role, 'is_active': True}
+        if 'username' in jeton:
+            connus['username'] = jeton['username']
+        champs = [field.attname for field in CustomUser._meta.concrete_fields if field.attname in connus]
+        return CustomUser.from_db('default', champs, [connus[champ] for champ in champs])
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Le jeton ne contient pas d'identifiant d'utilisateur.")
+
+        partage = cache_partage()
+        utilisateur = None
+        if partage is not None:
+            utilisateur = utilisateurs.lire(user_id, _revocation(partage, user_id))
+        if utilisateur is None:
+            try:
+                utilisateur = CustomUser.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except CustomUser.DoesNotExist:
+                raise AuthenticationFailed("Utilisateur introuvable.", code='user_not_found')
+            if partage is not None:
+                utilisateurs.ecrire(utilisateur)
+        if not utilisateur.is_active:
+            raise AuthenticationFailed("Compte désactivé.", code='user_inactive')
+        # Copie propre à la requête : une vue peut modifier request.user
+        return copy.copy(utilisateur)
@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from users.authentication import JWTAuthentificationLegere, jetons
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure le temps CPU de vérification d'un jeton d'accès par requête avec et sans "
+        "le cache des jetons vérifiés, et le temps économisé au débit donné (la base n'est pas lue)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requetes', type=int, default=20000, help="Requêtes simulées par mesure")
+        parser.add_argument('--jetons', type=int, default=100, help="Jetons distincts (clients connectés)")
+        parser.add_argument('--debit', type=int, default=200, help="Requêtes par seconde en production")
+
+    def handle(self, *args, **options):
+        bruts = [
+            str(CustomUser(id=i + 1, username=f'bench{i}', role='etudiant').get_token().access_token).encode()
+            for i in range(options['jetons'])
+        ]
+        requetes = [bruts[i % len(bruts)] for i in range(options['requetes'])]
+
+        sans = self._mesurer(requetes, actif=False)
+        jetons.vider()
+        avec = self._mesurer(requetes, actif=True)
+        statistiques = jetons.statistiques()
+        jetons.vider()
+
+        economie = sans - avec
+        self.stdout.write(f"Sans cache : {sans * 1e6:.1f} µs CPU par requête")
+        self.stdout.write(
+            f"Avec cache : {avec * 1e6:.1f} µs CPU par requête "
+            f"(taux de succès {statistiques['taux_succes']:.1%}, {statistiques['entrees']} jeton(s) en cache)"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Économie : {economie * 1e6:.1f} µs par requête, soit {economie * options['debit'] * 1000:.1f} ms "
+            f"de CPU par seconde à {options['debit']} requêtes/s"
+        ))
+
+    def _mesurer(self, requetes, actif):
+        authentification = JWTAuthentificationLegere()
+        with override_settings(AUTH_CACHE_JETONS=actif):
+            debut = time.process_time()
+            for brut in requetes:
+                authentification.get_validated_token(brut)
+            return (time.process_time() - debut) / len(requetes)
@@ -23,5 +23,7 @@ class CustomUser(AbstractUser):
         token = RefreshToken.for_user(self)
         token['role'] = self.role
         token['user_id'] = self.id
+        # Lu par JWTAuthentificationLegere pour éviter de charger l'utilisateur en lecture
+        token['username'] = self.username
         return token
 
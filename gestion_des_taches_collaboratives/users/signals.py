@@ -0,0 +1,31 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .authentication import CHAMPS_ACCES, revoquer
+from .models import CustomUser
+
+
+@receiver(pre_save, sender=CustomUser)
+def memoriser_acces(sender, instance, update_fields=None, **kwargs):
+    # Une connexion ne met à jour que last_login : inutile de relire l'utilisateur
+    instance._acces_precedent = None
+    if instance.pk and (update_fields is None or set(CHAMPS_ACCES) & set(update_fields)):
+        instance._acces_precedent = (
+            CustomUser.objects.filter(pk=instance.pk).values_list(*CHAMPS_ACCES).first()
+        )
+
+
+@receiver(post_save, sender=CustomUser)
+def revoquer_si_acces_modifie(sender, instance, created, **kwargs):
+    precedent = getattr(instance, '_acces_precedent', None)
+    if not created and precedent is not None and precedent != tuple(getattr(instance, champ) for champ in CHAMPS_ACCES):
+        # Après le commit : une requête concurrente ne doit pas remettre en cache l'ancien état
+        transaction.on_commit(partial(revoquer, [instance.pk]))
+
+
+@receiver(post_delete, sender=CustomUser)
+def revoquer_supprime(sender, instance, **kwargs):
+    transaction.on_commit(partial(revoquer, [instance.pk]))
@@ -0,0 +1,179 @@
+# users/tests/test_authentication.py
+import pytest
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.request import Request
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.admin import CustomUserAdmin
+from tasks.cache import cache_partage
+from users.authentication import CacheJetons, JWTAuthentificationLegere, jetons, revoquer, utilisateurs
+from users.models import CustomUser
+
+
+def _chargements(requetes):
+    # Lectures de l'utilisateur par son id (celle de l'authentification DRF standard)
+    return [q['sql'] for q in requetes.captured_queries if 'WHERE "users_customuser"."id" =' in q['sql']]
+
+
+@pytest.mark.django_db
+class TestJWTAuthentificationLegere:
+    @pytest.fixture(autouse=True)
+    def caches_vides(self):
+        cache.clear()
+        utilisateurs.vider()
+        jetons.vider()
+        yield
+        utilisateurs.vider()
+        jetons.vider()
+
+    @pytest.fixture
+    def user(self):
+        return CustomUser.objects.create_user(
+            username='etu1', password='p', email='etu1@test.com', nom='Un', prenom='Etu', role='etudiant'
+        )
+
+    @pytest.fixture
+    def api_client(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {user.get_token().access_token}')
+        return client
+
+    def _authentifier(self, user, methode='get'):
+        requete = getattr(APIRequestFactory(), methode)(
+            '/', HTTP_AUTHORIZATION=f'Bearer {user.get_token().access_token}'
+        )
+        return JWTAuthentificationLegere().authenticate(Request(requete))[0]
+
+    def test_lecture_sans_charger_l_utilisateur(self, api_client, user):
+        with CaptureQueriesContext(connection) as requetes:
+            response = api_client.get(reverse('tache-list'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _chargements(requetes) == []
+
+    def test_utilisateur_des_claims(self, user):
+        utilisateur = self._authentifier(user)
+
+        assert (utilisateur.pk, utilisateur.role, utilisateur.username) == (user.pk, 'etudiant', 'etu1')
+        # Les autres champs sont chargés à la demande
+        assert utilisateur.email == 'etu1@test.com'
+
+    def test_ecriture_utilisateur_en_cache(self, user):
+        with CaptureQueriesContext(connection) as requetes:
+            premier = self._authentifier(user, 'post')
+            second = self._authentifier(user, 'post')
+
+        assert len(_chargements(requetes)) == 1
+        assert premier == second and premier is not second
+
+    def test_desactivation(self, api_client, user, django_capture_on_commit_callbacks):
+        self._authentifier(user, 'post')
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save()
+
+        assert api_client.get(reverse('tache-list')).status_code == status.HTTP_401_UNAUTHORIZED
+        with pytest.raises(AuthenticationFailed):
+            self._authentifier(user, 'post')
+
+    def test_changement_de_role(self, user, django_capture_on_commit_callbacks):
+        jeton = user.get_token().access_token
+        with django_capture_on_commit_callbacks(execute=True):
+            user.role = 'enseignant'
+            user.save()
+
+        requete = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {jeton}')
+        assert JWTAuthentificationLegere().authenticate(Request(requete))[0].role == 'enseignant'
+
+    def test_connexion_ne_revoque_pas(self, user, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True) as rappels:
+            user.save(update_fields=['last_login'])
+        assert rappels == []
+
+    def test_action_admin(self, api_client, user, rf, django_capture_on_commit_callbacks):
+        admin = CustomUserAdmin(CustomUser, AdminSite())
+        admin.message_user = lambda *args, **kwargs: None
+        with django_capture_on_commit_callbacks(execute=True):
+            admin.deactivate_users(rf.post('/'), CustomUser.objects.filter(pk=user.pk))
+
+        assert api_client.get(reverse('tache-list')).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_profil_complet(self, api_client, user):
+        response = api_client.get(reverse('profile'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['email'] == 'etu1@test.com'
+
+    def test_revocation_par_un_autre_processus(self, api_client, user):
+        self._authentifier(user, 'post')
+        # Désactivation vue d'un autre worker : seule sa marque dans le cache partagé arrive ici
+        CustomUser.objects.filter(pk=user.pk).update(is_active=False)
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(utilisateurs, 'retirer', lambda user_ids: None)
+            revoquer([user.pk])
+
+        assert cache_partage().get(f'auth:revocation:{user.pk}') is not None
+        assert api_client.get(reverse('tache-list')).status_code == status.HTTP_401_UNAUTHORIZED
+        with pytest.raises(AuthenticationFailed):
+            self._authentifier(user, 'post')
+
+    def test_sans_cache_partage(self, api_client, user, settings):
+        # Une révocation ne serait pas vue des autres workers : l'utilisateur est lu en base
+        settings.CACHE_PARTAGE = None
+        with CaptureQueriesContext(connection) as requetes:
+            assert self._authentifier(user).is_active
+            self._authentifier(user, 'post')
+            self._authentifier(user, 'post')
+        assert len(_chargements(requetes)) == 3
+
+        CustomUser.objects.filter(pk=user.pk).update(is_active=False)
+        assert api_client.get(reverse('tache-list')).status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestCacheJetons:
+    @pytest.fixture(autouse=True)
+    def cache_vide(self):
+        jetons.vider()
+        yield
+        jetons.vider()
+
+    def _brut(self, user_id=1):
+        return str(CustomUser(id=user_id, username='etu', role='etudiant').get_token().access_token).encode()
+
+    def test_jeton_verifie_une_fois(self):
+        authentification = JWTAuthentificationLegere()
+        brut = self._brut()
+
+        assert authentification.get_validated_token(brut) is authentification.get_validated_token(brut)
+        assert jetons.statistiques() == {'entrees': 1, 'succes': 1, 'echecs': 1, 'taux_succes': 0.5}
+
+    def test_desactive(self, settings):
+        settings.AUTH_CACHE_JETONS = False
+        authentification = JWTAuthentificationLegere()
+        brut = self._brut()
+
+        assert authentification.get_validated_token(brut) is not authentification.get_validated_token(brut)
+        assert jetons.statistiques()['entrees'] == 0
+
+    def test_jeton_invalide_non_garde(self):
+        with pytest.raises(InvalidToken):
+            JWTAuthentificationLegere().get_validated_token(self._brut()[:-2])
+        assert jetons.statistiques()['entrees'] == 0
+
+    def test_expiration_et_eviction(self):
+        cache_jetons = CacheJetons(taille=2)
+        expire = AccessToken(self._brut())
+        expire['exp'] = 0
+        cache_jetons.ecrire(b'expire', expire)
+        assert cache_jetons.lire(b'expire') is None
+
+        for cle in (b'a', b'b', b'c'):
+            cache_jetons.ecrire(cle, AccessToken(self._brut()))
+        assert cache_jetons.lire(b'a') is None
+        assert cache_jetons.lire(b'c') is not None
@@ -8,6 +8,10 @@ from rest_framework import generics, permissions
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from tasks.cache import VERSION_UTILISATEURS, VersionETagMixin
+from tasks.repliques import LectureRepliqueMixin
+from tasks.transactions import LectureAutocommitMixin
+
 from .forms import CustomUserCreationForm, CustomUserUpdateForm
 from .models import CustomUser
 from .serializers import (
@@ -63,15 +67,15 @@ class RegisterView(generics.CreateAPIView):
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
 
-class ProfileView(generics.RetrieveUpdateAPIView):
+class ProfileView(LectureAutocommitMixin, generics.RetrieveUpdateAPIView):
     """Récupérer et modifier son propre profil"""
     queryset = CustomUser.objects.all()
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated]
 
     def get_object(self):
-        """Retourne uniquement l'utilisateur connecté"""
-        return self.request.user
+        """Retourne uniquement l'utilisateur connecté, rechargé : en lecture request.user ne porte que les claims du jeton"""
+        return CustomUser.objects.get(pk=self.request.user.pk)
 
     @profile_get_swagger
     def get(self, request, *args, **kwargs):
@@ -81,17 +85,20 @@ class ProfileView(generics.RetrieveUpdateAPIView):
     def put(self, request, *args, **kwargs):
         return super().put(request, *args, **kwargs)
 
-class UserListView(generics.ListAPIView):
+class UserListView(LectureAutocommitMixin, LectureRepliqueMixin, VersionETagMixin, generics.ListAPIView):
     # Liste des utilisateurs (nécessite une authentification)
     queryset = CustomUser.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_etag_versions(self):
+        return [VERSION_UTILISATEURS]
+
     @user_list_swagger
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
-class UserDetailView(generics.RetrieveUpdateAPIView):
+class UserDetailView(LectureAutocommitMixin, generics.RetrieveUpdateAPIView):
     queryset = CustomUser.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]